@@ -0,0 +1,149 @@
+import copy
+import threading
+import time
+import uuid
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.utils.functional import cached_property
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+from apis.models import CustomUser
+from apis.services.token_blacklist import token_blacklist_filter
+
+GENERATION_CACHE_KEY = "auth_user:generation"
+
+
+def _version_key(user_id):
+    return f"auth_user:{user_id}:version"
+
+
+def _inactive_key(user_id):
+    return f"auth_user:{user_id}:inactive"
+
+
+class AuthenticatedUserCache:
+    """
+    Short-lived in-process cache of the CustomUser rows behind access tokens.
+
+    Mirrors ActiveEmailProviderCache: each entry remembers the version tokens
+    it was loaded under, and saving or deleting a user bumps that user's
+    token in the shared Django cache (see apis/signals.py), so every worker
+    drops its copy on the next request. AUTH_USER_CACHE_TTL bounds staleness
+    for writes that skip signals, such as queryset.update().
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = {}
+
+    @staticmethod
+    def _current_version(user_id):
+        keys = [GENERATION_CACHE_KEY, _version_key(user_id)]
+        versions = cache.get_many(keys)
+        return tuple(versions.get(key) for key in keys)
+
+    def get(self, user_id):
+        version = self._current_version(user_id)
+        entry = self._entries.get(user_id)
+        if entry is not None:
+            user, cached_version, loaded_at = entry
+            if cached_version == version and time.monotonic() - loaded_at < settings.AUTH_USER_CACHE_TTL:
+                # Views may modify request.user; keep the cached instance pristine
+                return copy.copy(user)
+
+        user = CustomUser.objects.filter(**{api_settings.USER_ID_FIELD: user_id}).first()
+        with self._lock:
+            if len(self._entries) >= settings.AUTH_USER_CACHE_MAX_SIZE:
+                self._entries.clear()
+            self._entries[user_id] = (user, version, time.monotonic())
+        return copy.copy(user)
+
+    def invalidate(self, user_id, active=True):
+        """
+        Drop `user_id` from every worker's cache. Call once the write is
+        committed, or a concurrent request could cache the old row again.
+        """
+        self._entries.pop(user_id, None)
+        cache.set(_version_key(user_id), uuid.uuid4().hex, None)
+        if active:
+            cache.delete(_inactive_key(user_id))
+        else:
+            # Stateless authentication can't see the row; outlive any access token
+            cache.set(
+                _inactive_key(user_id),
+                True,
+                int(api_settings.ACCESS_TOKEN_LIFETIME.total_seconds()),
+            )
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+        cache.set(GENERATION_CACHE_KEY, uuid.uuid4().hex, None)
+
+
+authenticated_user_cache = AuthenticatedUserCache()
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """JWTAuthentication that resolves the token's user through authenticated_user_cache."""
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken("Token contained no recognizable user identification")
+
+        user = authenticated_user_cache.get(user_id)
+        if user is None:
+            raise AuthenticationFailed("User not found", code="user_not_found")
+        if not user.is_active:
+            raise AuthenticationFailed("User is inactive", code="user_inactive")
+        return user
+
+
+class ClaimsUser(TokenUser):
+    """TokenUser that also exposes the role claim added by CustomTokenObtainPairSerializer."""
+
+    @cached_property
+    def role(self):
+        return self.token.get("role", "user")
+
+
+class StatelessJWTAuthentication(CachedJWTAuthentication):
+    """
+    Builds request.user from the token claims (id, role, is_staff) without
+    loading the user row. Only for read-only endpoints that need nothing but
+    those fields; filter with `user_id=request.user.id`, since ClaimsUser is
+    not a model instance.
+
+    Deactivated users are caught by a flag in the default cache. A
+    process-local cache (LocMemCache) can't carry that flag to other workers,
+    so on such a backend this falls back to CachedJWTAuthentication.
+    """
+
+    def get_user(self, validated_token):
+        if isinstance(caches["default"], (LocMemCache, DummyCache)):
+            return super().get_user(validated_token)
+        if api_settings.USER_ID_CLAIM not in validated_token:
+            raise InvalidToken("Token contained no recognizable user identification")
+
+        user = ClaimsUser(validated_token)
+        if cache.get(_inactive_key(user.id)):
+            raise AuthenticationFailed("User is inactive", code="user_inactive")
+        return user
+
+
+class BlacklistFilteredRefreshToken(RefreshToken):
+    """RefreshToken that skips the blacklist query when the Bloom filter rules the JTI out."""
+
+    def check_blacklist(self):
+        if token_blacklist_filter.enabled and not token_blacklist_filter.might_contain(
+            self.payload[api_settings.JTI_CLAIM]
+        ):
+            return
+        super().check_blacklist()
@@ -1,30 +1,57 @@
+from asgiref.sync import sync_to_async
 from django.contrib.auth.backends import ModelBackend
-from django.db.models import Q
-from .models import CustomUser
+from .models import CustomUser, LoginIdentifier
+from .services.password_hashing import acheck_password, amake_password
 
 class EmailPhoneUsernameBackend(ModelBackend):
     """
     Custom authentication backend that allows users to log in with 
     username, email, or phone number
     """
+    def get_login_user(self, login):
+        # One probe on the normalized identifier index
+        matches = list(
+            LoginIdentifier.objects.filter(LoginIdentifier.matching(login))
+            .select_related('user')
+        )
+        users = {match.user_id: match.user for match in matches}
+        if len(users) == 1:
+            return next(iter(users.values()))
+        # Case variants of different users: only an exact match is safe.
+        # No match is final: every user is indexed by the post_save signal, and
+        # users from before the index by `manage.py rebuild_login_identifiers`.
+        exact = [
+            user for user in users.values()
+            if login in (user.username, user.email, user.phone_number)
+        ]
+        return exact[0] if len(exact) == 1 else None
+
     def authenticate(self, request, username=None, password=None, **kwargs):
         if username is None or password is None:
             return None
         
-        try:
-            # Try to fetch the user by searching username, email, or phone
-            user = CustomUser.objects.get(
-                Q(username=username) | Q(email=username) | Q(phone_number=username)
-            )
-        except CustomUser.DoesNotExist:
+        user = self.get_login_user(username)
+        if user is None:
             # Run the default password hasher once to reduce timing attacks
             CustomUser().set_password(password)
             return None
-        except CustomUser.MultipleObjectsReturned:
-            # This shouldn't happen due to unique constraints
-            return None
         
         if user.check_password(password) and self.user_can_authenticate(user):
             return user
         
-        return None
\ No newline at end of file
+        return None
+
+    async def aauthenticate(self, request, username=None, password=None, **kwargs):
+        # Same checks as authenticate(), with hashing done in the process pool
+        if username is None or password is None:
+            return None
+
+        user = await sync_to_async(self.get_login_user)(username)
+        if user is None:
+            await amake_password(password)
+            return None
+
+        if await acheck_password(user, password) and self.user_can_authenticate(user):
+            return user
+
+        return None
@@ -0,0 +1,124 @@
+from django.db.models import Subquery
+from django.utils.dateparse import parse_date
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend
+from apis.models import JobApplication, JobApplicationStatus
+
+
+def _ids(name, value):
+    try:
+        return [int(part) for part in value.split(",") if part.strip()]
+    except ValueError:
+        raise ValidationError({name: ["Expected comma-separated ids."]})
+
+
+def _date(name, value):
+    try:
+        parsed = parse_date(value)
+    except ValueError:
+        parsed = None
+    if parsed is None:
+        raise ValidationError({name: ["Expected a date (YYYY-MM-DD)."]})
+    return parsed
+
+
+def _int(name, value):
+    try:
+        return int(value)
+    except ValueError:
+        raise ValidationError({name: ["Expected a whole number."]})
+
+
+def _choices(name, value, allowed):
+    values = [part.strip() for part in value.split(",") if part.strip()]
+    unknown = sorted(set(values) - set(allowed))
+    if unknown:
+        raise ValidationError({name: [f"Unknown value(s): {', '.join(unknown)}. Expected {', '.join(allowed)}."]})
+    return values
+
+
+class JobApplicationFilterBackend(BaseFilterBackend):
+    """
+    Query parameters that filter and order the job application list.
+
+    Every filter is backed by a composite index on JobApplication that
+    leads with `user`, since non-staff listings are always scoped to the
+    requesting user (see JobApplication.Meta.indexes, and
+    `manage.py check_job_application_query_plans`). Ordering is limited to
+    non-null indexed fields so cursor pagination can page through it;
+    `id` breaks ties.
+    """
+    ordering_param = "ordering"
+    ordering_fields = ("created_at", "updated_at", "company_name", "position")
+    default_ordering = ("-created_at", "id")
+
+    # name: (type, description) for the schema
+    parameters = {
+        "status": ("string", "Comma-separated status ids"),
+        "category": ("string", "Comma-separated status categories (open, applied, interview, offer, rejected)"),
+        "application_through": ("string", "Comma-separated channels (email, website, linkedin, referral)"),
+        "applied_after": ("date", "Applied on or after this date"),
+        "applied_before": ("date", "Applied on or before this date"),
+        "closed_after": ("date", "Job closed on or after this date"),
+        "closed_before": ("date", "Job closed on or before this date"),
+        "min_experience": ("integer", "Required experience of at least this many years"),
+        "max_experience": ("integer", "Required experience of at most this many years"),
+        "skills": ("string", "Comma-separated skill ids; matches applications requiring any of them"),
+        "ordering": ("string", "One of created_at, updated_at, company_name, position; prefix with - for descending"),
+    }
+
+    def filter_queryset(self, request, queryset, view):
+        params = request.query_params
+
+        if params.get("status"):
+            queryset = queryset.filter(status_id__in=_ids("status", params["status"]))
+        if params.get("category"):
+            categories = _choices("category", params["category"], dict(JobApplicationStatus.CATEGORY_CHOICES))
+            # Resolved to status ids so the (user, status) index applies instead of a join
+            queryset = queryset.filter(
+                status_id__in=Subquery(JobApplicationStatus.objects.filter(category__in=categories).values("id"))
+            )
+        if params.get("application_through"):
+            queryset = queryset.filter(application_through__in=_choices(
+                "application_through", params["application_through"], dict(JobApplication.APPLICATION_THROUGH_CHOICES)
+            ))
+
+        ranges = {
+            "applied_after": ("applied_date__gte", _date),
+            "applied_before": ("applied_date__lte", _date),
+            "closed_after": ("job_closed_date__gte", _date),
+            "closed_before": ("job_closed_date__lte", _date),
+            "min_experience": ("required_experience__gte", _int),
+            "max_experience": ("required_experience__lte", _int),
+        }
+        for name, (lookup, parse) in ranges.items():
+            if params.get(name):
+                queryset = queryset.filter(**{lookup: parse(name, params[name])})
+
+        if params.get("skills"):
+            required = JobApplication.skills.through.objects.filter(jobskills_id__in=_ids("skills", params["skills"]))
+            # A subquery rather than a join, so no DISTINCT is needed
+            queryset = queryset.filter(id__in=Subquery(required.values("jobapplication_id")))
+
+        return queryset.order_by(*self.get_ordering(request, queryset, view))
+
+    def get_ordering(self, request, queryset, view):
+        # Also read by CursorPagination, which pages on the same ordering
+        value = request.query_params.get(self.ordering_param, "").strip()
+        if not value:
+            return self.default_ordering
+        if value.lstrip("-") not in self.ordering_fields:
+            raise ValidationError({self.ordering_param: [f"Expected one of {', '.join(self.ordering_fields)}."]})
+        return (value, "id")
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": name,
+                "required": False,
+                "in": "query",
+                "description": description,
+                "schema": {"type": "string", "format": "date"} if kind == "date" else {"type": kind},
+            }
+            for name, (kind, description) in self.parameters.items()
+        ]
@@ -0,0 +1,60 @@
+from django.conf import settings
+from django.contrib.auth.hashers import (
+    Argon2PasswordHasher,
+    PBKDF2PasswordHasher,
+    ScryptPasswordHasher,
+)
+
+
+def _setting(name, default):
+    # Unset (None) parameters fall back to Django's own defaults
+    value = getattr(settings, name, None)
+    return default if value is None else value
+
+
+class TunablePBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """PBKDF2-SHA256 with the iteration count taken from PASSWORD_PBKDF2_ITERATIONS."""
+
+    @property
+    def iterations(self):
+        return _setting("PASSWORD_PBKDF2_ITERATIONS", PBKDF2PasswordHasher.iterations)
+
+
+class TunableScryptPasswordHasher(ScryptPasswordHasher):
+    """scrypt with work factor, block size and parallelism taken from PASSWORD_SCRYPT_* settings."""
+
+    @property
+    def work_factor(self):
+        return _setting("PASSWORD_SCRYPT_WORK_FACTOR", ScryptPasswordHasher.work_factor)
+
+    @property
+    def block_size(self):
+        return _setting("PASSWORD_SCRYPT_BLOCK_SIZE", ScryptPasswordHasher.block_size)
+
+    @property
+    def parallelism(self):
+        return _setting("PASSWORD_SCRYPT_PARALLELISM", ScryptPasswordHasher.parallelism)
+
+    @property
+    def maxmem(self):
+        # scrypt needs 128 * N * r bytes; leave headroom above the default cap
+        return max(ScryptPasswordHasher.maxmem, 2 * 128 * self.work_factor * self.block_size)
+
+
+class TunableArgon2PasswordHasher(Argon2PasswordHasher):
+    """
+    Argon2id with costs taken from PASSWORD_ARGON2_* settings. Requires the
+    optional argon2-cffi package (`pip install django[argon2]`).
+    """
+
+    @property
+    def time_cost(self):
+        return _setting("PASSWORD_ARGON2_TIME_COST", Argon2PasswordHasher.time_cost)
+
+    @property
+    def memory_cost(self):
+        return _setting("PASSWORD_ARGON2_MEMORY_COST", Argon2PasswordHasher.memory_cost)
+
+    @property
+    def parallelism(self):
+        return _setting("PASSWORD_ARGON2_PARALLELISM", Argon2PasswordHasher.parallelism)
@@ -0,0 +1,79 @@
+import json
+import random
+import time
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from apis.models import CustomUser, JobApplicationStatus, JobSkills
+from apis.serializers import CustomTokenObtainPairSerializer
+
+
+class Command(BaseCommand):
+    help = (
+        "Create, update and delete N job applications through the bulk endpoint, end to end, "
+        "and compare with one POST per application"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--username", required=True, help="User whose token is sent")
+        parser.add_argument("--rows", type=int, default=10_000, help="Applications per bulk request")
+        parser.add_argument("--single", type=int, default=200, help="Single POSTs timed for comparison")
+
+    def handle(self, *args, **options):
+        try:
+            user = CustomUser.objects.get(username=options["username"])
+        except CustomUser.DoesNotExist:
+            raise CommandError(f"No user named {options['username']!r}")
+        status_ids = list(JobApplicationStatus.objects.values_list("id", flat=True))
+        skill_ids = list(JobSkills.objects.values_list("id", flat=True))
+        if not status_ids or len(skill_ids) < 8:
+            raise CommandError("Needs at least one job application status and eight job skills")
+
+        token = str(CustomTokenObtainPairSerializer.get_token(user).access_token)
+        host = next((h.lstrip(".") for h in settings.ALLOWED_HOSTS if h and h != "*"), "localhost")
+        client = Client(HTTP_AUTHORIZATION=f"Bearer {token}", HTTP_HOST=host)
+        rng = random.Random(0)
+        rows = [
+            {
+                "position": f"Engineer {i}",
+                "company_name": f"Company {i}",
+                "location": rng.choice(["Berlin", "London", "Remote"]),
+                "status": rng.choice(status_ids),
+                "skills": rng.sample(skill_ids, 5),
+                "preferred_skills": rng.sample(skill_ids, 3),
+                "application_through": "website",
+            }
+            for i in range(max(options["rows"], options["single"]))
+        ]
+
+        single_ids = []
+        with CaptureQueriesContext(connection) as queries:
+            started = time.perf_counter()
+            for row in rows[:options["single"]]:
+                response = client.post("/api/job-applications/", json.dumps(row), content_type="application/json")
+                if response.status_code != 201:
+                    raise CommandError(f"Single POST failed: HTTP {response.status_code} {response.content[:200]!r}")
+                single_ids.append(response.json()["id"])
+            per_row = (time.perf_counter() - started) / max(options["single"], 1)
+        self.stdout.write(
+            f"  single POST: {per_row * 1000:.2f} ms and {len(queries) / max(options['single'], 1):.1f} queries per row "
+            f"(~{per_row * options['rows']:.1f}s for {options['rows']} rows)"
+        )
+
+        created = self._time(client, "bulk create", "post", rows[:options["rows"]], options["rows"])
+        self._time(client, "bulk update", "patch", [{"id": pk, "location": "Remote"} for pk in created], len(created))
+        self._time(client, "bulk delete", "delete", {"ids": created + single_ids}, len(created) + len(single_ids))
+
+    def _time(self, client, label, method, payload, rows):
+        with CaptureQueriesContext(connection) as queries:
+            started = time.perf_counter()
+            response = getattr(client, method)(
+                "/api/job-applications/bulk/", json.dumps(payload), content_type="application/json"
+            )
+            elapsed = time.perf_counter() - started
+        if response.status_code >= 400:
+            raise CommandError(f"{label} failed: HTTP {response.status_code} {response.content[:500]!r}")
+        self.stdout.write(f"  {label}: {elapsed:.2f}s for {rows} rows, {len(queries)} queries")
+        return response.json()["ids"]
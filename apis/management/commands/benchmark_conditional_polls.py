@@ -0,0 +1,57 @@
+import time
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from apis.models import CustomUser
+from apis.serializers import CustomTokenObtainPairSerializer
+
+DEFAULT_PATHS = ["/api/job-applications/", "/api/learning-plans/", "/api/user-skills/"]
+
+
+class Command(BaseCommand):
+    help = (
+        "Poll list endpoints as a dashboard would and compare CPU time and queries "
+        "per poll for full responses versus If-None-Match revalidation (304)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--username", required=True, help="User whose token is sent")
+        parser.add_argument("--polls", type=int, default=200, help="Polls timed per mode")
+        parser.add_argument("--path", action="append", help="Endpoint to poll (repeatable)")
+
+    def handle(self, *args, **options):
+        try:
+            user = CustomUser.objects.get(username=options["username"])
+        except CustomUser.DoesNotExist:
+            raise CommandError(f"No user named {options['username']!r}")
+
+        token = str(CustomTokenObtainPairSerializer.get_token(user).access_token)
+        host = next((h.lstrip(".") for h in settings.ALLOWED_HOSTS if h and h != "*"), "localhost")
+        client = Client(HTTP_AUTHORIZATION=f"Bearer {token}", HTTP_HOST=host)
+
+        for path in options["path"] or DEFAULT_PATHS:
+            first = client.get(path)
+            etag = first.get("ETag")
+            if first.status_code != 200 or not etag:
+                self.stderr.write(self.style.ERROR(f"{path}: HTTP {first.status_code}, ETag {etag!r}; skipped"))
+                continue
+
+            self.stdout.write(self.style.MIGRATE_HEADING(f"{path} ({len(first.content)} bytes)"))
+            for label, headers in (("full response", {}), ("If-None-Match", {"HTTP_IF_NONE_MATCH": etag})):
+                cpu, wall, queries, status = self._poll(client, path, headers, options["polls"])
+                self.stdout.write(
+                    f"  {label:>14}: HTTP {status}  {cpu * 1000:.2f} ms CPU  "
+                    f"{wall * 1000:.2f} ms wall  {queries:.1f} queries per poll"
+                )
+
+    @staticmethod
+    def _poll(client, path, headers, polls):
+        with CaptureQueriesContext(connection) as captured:
+            cpu_started, wall_started = time.process_time(), time.perf_counter()
+            for _ in range(polls):
+                response = client.get(path, **headers)
+            cpu = time.process_time() - cpu_started
+            wall = time.perf_counter() - wall_started
+        return cpu / polls, wall / polls, len(captured) / polls, response.status_code
@@ -0,0 +1,88 @@
+import logging
+import time
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.template import Context, Engine
+from django.test.utils import CaptureQueriesContext, override_settings
+from apis.models import EmailProviderSetting
+from apis.services.email_provider_cache import active_email_provider_cache
+from apis.services.email_service import EmailService
+from apis.services.email_templates import EMAIL_TEMPLATES_DIR, precompile_email_templates, render_email_template
+
+SUBJECT = "Benchmark"
+
+
+class Command(BaseCommand):
+    help = (
+        "Time email template rendering through an uncached loader and the cached email engine, "
+        "then N recipients sent one by one against the bulk email API"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--renders", type=int, default=5000, help="Renders timed per engine")
+        parser.add_argument("--recipients", type=int, default=1000, help="Recipients per send mode")
+        parser.add_argument("--template", default="password_reset.html", help="Template under templates/emails/")
+
+    def handle(self, *args, **options):
+        template_name = options["template"]
+        precompile_email_templates()
+        context = {"reset_url": "https://bench.invalid/reset/token", "user": None}
+
+        self.stdout.write(self.style.MIGRATE_HEADING(f"Rendering {template_name} {options['renders']} times"))
+        # Reads and parses the file on every render, as an uncached loader does
+        uncached = Engine(dirs=[str(EMAIL_TEMPLATES_DIR)], loaders=["django.template.loaders.filesystem.Loader"])
+        engines = (
+            ("uncached loader", lambda: uncached.get_template(f"emails/{template_name}").render(Context(context))),
+            ("email engine", lambda: render_email_template(template_name, context)),
+        )
+        for label, render in engines:
+            started = time.perf_counter()
+            for _ in range(options["renders"]):
+                render()
+            elapsed = time.perf_counter() - started
+            self.stdout.write(f"  {label:>20}: {options['renders'] / elapsed:10.0f} renders/s")
+
+        recipients = [f"user{i}@bench.invalid" for i in range(options["recipients"])]
+        self.stdout.write(self.style.MIGRATE_HEADING(
+            f"Sending to {len(recipients)} recipients (locmem backend, nothing leaves the process)"
+        ))
+        modes = (
+            ("one by one", lambda: [
+                EmailService.send_email_with_template(template_name, context, SUBJECT, [to]) for to in recipients
+            ]),
+            ("bulk, shared context", lambda: EmailService.send_bulk_email_with_template(
+                template_name, SUBJECT, [{"to": [to]} for to in recipients], context
+            )),
+            ("bulk, own contexts", lambda: EmailService.send_bulk_email_with_template(
+                template_name, SUBJECT,
+                [{"to": [to], "context": {"reset_url": f"https://bench.invalid/reset/{to}"}} for to in recipients],
+                context,
+            )),
+        )
+        color_logger = logging.getLogger("color_logger")
+        level = color_logger.level
+        # One INFO line per sent email would swamp the output
+        color_logger.setLevel(logging.WARNING)
+        try:
+            with override_settings(EMAIL_SMTP_BACKEND="django.core.mail.backends.locmem.EmailBackend"):
+                for label, send in modes:
+                    self._time_send(label, send, len(recipients))
+        finally:
+            color_logger.setLevel(level)
+            active_email_provider_cache.invalidate()
+
+    def _time_send(self, label, send, count):
+        # Rolled back afterwards: neither the provider nor the EmailLog rows are kept
+        with transaction.atomic():
+            EmailProviderSetting.objects.create(
+                name="benchmark", provider_type="smtp", host="localhost", port=25, from_email="bench@bench.invalid"
+            )
+            active_email_provider_cache.invalidate()
+            with CaptureQueriesContext(connection) as queries:
+                started = time.perf_counter()
+                send()
+                elapsed = time.perf_counter() - started
+            transaction.set_rollback(True)
+        self.stdout.write(
+            f"  {label:>20}: {count / elapsed:8.0f} emails/s ({elapsed:.2f}s, {len(queries)} queries)"
+        )
@@ -0,0 +1,162 @@
+import asyncio
+import json
+import resource
+import sys
+import time
+from django.apps import apps
+from django.conf import settings
+from django.core import serializers
+from django.core.asgi import get_asgi_application
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.urls import reverse
+from apis.models import CustomUser, JobApplication, JobApplicationStat, JobApplicationStatus
+from apis.serializers import CustomTokenObtainPairSerializer
+from apis.services import response_cache
+from apis.signals import job_application_signals_muted
+
+SEED_URL = "https://bench.invalid/export/"
+
+
+def _peak_rss_mb():
+    # ru_maxrss is KiB on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _legacy_export():
+    """What ExportAllTablesView built before streaming: every table in memory, three times over."""
+    data = {}
+    for model in apps.get_models():
+        data[model._meta.label] = json.loads(serializers.serialize("json", model.objects.all()))
+    return json.dumps(data, indent=4)
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed N job applications, then stream the full-database export through the ASGI app as "
+        "daphne serves it, reporting time to first byte, total time and peak RSS"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--username", required=True, help="Admin whose token is sent; the rows are seeded for them")
+        parser.add_argument("--rows", type=int, default=1_000_000, help="Applications to seed")
+        parser.add_argument("--batch-size", type=int, default=5000, help="Rows per bulk insert while seeding")
+        parser.add_argument(
+            "--legacy", action="store_true",
+            help="Also build the export in memory the way the view did before streaming (needs a lot of RAM)",
+        )
+        parser.add_argument("--cleanup", action="store_true", help="Delete the seeded applications and exit")
+
+    def handle(self, *args, **options):
+        try:
+            user = CustomUser.objects.get(username=options["username"])
+        except CustomUser.DoesNotExist:
+            raise CommandError(f"No user named {options['username']!r}")
+
+        seeded = JobApplication.objects.filter(user=user, application_url__startswith=SEED_URL)
+        if options["cleanup"]:
+            deleted = 0
+            while ids := list(seeded.values_list("id", flat=True)[:options["batch_size"]]):
+                # _refresh() recounts the stats once at the end
+                with transaction.atomic(), job_application_signals_muted():
+                    deleted += JobApplication.objects.filter(id__in=ids).delete()[1].get("apis.JobApplication", 0)
+            self._refresh(user)
+            self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} seeded applications"))
+            return
+        if not user.is_staff:
+            raise CommandError("The export is admin only; pass a staff user")
+
+        self._seed(user, options["rows"] - seeded.count(), options["batch_size"])
+        token = str(CustomTokenObtainPairSerializer.get_token(user).access_token)
+        host = next((h.lstrip(".") for h in settings.ALLOWED_HOSTS if h and h != "*"), "localhost")
+
+        # Before anything large is loaded, so the first mode's peak is its own
+        baseline = _peak_rss_mb()
+        self.stdout.write(self.style.MIGRATE_HEADING(
+            f"Exporting {JobApplication.objects.count()} applications (baseline peak RSS {baseline:.0f} MB)"
+        ))
+        status, size, first_byte, elapsed = asyncio.run(self._stream(reverse("export_all_tables"), token, host))
+        if status != 200:
+            raise CommandError(f"Export failed: HTTP {status}")
+        self.stdout.write(
+            f"  streaming: first byte {first_byte * 1000:.0f} ms, {size / 1e6:.1f} MB in {elapsed:.1f}s, "
+            f"peak RSS {_peak_rss_mb():.0f} MB"
+        )
+
+        if options["legacy"]:
+            started = time.perf_counter()
+            size = len(_legacy_export().encode())
+            elapsed = time.perf_counter() - started
+            # Nothing could be sent before the whole document was built
+            self.stdout.write(
+                f"     legacy: first byte {elapsed * 1000:.0f} ms, {size / 1e6:.1f} MB in {elapsed:.1f}s, "
+                f"peak RSS {_peak_rss_mb():.0f} MB"
+            )
+
+    @staticmethod
+    async def _stream(path, token, host):
+        """Drive the ASGI app like daphne would; returns (status, bytes, seconds to first byte, total seconds)."""
+        app = get_asgi_application()
+        scope = {
+            "type": "http", "method": "GET", "path": path, "query_string": b"", "http_version": "1.1",
+            "scheme": "http", "server": (host, 80), "client": ("127.0.0.1", 0),
+            "headers": [(b"authorization", f"Bearer {token}".encode()), (b"host", host.encode())],
+        }
+        state = {"status": None, "bytes": 0, "first_byte": None}
+        request_sent = False
+
+        async def receive():
+            nonlocal request_sent
+            if not request_sent:
+                request_sent = True
+                return {"type": "http.request", "body": b"", "more_body": False}
+            # The client never disconnects
+            await asyncio.Event().wait()
+
+        async def send(message):
+            if message["type"] == "http.response.start":
+                state["status"] = message["status"]
+            elif message["type"] == "http.response.body" and message.get("body"):
+                if state["first_byte"] is None:
+                    state["first_byte"] = time.perf_counter() - started
+                state["bytes"] += len(message["body"])
+
+        started = time.perf_counter()
+        await app(scope, receive, send)
+        return state["status"], state["bytes"], state["first_byte"] or 0.0, time.perf_counter() - started
+
+    def _seed(self, user, missing, batch_size):
+        if missing <= 0:
+            return
+        status = JobApplicationStatus.objects.order_by("id").first() or JobApplicationStatus.objects.create(
+            name="Applied", category="applied", color="#2563eb"
+        )
+        start = JobApplication.objects.filter(user=user, application_url__startswith=SEED_URL).count()
+        self.stdout.write(f"Seeding {missing} applications...")
+        done = 0
+        while done < missing:
+            size = min(batch_size, missing - done)
+            JobApplication.objects.bulk_create(
+                JobApplication(
+                    user=user,
+                    status=status,
+                    position="Engineer",
+                    company_name=f"Company{start + done + i}",
+                    location="Remote",
+                    description="Seeded for the export benchmark",
+                    application_through="website",
+                    application_url=f"{SEED_URL}{start + done + i}",
+                )
+                for i in range(size)
+            )
+            done += size
+            if done % (batch_size * 20) == 0 or done == missing:
+                self.stdout.write(f"  {done}/{missing}")
+        self._refresh(user)
+
+    @staticmethod
+    def _refresh(user):
+        # Bulk writes bypass the counters and list ETags
+        JobApplicationStat.rebuild()
+        response_cache.invalidate_for_users(JobApplication, [user.id])
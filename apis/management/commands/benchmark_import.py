@@ -0,0 +1,167 @@
+import json
+import random
+import resource
+import sys
+import tempfile
+import time
+from django.apps import apps
+from django.core import serializers
+from django.core.management.base import BaseCommand, CommandError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.db.models import Max
+from django.utils import timezone
+from apis.models import (
+    CustomUser, JobApplication, JobApplicationStat, JobApplicationStatus, JobSkillDemand, JobSkills,
+)
+from apis.services import response_cache
+from apis.services.data_transfer import import_json_stream
+from apis.signals import job_application_signals_muted
+
+SEED_URL = "https://bench.invalid/import/"
+SEED_SKILL_PREFIX = "bench-import-skill-"
+
+
+def _peak_rss_mb():
+    # ru_maxrss is KiB on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _legacy_import(fileobj):
+    """What ImportJSONView did before streaming: the whole file in memory, then one save per object."""
+    with transaction.atomic():
+        for model_label, data_json in json.load(fileobj).items():
+            app_label, model_name = model_label.split(".")
+            try:
+                apps.get_model(app_label=app_label, model_name=model_name)
+            except LookupError:
+                continue
+            for obj in serializers.deserialize("json", json.dumps(data_json)):
+                obj.save()
+
+
+class Command(BaseCommand):
+    help = (
+        "Write an export file of N job applications with their skills, then time the streaming import "
+        "of it in one transaction, again over the rows it just wrote, and batch by batch"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--username", required=True, help="User the generated applications belong to")
+        parser.add_argument("--rows", type=int, default=100_000, help="Applications in the generated file")
+        parser.add_argument("--skills", type=int, default=3, help="Required and preferred skills per application")
+        parser.add_argument(
+            "--batch-size", type=int, help="Rows per upsert batch (default DATA_IMPORT_BATCH_SIZE)"
+        )
+        parser.add_argument(
+            "--legacy", action="store_true",
+            help="Also import the file the way the view did before streaming (slow, needs a lot of RAM)",
+        )
+        parser.add_argument("--cleanup", action="store_true", help="Delete the imported rows and exit")
+
+    def handle(self, *args, **options):
+        try:
+            user = CustomUser.objects.get(username=options["username"])
+        except CustomUser.DoesNotExist:
+            raise CommandError(f"No user named {options['username']!r}")
+
+        imported = JobApplication.objects.filter(user=user, application_url__startswith=SEED_URL)
+        if options["cleanup"]:
+            deleted = self._delete(imported)
+            JobSkills.objects.filter(name__startswith=SEED_SKILL_PREFIX).delete()
+            self._refresh(user)
+            self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} imported applications"))
+            return
+        # Left over from an interrupted run; the file reuses their pks
+        self._delete(imported)
+
+        with tempfile.TemporaryFile() as export:
+            self._write_file(export, user, options["rows"], options["skills"])
+            self.stdout.write(self.style.MIGRATE_HEADING(
+                f"Importing {options['rows']} applications ({export.tell() / 1e6:.1f} MB) "
+                f"(baseline peak RSS {_peak_rss_mb():.0f} MB)"
+            ))
+            batch_size = options["batch_size"]
+            modes = [
+                ("atomic, new rows", lambda: import_json_stream(export, batch_size, atomic=True), False),
+                ("atomic, existing rows", lambda: import_json_stream(export, batch_size, atomic=True), True),
+                ("per batch, new rows", lambda: import_json_stream(export, batch_size, atomic=False), False),
+            ]
+            if options["legacy"]:
+                # Last, so the peak RSS printed before it is the streaming import's own
+                modes.append(("legacy", lambda: _legacy_import(export), False))
+
+            for label, run, keep_rows in modes:
+                if not keep_rows:
+                    self._delete(imported)
+                export.seek(0)
+                started = time.perf_counter()
+                run()
+                elapsed = time.perf_counter() - started
+                self.stdout.write(
+                    f"  {label:>21}: {options['rows'] / elapsed:8.0f} rows/s ({elapsed:.1f}s), "
+                    f"peak RSS {_peak_rss_mb():.0f} MB"
+                )
+        self._refresh(user)
+
+    def _write_file(self, export, user, rows, skills_per_application):
+        """The export layout ImportJSONView reads, with pks above every existing application."""
+        skill_ids = list(JobSkills.objects.values_list("id", flat=True))
+        if len(skill_ids) < 200:
+            JobSkills.objects.bulk_create(
+                JobSkills(name=f"{SEED_SKILL_PREFIX}{i}") for i in range(200 - len(skill_ids))
+            )
+            skill_ids = list(JobSkills.objects.values_list("id", flat=True))
+        status = JobApplicationStatus.objects.order_by("id").first() or JobApplicationStatus.objects.create(
+            name="Applied", category="applied", color="#2563eb"
+        )
+        first_pk = (JobApplication.objects.aggregate(last=Max("id"))["last"] or 0) + 1
+        local_fields = [field.name for field in JobApplication._meta.local_fields]
+        encoder = DjangoJSONEncoder()
+        rng = random.Random(0)
+        now = timezone.now()
+
+        self.stdout.write(f"Writing {rows} applications...")
+        export.write(b'{"apis.JobApplication": [')
+        for start in range(0, rows, 5000):
+            applications = [
+                JobApplication(
+                    pk=first_pk + i,
+                    user=user,
+                    status=status,
+                    position="Engineer",
+                    company_name=f"Company{i}",
+                    location="Remote",
+                    description="Generated for the import benchmark",
+                    application_through="website",
+                    application_url=f"{SEED_URL}{i}",
+                    created_at=now,
+                    updated_at=now,
+                )
+                for i in range(start, min(start + 5000, rows))
+            ]
+            objects = serializers.serialize("python", applications, fields=local_fields)
+            for obj in objects:
+                picked = rng.sample(skill_ids, 2 * skills_per_application)
+                obj["fields"]["skills"] = picked[:skills_per_application]
+                obj["fields"]["preferred_skills"] = picked[skills_per_application:]
+            separator = b"," if start else b""
+            export.write(separator + ",\n".join(encoder.encode(obj) for obj in objects).encode())
+        export.write(b"]}\n")
+
+    @staticmethod
+    def _delete(imported, batch_size=5000):
+        deleted = 0
+        while ids := list(imported.values_list("id", flat=True)[:batch_size]):
+            # _refresh() recounts the stats and skill demand once at the end
+            with transaction.atomic(), job_application_signals_muted():
+                deleted += JobApplication.objects.filter(id__in=ids).delete()[1].get("apis.JobApplication", 0)
+        return deleted
+
+    @staticmethod
+    def _refresh(user):
+        # Deletes above bypass the counters and list ETags
+        JobApplicationStat.rebuild()
+        JobSkillDemand.rebuild()
+        response_cache.invalidate_for_users(JobApplication, [user.id])
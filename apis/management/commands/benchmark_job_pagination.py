@@ -0,0 +1,129 @@
+import time
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.test import Client
+from apis.models import CustomUser, JobApplication, JobApplicationStat, JobApplicationStatus
+from apis.pagination import JobApplicationCursorPagination
+from apis.serializers import CustomTokenObtainPairSerializer
+from apis.services import response_cache
+from apis.signals import job_application_signals_muted
+
+SEED_URL = "https://bench.invalid/pagination/"
+
+
+class Command(BaseCommand):
+    help = (
+        "Grow one user's pipeline step by step and time cursor-paginated list pages at each size, "
+        "first page and deep page, against the OFFSET query the same deep page would need"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--username", required=True, help="User the applications are seeded for")
+        parser.add_argument(
+            "--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000],
+            help="Seeded application counts to time at, smallest first",
+        )
+        parser.add_argument("--page-size", type=int, default=50, help="page_size sent with every request")
+        parser.add_argument("--depth", type=int, default=100, help="Pages walked before timing the deep page")
+        parser.add_argument("--repeat", type=int, default=20, help="Timed requests per page")
+        parser.add_argument("--batch-size", type=int, default=5000, help="Rows per bulk insert while seeding")
+        parser.add_argument("--cleanup", action="store_true", help="Delete the seeded applications and exit")
+
+    def handle(self, *args, **options):
+        try:
+            user = CustomUser.objects.get(username=options["username"])
+        except CustomUser.DoesNotExist:
+            raise CommandError(f"No user named {options['username']!r}")
+
+        seeded = JobApplication.objects.filter(user=user, application_url__startswith=SEED_URL)
+        if options["cleanup"]:
+            deleted = 0
+            while ids := list(seeded.values_list("id", flat=True)[:options["batch_size"]]):
+                # _refresh() recounts the stats once at the end
+                with transaction.atomic(), job_application_signals_muted():
+                    deleted += JobApplication.objects.filter(id__in=ids).delete()[1].get("apis.JobApplication", 0)
+            self._refresh(user)
+            self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} seeded applications"))
+            return
+
+        token = str(CustomTokenObtainPairSerializer.get_token(user).access_token)
+        host = next((h.lstrip(".") for h in settings.ALLOWED_HOSTS if h and h != "*"), "localhost")
+        client = Client(HTTP_AUTHORIZATION=f"Bearer {token}", HTTP_HOST=host)
+        page_size, depth = options["page_size"], options["depth"]
+
+        for size in sorted(options["sizes"]):
+            self._seed(user, size - seeded.count(), options["batch_size"])
+            total = JobApplication.objects.filter(user=user).count()
+            self.stdout.write(self.style.MIGRATE_HEADING(f"{total} applications, page_size={page_size}"))
+
+            first_url = f"/api/job-applications/?page_size={page_size}"
+            deep_url, walked = first_url, 0
+            while walked < depth and (next_url := self._get(client, deep_url)["next"]):
+                deep_url, walked = next_url, walked + 1
+
+            for label, url in (("first page", first_url), (f"page {walked + 1}", deep_url)):
+                elapsed = self._time(options["repeat"], lambda: self._get(client, url))
+                self.stdout.write(f"  {'cursor ' + label:>17}: {elapsed * 1000:8.2f} ms")
+
+            # The deep page's query alone, then what a ?page=N paginator would run for it
+            ordering = JobApplicationCursorPagination.ordering
+            ordered = JobApplication.objects.filter(user=user).order_by(*ordering)
+            offset = walked * page_size
+            if not offset:
+                continue
+            last_seen = ordered[offset - 1]
+            position = [str(getattr(last_seen, order.lstrip("-"))) for order in ordering]
+            keyset = ordered.filter(JobApplicationCursorPagination()._after(ordering, position))[:page_size]
+            for label, page in (("keyset", keyset), (f"OFFSET {offset}", ordered[offset:offset + page_size])):
+                elapsed = self._time(options["repeat"], lambda: list(page.values_list("id")))
+                self.stdout.write(f"  {label:>17}: {elapsed * 1000:8.2f} ms (query only)")
+
+    @staticmethod
+    def _get(client, url):
+        response = client.get(url)
+        if response.status_code != 200:
+            raise CommandError(f"GET {url} failed: HTTP {response.status_code} {response.content[:200]!r}")
+        return response.json()
+
+    @staticmethod
+    def _time(repeat, call):
+        call()
+        started = time.perf_counter()
+        for _ in range(repeat):
+            call()
+        return (time.perf_counter() - started) / repeat
+
+    def _seed(self, user, missing, batch_size):
+        if missing <= 0:
+            return
+        status = JobApplicationStatus.objects.order_by("id").first() or JobApplicationStatus.objects.create(
+            name="Applied", category="applied", color="#2563eb"
+        )
+        start = JobApplication.objects.filter(user=user, application_url__startswith=SEED_URL).count()
+        self.stdout.write(f"Seeding {missing} applications...")
+        done = 0
+        while done < missing:
+            size = min(batch_size, missing - done)
+            JobApplication.objects.bulk_create(
+                JobApplication(
+                    user=user,
+                    status=status,
+                    position="Engineer",
+                    company_name=f"Company{start + done + i}",
+                    location="Remote",
+                    application_through="website",
+                    application_url=f"{SEED_URL}{start + done + i}",
+                )
+                for i in range(size)
+            )
+            done += size
+            if done % (batch_size * 20) == 0 or done == missing:
+                self.stdout.write(f"  {done}/{missing}")
+        self._refresh(user)
+
+    @staticmethod
+    def _refresh(user):
+        # Bulk writes bypass the counters and list ETags
+        JobApplicationStat.rebuild()
+        response_cache.invalidate_for_users(JobApplication, [user.id])
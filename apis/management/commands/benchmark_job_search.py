@@ -0,0 +1,101 @@
+import random
+import time
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from apis.models import CustomUser, JobApplication, JobApplicationStat, JobApplicationStatus
+from apis.services import response_cache
+from apis.services.job_search import IcontainsSearchBackend, SQLiteFTS5SearchBackend, get_search_backend
+
+SEED_URL = "https://bench.invalid/"
+DEFAULT_QUERIES = ["engineer", "backend eng", "remote python", "berlin", "company42", "kubern"]
+POSITIONS = [
+    "Backend Engineer", "Frontend Developer", "Data Scientist", "DevOps Engineer", "Product Manager",
+    "QA Analyst", "Mobile Developer", "Site Reliability Engineer", "Engineering Manager", "Data Engineer",
+]
+LOCATIONS = ["Berlin", "London", "Remote", "New York", "Bangalore", "Toronto", "Paris", "Amsterdam"]
+WORDS = (
+    "python django react kubernetes aws sql golang rust java typescript team remote senior junior "
+    "growth startup fintech health platform api cloud testing mentoring product hybrid"
+).split()
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed one user's pipeline with N job applications and compare search latency "
+        "of the FTS5 index against icontains scans"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--username", required=True, help="User the applications are seeded for")
+        parser.add_argument("--applications", type=int, default=1_000_000, help="Applications to seed")
+        parser.add_argument("--repeat", type=int, default=20, help="Runs timed per query and backend")
+        parser.add_argument("--query", action="append", help="Search to time (repeatable)")
+        parser.add_argument("--batch-size", type=int, default=5000, help="Rows per bulk insert while seeding")
+        parser.add_argument("--cleanup", action="store_true", help="Delete the seeded applications and exit")
+
+    def handle(self, *args, **options):
+        try:
+            user = CustomUser.objects.get(username=options["username"])
+        except CustomUser.DoesNotExist:
+            raise CommandError(f"No user named {options['username']!r}")
+
+        seeded = JobApplication.objects.filter(user=user, application_url__startswith=SEED_URL)
+        if options["cleanup"]:
+            deleted = 0
+            while ids := list(seeded.values_list("id", flat=True)[:options["batch_size"]]):
+                with transaction.atomic():
+                    deleted += JobApplication.objects.filter(id__in=ids).delete()[1].get("apis.JobApplication", 0)
+            self._refresh(user)
+            self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} seeded applications"))
+            return
+
+        if not isinstance(get_search_backend(), SQLiteFTS5SearchBackend):
+            raise CommandError("The FTS5 search backend is not in use on this database")
+        self._seed(user, options["applications"] - seeded.count(), options["batch_size"])
+
+        backends = (("icontains", IcontainsSearchBackend()), ("fts5", get_search_backend()))
+        for query in options["query"] or DEFAULT_QUERIES:
+            self.stdout.write(self.style.MIGRATE_HEADING(repr(query)))
+            for label, backend in backends:
+                found = backend.search(query, user.id)
+                started = time.perf_counter()
+                for _ in range(options["repeat"]):
+                    backend.search(query, user.id)
+                elapsed = (time.perf_counter() - started) / options["repeat"]
+                self.stdout.write(f"  {label:>9}: {elapsed * 1000:8.2f} ms  {len(found)} results")
+
+    def _seed(self, user, missing, batch_size):
+        if missing <= 0:
+            return
+        status = JobApplicationStatus.objects.order_by("id").first() or JobApplicationStatus.objects.create(
+            name="Applied", category="applied", color="#2563eb"
+        )
+        rng = random.Random(0)
+        self.stdout.write(f"Seeding {missing} applications...")
+        done = 0
+        while done < missing:
+            size = min(batch_size, missing - done)
+            # bulk_create skips save(), but the FTS5 triggers still index every row
+            JobApplication.objects.bulk_create(
+                JobApplication(
+                    user=user,
+                    status=status,
+                    position=rng.choice(POSITIONS),
+                    company_name=f"Company{rng.randrange(50_000)}",
+                    location=rng.choice(LOCATIONS),
+                    description=" ".join(rng.choices(WORDS, k=40)),
+                    application_through="website",
+                    application_url=f"{SEED_URL}{done + i}",
+                )
+                for i in range(size)
+            )
+            done += size
+            if done % (batch_size * 20) == 0 or done == missing:
+                self.stdout.write(f"  {done}/{missing}")
+        self._refresh(user)
+
+    @staticmethod
+    def _refresh(user):
+        # Bulk writes bypass the counters and list ETags
+        JobApplicationStat.rebuild()
+        response_cache.invalidate_for_users(JobApplication, [user.id])
@@ -0,0 +1,106 @@
+import random
+import time
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand
+from django.db import connection, reset_queries, transaction
+from django.db.models import Q
+from django.test.utils import CaptureQueriesContext
+from apis.backends import EmailPhoneUsernameBackend
+from apis.models import CustomUser, LoginIdentifier
+
+SEED_PREFIX = "bench-login-"
+
+
+def _or_lookup(login):
+    """How EmailPhoneUsernameBackend found the user before the identifier index."""
+    try:
+        return CustomUser.objects.get(Q(username=login) | Q(email=login) | Q(phone_number=login))
+    except (CustomUser.DoesNotExist, CustomUser.MultipleObjectsReturned):
+        return None
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed N users and time resolving a login by username, email and phone number "
+        "through the identifier index against the three-way OR query it replaced"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=100_000, help="Users to seed")
+        parser.add_argument("--lookups", type=int, default=2000, help="Timed lookups per kind and mode")
+        parser.add_argument("--batch-size", type=int, default=5000, help="Users per bulk insert while seeding")
+        parser.add_argument("--cleanup", action="store_true", help="Delete the seeded users and exit")
+
+    def handle(self, *args, **options):
+        seeded = CustomUser.objects.filter(username__startswith=SEED_PREFIX)
+        if options["cleanup"]:
+            deleted = 0
+            while ids := list(seeded.values_list("id", flat=True)[:options["batch_size"]]):
+                with transaction.atomic():
+                    deleted += CustomUser.objects.filter(id__in=ids).delete()[1].get("apis.CustomUser", 0)
+            self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} seeded users"))
+            return
+
+        self._seed(seeded.count(), options["users"], options["batch_size"])
+
+        users = list(seeded.values_list("username", "email", "phone_number"))
+        rng = random.Random(0)
+        picked = [rng.choice(users) for _ in range(options["lookups"])]
+        backend = EmailPhoneUsernameBackend()
+        self.stdout.write(self.style.MIGRATE_HEADING(
+            f"{CustomUser.objects.count()} users, {LoginIdentifier.objects.count()} login identifiers"
+        ))
+        kinds = [
+            ("username", [username for username, _, _ in picked]),
+            ("email", [email for _, email, _ in picked]),
+            ("phone number", [phone for _, _, phone in picked]),
+            # The OR query compares exactly, so it finds none of these
+            ("email, upper", [email.upper() for _, email, _ in picked]),
+            ("unknown", [f"nobody{i}@bench.invalid" for i in range(len(picked))]),
+        ]
+        for kind, logins in kinds:
+            for label, lookup in (("OR query", _or_lookup), ("identifier index", backend.get_login_user)):
+                # A full DEBUG query log would leave nothing to count
+                reset_queries()
+                with CaptureQueriesContext(connection) as queries:
+                    lookup(logins[0])
+                started = time.perf_counter()
+                found = sum(lookup(login) is not None for login in logins)
+                elapsed = time.perf_counter() - started
+                self.stdout.write(
+                    f"  {kind:>12}, {label:>16}: {elapsed / len(logins) * 1e6:8.1f} µs/login, "
+                    f"{len(queries)} queries, {found}/{len(logins)} found"
+                )
+
+        # For scale: what every successful login spends after the lookup
+        hashed = CustomUser(password=make_password("benchmark"))
+        started = time.perf_counter()
+        for _ in range(5):
+            hashed.check_password("benchmark")
+        self.stdout.write(f"  password check: {(time.perf_counter() - started) / 5 * 1e6:8.0f} µs/login")
+
+    def _seed(self, start, users, batch_size):
+        missing = users - start
+        if missing <= 0:
+            return
+        # Only lookups are timed; an unusable password saves hashing 100k of them
+        password = make_password(None)
+        self.stdout.write(f"Seeding {missing} users...")
+        done = 0
+        while done < missing:
+            numbers = range(start + done, start + min(done + batch_size, missing))
+            with transaction.atomic():
+                created = CustomUser.objects.bulk_create(
+                    CustomUser(
+                        username=f"{SEED_PREFIX}{n}",
+                        email=f"{SEED_PREFIX}{n}@bench.invalid",
+                        phone_number=f"+1999{n:08d}",
+                        password=password,
+                    )
+                    for n in numbers
+                )
+                # bulk_create skips the post_save signal that indexes new users
+                LoginIdentifier.sync_for_users(created)
+            done += len(numbers)
+            if done % (batch_size * 20) == 0 or done == missing:
+                self.stdout.write(f"  {done}/{missing}")
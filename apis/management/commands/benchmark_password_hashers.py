@@ -0,0 +1,97 @@
+import math
+import os
+import time
+import django
+from concurrent.futures import ProcessPoolExecutor
+from django.conf import settings
+from django.contrib.auth.hashers import get_hasher
+from django.core.management.base import BaseCommand
+
+ALGORITHMS = {
+    "pbkdf2": "pbkdf2_sha256",
+    "scrypt": "scrypt",
+    "argon2": "argon2",
+}
+
+
+def _time_hashes(algorithm, rounds):
+    hasher = get_hasher(algorithm)
+    salt = hasher.salt()
+    started = time.perf_counter()
+    for _ in range(rounds):
+        hasher.encode("benchmark-password", salt)
+    return time.perf_counter() - started
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure password hashes/sec per core for the configured hashers and "
+        "recommend parameters that hit a target login latency"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--algorithm",
+            choices=sorted(ALGORITHMS),
+            action="append",
+            help="Hasher to benchmark (repeatable). Defaults to PASSWORD_HASHER.",
+        )
+        parser.add_argument("--target-ms", type=float, default=250.0, help="Target hashing time per login")
+        parser.add_argument("--rounds", type=int, default=5, help="Hashes timed per worker")
+        parser.add_argument(
+            "--processes",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="Worker processes for the all-cores throughput run",
+        )
+
+    def handle(self, *args, **options):
+        names = options["algorithm"] or [settings.PASSWORD_HASHER]
+        for name in names:
+            algorithm = ALGORITHMS[name]
+            try:
+                hasher = get_hasher(algorithm)
+                single = _time_hashes(algorithm, 1)
+            except ValueError as e:
+                # e.g. argon2-cffi is an optional dependency
+                self.stderr.write(self.style.ERROR(f"{name}: {e}"))
+                continue
+
+            # Warmed up above; now time one core, then every core at once
+            seconds = _time_hashes(algorithm, options["rounds"])
+            per_hash_ms = seconds / options["rounds"] * 1000
+            with ProcessPoolExecutor(max_workers=options["processes"], initializer=django.setup) as pool:
+                started = time.perf_counter()
+                list(pool.map(_time_hashes, [algorithm] * options["processes"], [options["rounds"]] * options["processes"]))
+                wall = time.perf_counter() - started
+            total_per_sec = options["processes"] * options["rounds"] / wall
+
+            self.stdout.write(self.style.MIGRATE_HEADING(f"{name} ({hasher.__class__.__name__})"))
+            self.stdout.write(f"  current parameters: {self._describe(name, hasher)}")
+            self.stdout.write(f"  single core: {per_hash_ms:.1f} ms/hash, {1000 / per_hash_ms:.1f} hashes/sec (first hash {single * 1000:.1f} ms)")
+            self.stdout.write(f"  {options['processes']} processes: {total_per_sec:.1f} hashes/sec total")
+            for line in self._recommend(name, hasher, per_hash_ms, options["target_ms"]):
+                self.stdout.write(self.style.SUCCESS(f"  recommended: {line}"))
+
+    @staticmethod
+    def _describe(name, hasher):
+        if name == "pbkdf2":
+            return f"iterations={hasher.iterations}"
+        if name == "scrypt":
+            return f"work_factor={hasher.work_factor} block_size={hasher.block_size} parallelism={hasher.parallelism}"
+        return f"time_cost={hasher.time_cost} memory_cost={hasher.memory_cost} parallelism={hasher.parallelism}"
+
+    @staticmethod
+    def _recommend(name, hasher, per_hash_ms, target_ms):
+        # Hashing time grows linearly with each of these cost parameters
+        scale = target_ms / per_hash_ms
+        if name == "pbkdf2":
+            iterations = max(100_000, int(hasher.iterations * scale) // 10_000 * 10_000)
+            return [f"PASSWORD_PBKDF2_ITERATIONS={iterations}"]
+        if name == "scrypt":
+            # N must stay a power of two
+            work_factor = 2 ** max(14, int(math.log2(hasher.work_factor * scale)))
+            memory_mb = 128 * work_factor * hasher.block_size / 1024 / 1024
+            return [f"PASSWORD_SCRYPT_WORK_FACTOR={work_factor}  (~{memory_mb:.0f} MiB per hash)"]
+        time_cost = max(1, round(hasher.time_cost * scale))
+        return [f"PASSWORD_ARGON2_TIME_COST={time_cost}"]
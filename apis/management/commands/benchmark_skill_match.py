@@ -0,0 +1,121 @@
+import random
+import time
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from apis.models import (
+    CustomUser, JobApplication, JobApplicationStat, JobApplicationStatus, JobSkillDemand, JobSkills, UserSkills,
+)
+from apis.services import response_cache
+from apis.services.skill_match import cached_scores, score_applications
+from apis.signals import job_application_signals_muted
+
+SEED_URL = "https://bench.invalid/skill-match/"
+SEED_SKILL_PREFIX = "bench-skill-"
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed one user with N job applications and their skills, then time "
+        "skill-match scoring of all of them, uncached and cached"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--username", required=True, help="User the applications are seeded for")
+        parser.add_argument("--applications", type=int, default=50_000, help="Applications to seed")
+        parser.add_argument("--skills", type=int, default=8, help="Required skills per application (half as many preferred)")
+        parser.add_argument("--repeat", type=int, default=5, help="Timed runs per mode")
+        parser.add_argument("--batch-size", type=int, default=5000, help="Rows per bulk insert while seeding")
+        parser.add_argument("--cleanup", action="store_true", help="Delete the seeded rows and exit")
+
+    def handle(self, *args, **options):
+        try:
+            user = CustomUser.objects.get(username=options["username"])
+        except CustomUser.DoesNotExist:
+            raise CommandError(f"No user named {options['username']!r}")
+
+        seeded = JobApplication.objects.filter(user=user, application_url__startswith=SEED_URL)
+        if options["cleanup"]:
+            deleted = 0
+            while ids := list(seeded.values_list("id", flat=True)[:options["batch_size"]]):
+                # _refresh() recounts the stats and skill demand once at the end
+                with transaction.atomic(), job_application_signals_muted():
+                    deleted += JobApplication.objects.filter(id__in=ids).delete()[1].get("apis.JobApplication", 0)
+            JobSkills.objects.filter(name__startswith=SEED_SKILL_PREFIX).delete()
+            self._refresh(user)
+            self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} seeded applications"))
+            return
+
+        self._seed(user, options["applications"] - seeded.count(), options["skills"], options["batch_size"])
+
+        total = seeded.count()
+        for label, score in (("uncached", score_applications), ("cached", cached_scores)):
+            score(user.id)
+            started = time.perf_counter()
+            for _ in range(options["repeat"]):
+                scores = score(user.id)
+            elapsed = (time.perf_counter() - started) / options["repeat"]
+            self.stdout.write(f"{label:>9}: {elapsed * 1000:8.1f} ms for {len(scores)} applications ({total} seeded)")
+
+    def _seed(self, user, missing, skills_per_application, batch_size):
+        if missing <= 0:
+            return
+        skill_ids = list(JobSkills.objects.values_list("id", flat=True))
+        if len(skill_ids) < 200:
+            JobSkills.objects.bulk_create(
+                JobSkills(name=f"{SEED_SKILL_PREFIX}{i}") for i in range(200 - len(skill_ids))
+            )
+            skill_ids = list(JobSkills.objects.values_list("id", flat=True))
+        rng = random.Random(0)
+        if not UserSkills.objects.filter(user=user).exists():
+            UserSkills.objects.bulk_create(
+                UserSkills(user=user, skill_id=skill_id, level=rng.choice(["beginner", "intermediate", "advanced", "expert"]),
+                           confidence=rng.randrange(101))
+                for skill_id in rng.sample(skill_ids, 25)
+            )
+
+        status = JobApplicationStatus.objects.order_by("id").first() or JobApplicationStatus.objects.create(
+            name="Applied", category="applied", color="#2563eb"
+        )
+        required_through = JobApplication.skills.through
+        preferred_through = JobApplication.preferred_skills.through
+        self.stdout.write(f"Seeding {missing} applications...")
+        done = 0
+        while done < missing:
+            size = min(batch_size, missing - done)
+            with transaction.atomic():
+                applications = JobApplication.objects.bulk_create(
+                    JobApplication(
+                        user=user,
+                        status=status,
+                        position="Engineer",
+                        company_name=f"Company{done + i}",
+                        location="Remote",
+                        application_through="website",
+                        application_url=f"{SEED_URL}{done + i}",
+                    )
+                    for i in range(size)
+                )
+                required, preferred = [], []
+                for application in applications:
+                    picked = rng.sample(skill_ids, skills_per_application + skills_per_application // 2)
+                    required += [
+                        required_through(jobapplication_id=application.id, jobskills_id=skill_id)
+                        for skill_id in picked[:skills_per_application]
+                    ]
+                    preferred += [
+                        preferred_through(jobapplication_id=application.id, jobskills_id=skill_id)
+                        for skill_id in picked[skills_per_application:]
+                    ]
+                required_through.objects.bulk_create(required)
+                preferred_through.objects.bulk_create(preferred)
+            done += size
+            self.stdout.write(f"  {done}/{missing}")
+        self._refresh(user)
+
+    @staticmethod
+    def _refresh(user):
+        # Bulk writes bypass the counters, list ETags and cached scores
+        JobApplicationStat.rebuild()
+        JobSkillDemand.rebuild()
+        response_cache.invalidate_for_users(JobApplication, [user.id])
+        response_cache.invalidate_for_users(UserSkills, [user.id])
@@ -0,0 +1,121 @@
+import socketserver
+import threading
+import time
+from django.core.mail import EmailMessage, get_connection
+from django.core.management.base import BaseCommand, CommandError
+from django.test.utils import override_settings
+from apis.models import EmailProviderSetting
+from apis.services.email_service import EmailService
+from apis.services.smtp_pool import SMTPConnectionPool
+
+SMTP_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
+
+
+class _SinkHandler(socketserver.StreamRequestHandler):
+    """Just enough SMTP to accept and drop mail; the greeting waits out the simulated handshake."""
+
+    def reply(self, line):
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def handle(self):
+        with self.server.lock:
+            self.server.connections += 1
+        time.sleep(self.server.handshake_delay)
+        self.reply("220 localhost benchmark sink")
+        while line := self.rfile.readline():
+            command = line[:4].upper()
+            if command in (b"EHLO", b"HELO"):
+                self.reply("250 localhost")
+            elif command == b"DATA":
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                while self.rfile.readline() not in (b".\r\n", b""):
+                    pass
+                self.reply("250 OK")
+            elif command == b"QUIT":
+                self.reply("221 Bye")
+                return
+            else:
+                # MAIL, RCPT, RSET, NOOP
+                self.reply("250 OK")
+
+
+class _SinkServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, handshake_delay):
+        super().__init__(("127.0.0.1", 0), _SinkHandler)
+        self.handshake_delay = handshake_delay
+        self.connections = 0
+        self.lock = threading.Lock()
+
+
+class Command(BaseCommand):
+    help = (
+        "Send N messages one at a time over SMTP, opening a connection per message as before "
+        "and through the connection pool, and compare messages per second"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--messages", type=int, default=500, help="Messages sent per mode")
+        parser.add_argument(
+            "--handshake-ms", type=float, default=20.0,
+            help="Delay the local sink adds before greeting each connection, standing in for TCP + TLS + AUTH",
+        )
+        parser.add_argument("--host", help="Send to this SMTP server instead of the local sink (e.g. aiosmtpd)")
+        parser.add_argument("--port", type=int, default=8025, help="Port of --host (aiosmtpd listens on 8025)")
+
+    def handle(self, *args, **options):
+        sink = None
+        if options["host"]:
+            host, port = options["host"], options["port"]
+        else:
+            sink = _SinkServer(options["handshake_ms"] / 1000)
+            threading.Thread(target=sink.serve_forever, daemon=True).start()
+            host, port = sink.server_address
+        # Unsaved: nothing is written, and the pool keys it apart from real providers
+        provider = EmailProviderSetting(
+            name="benchmark", provider_type="smtp", host=host, port=port, from_email="bench@bench.invalid",
+            use_tls=False, use_ssl=False,
+        )
+        messages = [
+            (f"Benchmark {i}", "<p>Hello</p>", [f"user{i}@bench.invalid"]) for i in range(options["messages"])
+        ]
+        self.stdout.write(self.style.MIGRATE_HEADING(f"{len(messages)} messages to {host}:{port}"))
+
+        def unpooled():
+            # What every send did before the pool: connect, handshake, send one message, quit
+            for subject, body, to_emails in messages:
+                connection = get_connection(backend=SMTP_BACKEND, host=host, port=port, use_tls=False)
+                email = EmailMessage(subject, body, provider.from_email, to_emails, connection=connection)
+                email.content_subtype = "html"
+                email.send()
+
+        pool = SMTPConnectionPool()
+
+        def pooled():
+            for message in messages:
+                with pool.connection(provider) as connection:
+                    error = EmailService._send_smtp(connection, provider, *message)
+                    if error:
+                        raise error
+
+        try:
+            with override_settings(EMAIL_SMTP_BACKEND=SMTP_BACKEND):
+                for label, send in (("new connection per message", unpooled), ("pooled", pooled)):
+                    opened = sink.connections if sink else None
+                    started = time.perf_counter()
+                    try:
+                        send()
+                    except OSError as e:
+                        raise CommandError(f"Sending to {host}:{port} failed: {e}")
+                    elapsed = time.perf_counter() - started
+                    line = f"  {label:>26}: {len(messages) / elapsed:8.1f} messages/s ({elapsed:.2f}s)"
+                    if sink:
+                        line += f", connections opened: {sink.connections - opened}"
+                    self.stdout.write(line)
+        finally:
+            pool.close_all()
+            if sink:
+                sink.shutdown()
+                sink.server_close()
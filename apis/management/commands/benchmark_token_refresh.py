@@ -0,0 +1,87 @@
+import time
+import uuid
+from datetime import timedelta
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from apis.authentication import BlacklistFilteredRefreshToken
+from apis.models import CustomUser
+from apis.serializers import CustomTokenRefreshSerializer
+from apis.services.token_blacklist import token_blacklist_filter
+
+SEED_PREFIX = "bench-"
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed the refresh-token blacklist with N fake entries and compare token "
+        "refresh throughput with and without the Bloom filter"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--username", required=True, help="User the refreshed tokens belong to")
+        parser.add_argument("--blacklisted", type=int, default=10_000_000, help="Blacklisted tokens to seed")
+        parser.add_argument("--refreshes", type=int, default=1000, help="Refreshes timed per mode")
+        parser.add_argument("--batch-size", type=int, default=10000, help="Rows per bulk insert while seeding")
+        parser.add_argument("--cleanup", action="store_true", help="Delete the seeded rows and exit")
+
+    def handle(self, *args, **options):
+        seeded = OutstandingToken.objects.filter(jti__startswith=SEED_PREFIX)
+        if options["cleanup"]:
+            BlacklistedToken.objects.filter(token__jti__startswith=SEED_PREFIX).delete()
+            deleted, _ = seeded.delete()
+            self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} seeded rows"))
+            return
+
+        try:
+            user = CustomUser.objects.get(username=options["username"])
+        except CustomUser.DoesNotExist:
+            raise CommandError(f"No user named {options['username']!r}")
+
+        self._seed(options["blacklisted"] - seeded.count(), options["batch_size"])
+
+        started = time.perf_counter()
+        token_blacklist_filter.enabled_override = True
+        token_blacklist_filter.reset()
+        token_blacklist_filter.might_contain("warm-up")
+        self.stdout.write(f"Bloom filter built in {time.perf_counter() - started:.1f}s")
+
+        try:
+            for label, enabled in (("database check", False), ("bloom filter", True)):
+                token_blacklist_filter.enabled_override = enabled
+                self._run(label, user, options["refreshes"])
+        finally:
+            token_blacklist_filter.enabled_override = None
+
+    def _seed(self, missing, batch_size):
+        if missing <= 0:
+            return
+        expires_at = timezone.now() + timedelta(days=7)
+        self.stdout.write(f"Seeding {missing} blacklisted tokens...")
+        done = 0
+        while done < missing:
+            size = min(batch_size, missing - done)
+            with transaction.atomic():
+                tokens = OutstandingToken.objects.bulk_create(
+                    OutstandingToken(jti=f"{SEED_PREFIX}{uuid.uuid4().hex}", token="", expires_at=expires_at)
+                    for _ in range(size)
+                )
+                # Bulk inserts skip post_save, so the filter only learns these on rebuild
+                BlacklistedToken.objects.bulk_create(BlacklistedToken(token=token) for token in tokens)
+            done += size
+            if done % (batch_size * 100) == 0 or done == missing:
+                self.stdout.write(f"  {done}/{missing}")
+
+    def _run(self, label, user, refreshes):
+        tokens = [str(BlacklistFilteredRefreshToken.for_user(user)) for _ in range(refreshes)]
+        with CaptureQueriesContext(connection) as queries:
+            started = time.perf_counter()
+            for token in tokens:
+                CustomTokenRefreshSerializer(data={"refresh": token}).is_valid(raise_exception=True)
+            elapsed = time.perf_counter() - started
+        self.stdout.write(
+            f"{label}: {refreshes / elapsed:.0f} refreshes/sec, "
+            f"{elapsed / refreshes * 1000:.2f} ms each, {len(queries) / refreshes:.1f} queries each"
+        )
@@ -0,0 +1,73 @@
+import itertools
+import re
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+from apis.filters import JobApplicationFilterBackend
+from apis.models import JobApplication
+
+# One representative value per filter parameter
+SAMPLE_FILTERS = {
+    "status": "1,2",
+    "category": "interview,offer",
+    "application_through": "linkedin",
+    "applied_after": "2025-01-01",
+    "applied_before": "2025-06-30",
+    "closed_after": "2025-01-01",
+    "min_experience": "2",
+    "max_experience": "5",
+    "skills": "1,2",
+}
+# The table and its skills through-table must be searched through an index, never scanned
+FULL_SCAN = re.compile(
+    rf"\bSCAN ({JobApplication._meta.db_table}|{JobApplication.skills.through._meta.db_table})\b"
+    rf"|Seq Scan on ({JobApplication._meta.db_table}|{JobApplication.skills.through._meta.db_table})\b"
+)
+
+
+def filter_plans(max_filters=len(SAMPLE_FILTERS), user_id=1):
+    """
+    Yield (label, EXPLAIN output) for every combination of up to `max_filters`
+    list filters, each ordering alone and with each single filter, as one
+    user's list runs them. A plan that matches FULL_SCAN scans the table.
+    """
+    factory = APIRequestFactory()
+    backend = JobApplicationFilterBackend()
+    orderings = [""] + [f"{sign}{field}" for field in backend.ordering_fields for sign in ("", "-")]
+    for size in range(max_filters + 1):
+        for names in itertools.combinations(SAMPLE_FILTERS, size):
+            for ordering in orderings if size <= 1 else [""]:
+                params = {name: SAMPLE_FILTERS[name] for name in names}
+                if ordering:
+                    params["ordering"] = ordering
+                request = Request(factory.get("/api/job-applications/", params))
+                queryset = backend.filter_queryset(request, JobApplication.objects.filter(user_id=user_id), None)
+                label = "&".join(f"{key}={value}" for key, value in params.items()) or "(no filters)"
+                yield label, queryset.explain()
+
+
+class Command(BaseCommand):
+    help = (
+        "EXPLAIN every combination of job application list filters and orderings, as "
+        "one user's list runs them, and fail if any of them scans the whole table"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--max-filters", type=int, default=len(SAMPLE_FILTERS), help="Largest combination tried")
+        parser.add_argument("--verbose-plans", action="store_true", help="Print every plan, not just failures")
+
+    def handle(self, *args, **options):
+        checked, failures = 0, []
+        for label, plan in filter_plans(options["max_filters"]):
+            checked += 1
+            if FULL_SCAN.search(plan):
+                failures.append((label, plan))
+            elif options["verbose_plans"]:
+                self.stdout.write(f"{label}\n{plan}\n")
+
+        for label, plan in failures:
+            self.stderr.write(self.style.ERROR(f"Full scan: {label}\n{plan}\n"))
+        if failures:
+            raise CommandError(f"{len(failures)} of {checked} filter combinations scan the table ({connection.vendor})")
+        self.stdout.write(self.style.SUCCESS(f"All {checked} filter combinations use an index ({connection.vendor})"))
@@ -0,0 +1,114 @@
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from django.core.management.base import BaseCommand, CommandError
+
+
+def _request(url, data=None, token=None, timeout=30):
+    headers = {"Content-Type": "application/json"}
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    body = json.dumps(data).encode() if data is not None else None
+    req = urllib.request.Request(url, data=body, headers=headers, method="POST" if body else "GET")
+    started = time.perf_counter()
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as response:
+            status, payload = response.status, response.read()
+    except urllib.error.HTTPError as e:
+        status, payload = e.code, e.read()
+    except OSError:
+        status, payload = 0, b""
+    return status, time.perf_counter() - started, payload
+
+
+def _percentile(samples, pct):
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+class Command(BaseCommand):
+    help = (
+        "Load test a running server: measure latency of an unrelated endpoint "
+        "alone, then again while many clients log in concurrently"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--base-url", default="http://127.0.0.1:8000", help="Server to test")
+        parser.add_argument("--username", required=True, help="Existing user the storm logs in as")
+        parser.add_argument("--password", required=True)
+        parser.add_argument(
+            "--probe-path",
+            default="/api/auth/me/",
+            help="Endpoint measured during the storm (called with the user's access token)",
+        )
+        parser.add_argument("--concurrency", type=int, default=50, help="Concurrent login clients")
+        parser.add_argument("--duration", type=float, default=30.0, help="Seconds per phase")
+        parser.add_argument("--probe-interval", type=float, default=0.05, help="Seconds between probes")
+
+    def handle(self, *args, **options):
+        base_url = options["base_url"].rstrip("/")
+        login_url = f"{base_url}/api/auth/login/"
+        credentials = {"username": options["username"], "password": options["password"]}
+
+        status, _, payload = _request(login_url, credentials)
+        if status != 200:
+            raise CommandError(f"Initial login failed with HTTP {status}: {payload[:200]!r}")
+        token = json.loads(payload)["access"]
+        probe_url = f"{base_url}{options['probe_path']}"
+
+        self.stdout.write(self.style.MIGRATE_HEADING(f"Baseline: {probe_url} for {options['duration']:.0f}s"))
+        baseline = self._probe(probe_url, token, options)
+        self._report("probe", baseline)
+
+        self.stdout.write(self.style.MIGRATE_HEADING(
+            f"Login storm: {options['concurrency']} clients on {login_url} for {options['duration']:.0f}s"
+        ))
+        stop = threading.Event()
+        login_results = []
+
+        def storm():
+            while not stop.is_set():
+                login_results.append(_request(login_url, credentials)[:2])
+
+        with ThreadPoolExecutor(max_workers=options["concurrency"]) as clients:
+            for _ in range(options["concurrency"]):
+                clients.submit(storm)
+            during = self._probe(probe_url, token, options)
+            stop.set()
+
+        self._report("probe", during)
+        self._report("login", login_results)
+
+        baseline_p99 = _percentile([seconds for _, seconds in baseline], 99)
+        during_p99 = _percentile([seconds for _, seconds in during], 99)
+        if baseline_p99:
+            self.stdout.write(self.style.SUCCESS(
+                f"Probe p99 went from {baseline_p99 * 1000:.1f} ms to {during_p99 * 1000:.1f} ms "
+                f"({during_p99 / baseline_p99:.1f}x) under the login storm"
+            ))
+
+    @staticmethod
+    def _probe(url, token, options):
+        results = []
+        deadline = time.monotonic() + options["duration"]
+        while time.monotonic() < deadline:
+            results.append(_request(url, token=token)[:2])
+            time.sleep(options["probe_interval"])
+        return results
+
+    def _report(self, label, results):
+        seconds = [elapsed for _, elapsed in results]
+        statuses = ", ".join(f"{code or 'error'}: {count}" for code, count in sorted(Counter(s for s, _ in results).items()))
+        self.stdout.write(
+            f"  {label}: {len(results)} requests  "
+            f"p50 {_percentile(seconds, 50) * 1000:.1f} ms  "
+            f"p95 {_percentile(seconds, 95) * 1000:.1f} ms  "
+            f"p99 {_percentile(seconds, 99) * 1000:.1f} ms  "
+            f"max {max(seconds, default=0) * 1000:.1f} ms  ({statuses})"
+        )
@@ -0,0 +1,79 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from apis import urls as api_urls
+from apis.models import CustomUser
+from apis.serializers import CustomTokenObtainPairSerializer
+
+
+class Command(BaseCommand):
+    help = (
+        "Count SQL queries per GET request for every argument-free endpoint in "
+        "apis/urls.py, with plain JWTAuthentication versus each view's configured "
+        "(cached or stateless) authentication"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--username", required=True, help="User whose token is sent")
+        parser.add_argument(
+            "--exclude",
+            action="append",
+            default=["admin/export-all-tables/"],
+            help="Route (as written in apis/urls.py) to skip; repeatable",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            user = CustomUser.objects.get(username=options["username"])
+        except CustomUser.DoesNotExist:
+            raise CommandError(f"No user named {options['username']!r}")
+
+        token = str(CustomTokenObtainPairSerializer.get_token(user).access_token)
+        host = next((h.lstrip(".") for h in settings.ALLOWED_HOSTS if h and h != "*"), "localhost")
+        client = Client(HTTP_AUTHORIZATION=f"Bearer {token}", HTTP_HOST=host)
+
+        rows = []
+        # Some GET endpoints create defaults on first access; leave no trace
+        with transaction.atomic():
+            for pattern in api_urls.urlpatterns:
+                route = str(pattern.pattern)
+                view_class = getattr(pattern.callback, "cls", None)
+                if pattern.pattern.converters or route in options["exclude"]:
+                    continue
+                if view_class is None or not hasattr(view_class, "get"):
+                    continue
+
+                path = f"/api/{route}"
+                configured = view_class.authentication_classes
+                view_class.authentication_classes = [JWTAuthentication]
+                try:
+                    status, baseline = self._count(client, path)
+                finally:
+                    view_class.authentication_classes = configured
+                # First request warms the user cache, the second is measured
+                self._count(client, path)
+                _, optimized = self._count(client, path)
+                rows.append((path, status, baseline, optimized, configured[0].__name__))
+            transaction.set_rollback(True)
+
+        width = max(len(row[0]) for row in rows)
+        self.stdout.write(f"{'endpoint'.ljust(width)}  status  jwt  configured  saved  authentication")
+        for path, status, baseline, optimized, auth_name in rows:
+            self.stdout.write(
+                f"{path.ljust(width)}  {status:>6}  {baseline:>3}  {optimized:>10}  {baseline - optimized:>5}  {auth_name}"
+            )
+        saved = sum(row[2] - row[3] for row in rows)
+        self.stdout.write(self.style.SUCCESS(
+            f"{saved} queries saved over {len(rows)} requests ({saved / max(len(rows), 1):.2f} per request)"
+        ))
+
+    @staticmethod
+    def _count(client, path):
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(path)
+        if hasattr(response, "streaming_content"):
+            b"".join(response.streaming_content)
+        return response.status_code, len(queries)
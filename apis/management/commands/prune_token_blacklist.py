@@ -0,0 +1,45 @@
+import time
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from apis.services.token_blacklist import token_blacklist_filter
+
+
+class Command(BaseCommand):
+    help = "Delete expired OutstandingToken rows and their BlacklistedToken entries in batches"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=5000, help="Tokens deleted per transaction")
+        parser.add_argument("--sleep", type=float, default=0.0, help="Seconds to pause between batches")
+        parser.add_argument(
+            "--rebuild-filter",
+            action="store_true",
+            help="Afterwards make every worker rebuild its blacklist Bloom filter",
+        )
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now()
+        outstanding_total = blacklisted_total = 0
+        while True:
+            with transaction.atomic():
+                ids = list(
+                    OutstandingToken.objects.filter(expires_at__lte=cutoff)
+                    .order_by("id")
+                    .values_list("id", flat=True)[:options["batch_size"]]
+                )
+                if not ids:
+                    break
+                blacklisted, _ = BlacklistedToken.objects.filter(token_id__in=ids).delete()
+                outstanding, _ = OutstandingToken.objects.filter(id__in=ids).delete()
+            blacklisted_total += blacklisted
+            outstanding_total += outstanding
+            self.stdout.write(f"Deleted {outstanding_total} outstanding / {blacklisted_total} blacklisted tokens so far")
+            if options["sleep"]:
+                time.sleep(options["sleep"])
+
+        if options["rebuild_filter"]:
+            token_blacklist_filter.reset()
+        self.stdout.write(self.style.SUCCESS(
+            f"Pruned {outstanding_total} expired tokens ({blacklisted_total} blacklisted)"
+        ))
@@ -0,0 +1,39 @@
+import time
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from apis.models import PasswordResetToken
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete used and expired password reset tokens in batches. Run it from "
+        "cron, or pass --interval to keep purging as a long-running worker"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.PASSWORD_RESET_PURGE_BATCH_SIZE,
+            help="Rows deleted per statement",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            help="Repeat every N seconds instead of purging once and exiting",
+        )
+
+    def handle(self, *args, **options):
+        total = 0
+        try:
+            while True:
+                deleted = PasswordResetToken.purge(options["batch_size"])
+                total += deleted
+                if deleted:
+                    self.stdout.write(f"Purged {deleted} password reset tokens")
+                if options["interval"] is None:
+                    break
+                time.sleep(options["interval"])
+        except KeyboardInterrupt:
+            pass
+        self.stdout.write(self.style.SUCCESS(f"Purged {total} password reset tokens"))
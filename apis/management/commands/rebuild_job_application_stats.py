@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+from apis.models import JobApplicationStat, JobSkillDemand
+
+
+class Command(BaseCommand):
+    help = "Recount the per-user job application stats and skill demand behind the stats and skill gap endpoints"
+
+    def handle(self, *args, **options):
+        JobApplicationStat.rebuild()
+        JobSkillDemand.rebuild()
+        self.stdout.write(self.style.SUCCESS(
+            f"Rebuilt {JobApplicationStat.objects.count()} stat counters "
+            f"and {JobSkillDemand.objects.count()} skill demand counters"
+        ))
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+from apis.services.job_search import get_search_backend
+
+
+class Command(BaseCommand):
+    help = "Recreate the job application search index from the JobApplication table"
+
+    def handle(self, *args, **options):
+        backend = get_search_backend()
+        backend.rebuild()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt the {type(backend).__name__} index"))
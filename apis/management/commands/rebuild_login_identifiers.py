@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+from apis.models import LoginIdentifier
+
+
+class Command(BaseCommand):
+    help = "Rebuild the normalized login identifiers used by EmailPhoneUsernameBackend"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=2000, help="Users written per query")
+
+    def handle(self, *args, **options):
+        LoginIdentifier.rebuild(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Indexed {LoginIdentifier.objects.count()} login identifiers"))
@@ -0,0 +1,40 @@
+import time
+from django.core.management.base import BaseCommand
+from apis.services.activity_rollups import refresh_activity_rollups
+
+
+class Command(BaseCommand):
+    help = (
+        "Refresh the hourly and daily admin activity rollups from the source tables. "
+        "Run it from cron, or pass --interval to keep refreshing as a long-running worker"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="Recompute every bucket instead of only those since the last refresh",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            help="Repeat every N seconds instead of refreshing once and exiting",
+        )
+
+    def handle(self, *args, **options):
+        full = options["full"]
+        try:
+            while True:
+                started = time.perf_counter()
+                windows = refresh_activity_rollups(full=full)
+                for metric, since in windows.items():
+                    self.stdout.write(f"  {metric}: {'all buckets' if since is None else f'since {since:%Y-%m-%d %H:%M}'}")
+                self.stdout.write(self.style.SUCCESS(
+                    f"Refreshed activity rollups in {time.perf_counter() - started:.2f}s"
+                ))
+                if options["interval"] is None:
+                    break
+                full = False
+                time.sleep(options["interval"])
+        except KeyboardInterrupt:
+            pass
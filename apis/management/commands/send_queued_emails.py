@@ -0,0 +1,51 @@
+import time
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from apis.services.email_service import EmailService
+from apis.services.email_templates import precompile_email_templates
+from apis.services.smtp_pool import smtp_pool
+
+
+class Command(BaseCommand):
+    help = "Deliver queued emails from EmailLog in batches, retrying failures with exponential backoff"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.EMAIL_QUEUE_BATCH_SIZE,
+            help="Number of emails claimed per batch",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=5.0,
+            help="Seconds to sleep when the queue is empty",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Drain the currently due emails and exit instead of polling forever",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        total = 0
+        template_names = precompile_email_templates()
+        self.stdout.write(f"Precompiled {len(template_names)} email templates")
+        self.stdout.write(f"Email worker started (batch size {batch_size})")
+        try:
+            while True:
+                processed = EmailService.process_queue(batch_size)
+                total += processed
+                if processed:
+                    continue
+                if options["once"]:
+                    break
+                smtp_pool.close_idle()
+                time.sleep(options["interval"])
+        except KeyboardInterrupt:
+            pass
+        finally:
+            smtp_pool.close_all()
+        self.stdout.write(self.style.SUCCESS(f"Processed {total} queued emails"))
@@ -1,7 +1,8 @@
 from .user_management import CustomUser, Profile, NotificationPreference, UserEmailSetting
 from .general_settings import EmailProviderSetting, EmailLog
-from .auth_models import PasswordResetToken
-from .job_management import JobApplicationStatus, JobSkills, JobApplication, UserSkills
+from .auth_models import PasswordResetToken, LoginIdentifier
+from .job_management import JobApplicationStatus, JobSkills, JobApplication, JobApplicationStat, UserSkills, JobSkillDemand
+from .activity_metrics import ActivityRollup, ActivityRollupCursor
 from .learning_managment import LearningManagementStatus, LearningManagement, LearningResource, LearningManagementSkill
 
 __all__ = [
@@ -10,14 +11,19 @@ __all__ = [
     'EmailProviderSetting', 
     'EmailLog',
     'PasswordResetToken',
+    'LoginIdentifier',
     'JobApplicationStatus',
     'JobSkills',
     'JobApplication',
+    'JobApplicationStat',
     'UserSkills',
+    'JobSkillDemand',
     'LearningManagementStatus',
     'LearningManagement',
     'LearningResource',
     'NotificationPreference',
     'UserEmailSetting',
-    'LearningManagementSkill'
+    'LearningManagementSkill',
+    'ActivityRollup',
+    'ActivityRollupCursor',
 ]
\ No newline at end of file
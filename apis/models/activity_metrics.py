@@ -0,0 +1,62 @@
+from django.db import IntegrityError, models, transaction
+from django.db.models import F
+from django.utils import timezone
+
+
+class ActivityRollup(models.Model):
+    """
+    Hourly and daily activity counts for the admin dashboard, so it never
+    counts the source tables live. Filled by apis.services.activity_rollups
+    (run via `manage.py refresh_activity_rollups`); logins have no source
+    table and are counted as they happen.
+    """
+    METRIC_CHOICES = [
+        ("registrations", "Registrations"),
+        ("logins", "Logins"),
+        ("job_applications", "Job applications created"),
+        ("learning_plans_completed", "Learning plans completed"),
+        ("emails_sent", "Emails sent"),
+        ("emails_failed", "Emails failed"),
+    ]
+    GRANULARITY_CHOICES = [
+        ("hour", "Hour"),
+        ("day", "Day"),
+    ]
+
+    metric = models.CharField(max_length=50, choices=METRIC_CHOICES)
+    granularity = models.CharField(max_length=10, choices=GRANULARITY_CHOICES)
+    bucket_start = models.DateTimeField()
+    count = models.PositiveIntegerField(default=0)
+
+    @classmethod
+    def increment(cls, metric, at=None):
+        """Count one event in its hourly bucket; daily buckets follow on the next refresh."""
+        bucket_start = (at or timezone.now()).replace(minute=0, second=0, microsecond=0)
+        buckets = cls.objects.filter(metric=metric, granularity="hour", bucket_start=bucket_start)
+        if buckets.update(count=F("count") + 1):
+            return
+        try:
+            with transaction.atomic():
+                cls.objects.create(metric=metric, granularity="hour", bucket_start=bucket_start, count=1)
+        except IntegrityError:
+            # Created concurrently
+            buckets.update(count=F("count") + 1)
+
+    def __str__(self):
+        return f"{self.metric} {self.granularity} {self.bucket_start:%Y-%m-%d %H:%M}: {self.count}"
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["metric", "granularity", "bucket_start"], name="unique_activity_rollup_bucket"
+            ),
+        ]
+
+
+class ActivityRollupCursor(models.Model):
+    """How far each metric's rollups have been refreshed from the source tables."""
+    metric = models.CharField(max_length=50, choices=ActivityRollup.METRIC_CHOICES, unique=True)
+    refreshed_until = models.DateTimeField()
+
+    def __str__(self):
+        return f"{self.metric} refreshed until {self.refreshed_until}"
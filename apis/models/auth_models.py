@@ -1,6 +1,11 @@
-from django.db import models
+from django.conf import settings
+from django.db import models, transaction
+from django.db.models import Q
 from django.utils import timezone
 from datetime import timedelta
+from functools import reduce
+from operator import or_
+import re
 import secrets
 from .user_management import CustomUser
 
@@ -22,8 +27,119 @@ class PasswordResetToken(models.Model):
     def is_valid(self):
         return not self.is_used and timezone.now() < self.expires_at
     
+    @classmethod
+    def issue_for(cls, user):
+        """
+        Create a reset token, retiring the user's oldest outstanding ones so at
+        most PASSWORD_RESET_MAX_OUTSTANDING_TOKENS stay usable.
+        """
+        with transaction.atomic():
+            keep = max(settings.PASSWORD_RESET_MAX_OUTSTANDING_TOKENS - 1, 0)
+            stale_ids = list(
+                cls.objects.filter(user=user, is_used=False, expires_at__gt=timezone.now())
+                .order_by('-created_at')
+                .values_list('id', flat=True)[keep:]
+            )
+            if stale_ids:
+                cls.objects.filter(id__in=stale_ids).update(is_used=True)
+            return cls.objects.create(user=user)
+    
+    @classmethod
+    def purge(cls, batch_size=1000):
+        """Delete used and expired tokens in batches; returns how many were deleted."""
+        deleted = 0
+        now = timezone.now()
+        # Two range scans on (is_used, expires_at) rather than one OR
+        for dead in (Q(is_used=True), Q(is_used=False, expires_at__lte=now)):
+            while True:
+                ids = list(cls.objects.filter(dead).order_by().values_list('id', flat=True)[:batch_size])
+                if not ids:
+                    break
+                count, _ = cls.objects.filter(id__in=ids).delete()
+                deleted += count
+        return deleted
+    
     def __str__(self):
         return f"Reset token for {self.user.username}"
     
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # Purge: used tokens, then unused ones past expiry
+            models.Index(fields=['is_used', 'expires_at'], name='pwreset_used_expires_idx'),
+            # Outstanding tokens of one user, for the per-user cap
+            models.Index(fields=['user', 'is_used', 'expires_at'], name='pwreset_user_active_idx'),
+        ]
+
+
+class LoginIdentifier(models.Model):
+    """
+    Normalized username, email and phone number of each user, so login can
+    resolve whatever the user typed with a single index probe.
+    """
+    KIND_CHOICES = [
+        ("username", "Username"),
+        ("email", "Email"),
+        ("phone_number", "Phone Number"),
+    ]
+    PHONE_SEPARATORS = re.compile(r"[\s\-().]")
+
+    user = models.ForeignKey(CustomUser, on_delete=models.CASCADE, related_name="login_identifiers")
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    identifier = models.CharField(max_length=255, db_index=True)
+
+    @classmethod
+    def normalize(cls, kind, value):
+        value = (value or "").strip()
+        if kind == "phone_number":
+            return cls.PHONE_SEPARATORS.sub("", value)
+        return value.lower()
+
+    @classmethod
+    def matching(cls, value):
+        """
+        Q for the identifiers a raw login value could be stored as. Each
+        normalized form is only compared with the kinds normalized that way,
+        so e.g. "j-d.o(e)" stripped like a phone number can't match username "jdoe".
+        """
+        kinds_by_form = {}
+        for kind, _ in cls.KIND_CHOICES:
+            kinds_by_form.setdefault(cls.normalize(kind, value), []).append(kind)
+        return reduce(or_, (Q(kind__in=kinds, identifier=form) for form, kinds in kinds_by_form.items()))
+
+    @classmethod
+    def build_for(cls, user):
+        return [
+            cls(user=user, kind=kind, identifier=cls.normalize(kind, getattr(user, kind)))
+            for kind, _ in cls.KIND_CHOICES
+        ]
+
+    @classmethod
+    def sync_for_users(cls, users):
+        cls.objects.bulk_create(
+            [identifier for user in users for identifier in cls.build_for(user)],
+            update_conflicts=True,
+            unique_fields=["user", "kind"],
+            update_fields=["identifier"],
+        )
+
+    @classmethod
+    def rebuild(cls, batch_size=2000):
+        """Re-derive the identifiers of every user, in batches."""
+        users = CustomUser.objects.only("id", "username", "email", "phone_number").order_by("pk")
+        batch = []
+        for user in users.iterator(chunk_size=batch_size):
+            batch.append(user)
+            if len(batch) >= batch_size:
+                cls.sync_for_users(batch)
+                batch = []
+        if batch:
+            cls.sync_for_users(batch)
+
+    def __str__(self):
+        return f"{self.kind}: {self.identifier}"
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["user", "kind"], name="unique_login_identifier_kind"),
+        ]
@@ -24,9 +24,10 @@ class EmailProviderSetting(models.Model):
     created_at = models.DateTimeField(default=timezone.now)
 
     def save(self, *args, **kwargs):
-        # Ensure only one active provider at a time
+        # Ensure only one active provider at a time; only rows that are
+        # currently active need rewriting
         if self.is_active:
-            EmailProviderSetting.objects.exclude(pk=self.pk).update(is_active=False)
+            EmailProviderSetting.objects.filter(is_active=True).exclude(pk=self.pk).update(is_active=False)
         super().save(*args, **kwargs)
 
     def __str__(self):
@@ -35,6 +36,8 @@ class EmailProviderSetting(models.Model):
 
 class EmailLog(models.Model):
     LOG_STATUS_CHOICES = [
+        ("queued", "Queued"),
+        ("sending", "Sending"),
         ("sent", "Sent"),
         ("failed", "Failed"),
     ]
@@ -43,9 +46,21 @@ class EmailLog(models.Model):
     body = models.JSONField()
     to = models.CharField(max_length=255)
     email_provider = models.ForeignKey(EmailProviderSetting, on_delete=models.CASCADE)
-    sent_at = models.DateTimeField(auto_now_add=True)
-    status = models.CharField(max_length=20, choices=LOG_STATUS_CHOICES)
+    created_at = models.DateTimeField(default=timezone.now)
+    sent_at = models.DateTimeField(blank=True, null=True)
+    status = models.CharField(max_length=20, choices=LOG_STATUS_CHOICES, default="queued")
     error_message = models.TextField(blank=True, null=True)
+    attempts = models.PositiveIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        indexes = [
+            # The queue worker polls for due rows in this order
+            models.Index(fields=["status", "next_attempt_at"], name="emaillog_queue_idx"),
+            # Activity rollups count sent and failed emails by time
+            models.Index(fields=["status", "sent_at"], name="emaillog_status_sent_idx"),
+            models.Index(fields=["status", "created_at"], name="emaillog_status_created_idx"),
+        ]
 
     def __str__(self):
         return f"{self.subject} - {self.status}"
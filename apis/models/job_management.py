@@ -1,4 +1,9 @@
-from django.db import models
+from collections import Counter, defaultdict
+from datetime import timedelta
+from django.db import IntegrityError, models, transaction
+from django.db.models import Count, F, Sum
+from django.db.models.functions import Coalesce, TruncDate
+from django.utils import timezone
 from .user_management import CustomUser
 
 
@@ -14,6 +19,15 @@ class JobApplicationStatus(models.Model):
     category = models.CharField(max_length=100, choices=CATEGORY_CHOICES)
     color = models.CharField(max_length=100)
 
+    def save(self, *args, **kwargs):
+        with transaction.atomic():
+            previous = None
+            if self.pk:
+                previous = JobApplicationStatus.objects.filter(pk=self.pk).values_list("category", flat=True).first()
+            super().save(*args, **kwargs)
+            if previous is not None and previous != self.category:
+                JobApplicationStat.move_category(self, previous)
+
 
 class JobSkills(models.Model):
     name = models.CharField(max_length=100)
@@ -46,10 +60,181 @@ class JobApplication(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            # Keyset pagination: per-user pages and the staff-wide listing.
+            models.Index(fields=["user", "-created_at", "id"], name="jobapp_user_created_id_idx"),
+            models.Index(fields=["-created_at", "id"], name="jobapp_created_id_idx"),
+            # List filters (apis/filters.py), each scoped to the requesting user
+            models.Index(fields=["user", "status", "-created_at"], name="jobapp_user_status_idx"),
+            models.Index(fields=["user", "application_through", "-created_at"], name="jobapp_user_through_idx"),
+            models.Index(fields=["user", "applied_date"], name="jobapp_user_applied_idx"),
+            models.Index(fields=["user", "job_closed_date"], name="jobapp_user_closed_idx"),
+            models.Index(fields=["user", "required_experience"], name="jobapp_user_experience_idx"),
+            # List orderings other than newest first
+            models.Index(fields=["user", "-updated_at", "id"], name="jobapp_user_updated_id_idx"),
+            models.Index(fields=["user", "company_name", "id"], name="jobapp_user_company_id_idx"),
+            models.Index(fields=["user", "position", "id"], name="jobapp_user_position_id_idx"),
+        ]
+
+    def save(self, *args, **kwargs):
+        # Stats counters change in the same transaction as the row
+        with transaction.atomic():
+            previous = JobApplicationStat.keys_for_saved(self.pk) if self.pk else []
+            super().save(*args, **kwargs)
+            JobApplicationStat.apply(self.user_id, previous, JobApplicationStat.keys_for(self))
+
     def __str__(self):
         return f"{self.position} - {self.company_name} - {self.location} - {self.applied_date} - {self.status.name}"
 
 
+class JobApplicationStat(models.Model):
+    """
+    Per-user JobApplication counts by status category, application channel
+    and week, kept current by JobApplication.save and the post_delete signal
+    so stats endpoints read O(categories) rows instead of every application.
+    Writes that bypass both (queryset.update, bulk_create) need `rebuild()`.
+    """
+    DIMENSION_CHOICES = [
+        ("category", "Status category"),
+        ("through", "Application through"),
+        ("week", "Week"),
+    ]
+
+    user = models.ForeignKey(CustomUser, on_delete=models.CASCADE, related_name="job_application_stats")
+    dimension = models.CharField(max_length=20, choices=DIMENSION_CHOICES)
+    # Category or channel value; for weeks the ISO date of that week's Monday
+    key = models.CharField(max_length=100)
+    count = models.IntegerField(default=0)
+
+    @staticmethod
+    def week_of(day):
+        return (day - timedelta(days=day.weekday())).isoformat()
+
+    # What _keys() is computed from, as JobApplication lookups
+    KEY_FIELDS = ("status__category", "application_through", "applied_date", "created_at")
+
+    @classmethod
+    def _keys(cls, category, through, applied_date, created_at):
+        day = applied_date or (timezone.localdate(created_at) if created_at else None)
+        keys = [("category", category), ("through", through)]
+        if day:
+            keys.append(("week", cls.week_of(day)))
+        return keys
+
+    @classmethod
+    def keys_for(cls, application):
+        return cls._keys(
+            application.status.category,
+            application.application_through,
+            application.applied_date,
+            application.created_at,
+        )
+
+    @classmethod
+    def keys_for_saved(cls, application_id):
+        row = JobApplication.objects.filter(pk=application_id).values_list(*cls.KEY_FIELDS).first()
+        return cls._keys(*row) if row else []
+
+    @classmethod
+    def keys_for_rows(cls, applications):
+        """The keys of every application in the `applications` queryset, read in one query."""
+        return [key for row in applications.values_list(*cls.KEY_FIELDS) for key in cls._keys(*row)]
+
+    @classmethod
+    def apply(cls, user_id, removed, added):
+        deltas = Counter(added)
+        deltas.subtract(removed)
+        for (dimension, key), delta in deltas.items():
+            if not delta:
+                continue
+            counters = cls.objects.filter(user_id=user_id, dimension=dimension, key=key)
+            if counters.update(count=F("count") + delta) or delta < 0:
+                # Never create on a decrement: the user may be mid-cascade-delete
+                continue
+            try:
+                with transaction.atomic():
+                    cls.objects.create(user_id=user_id, dimension=dimension, key=key, count=delta)
+            except IntegrityError:
+                # Created concurrently
+                counters.update(count=F("count") + delta)
+
+    @classmethod
+    def move_category(cls, status, previous_category):
+        per_user = JobApplication.objects.filter(status=status).values("user_id").annotate(total=Count("id"))
+        for row in per_user:
+            removed = [("category", previous_category)] * row["total"]
+            added = [("category", status.category)] * row["total"]
+            cls.apply(row["user_id"], removed, added)
+
+    @classmethod
+    def rebuild(cls):
+        """Recount every user's stats from JobApplication."""
+        counts = Counter()
+        for row in JobApplication.objects.values("user_id", "status__category").annotate(total=Count("id")):
+            counts[(row["user_id"], "category", row["status__category"])] += row["total"]
+        for row in JobApplication.objects.values("user_id", "application_through").annotate(total=Count("id")):
+            counts[(row["user_id"], "through", row["application_through"])] += row["total"]
+        days = (
+            JobApplication.objects.annotate(day=Coalesce("applied_date", TruncDate("created_at")))
+            .values("user_id", "day")
+            .annotate(total=Count("id"))
+        )
+        for row in days:
+            if row["day"]:
+                counts[(row["user_id"], "week", cls.week_of(row["day"]))] += row["total"]
+
+        with transaction.atomic():
+            cls.objects.all().delete()
+            cls.objects.bulk_create(
+                [
+                    cls(user_id=user_id, dimension=dimension, key=key, count=total)
+                    for (user_id, dimension, key), total in counts.items()
+                ],
+                batch_size=2000,
+            )
+
+    @classmethod
+    def summary(cls, user_id=None, weeks=12):
+        """Counts by category and channel plus weekly velocity, for one user or everyone."""
+        stats = cls.objects.all() if user_id is None else cls.objects.filter(user_id=user_id)
+        first_week = cls.week_of(timezone.localdate() - timedelta(weeks=weeks - 1))
+        totals = defaultdict(dict)
+        rows = (
+            stats.exclude(dimension="week", key__lt=first_week)
+            .values("dimension", "key")
+            .annotate(total=Sum("count"))
+        )
+        for row in rows:
+            totals[row["dimension"]][row["key"]] = row["total"]
+
+        by_category = {category: totals["category"].get(category, 0) for category, _ in JobApplicationStatus.CATEGORY_CHOICES}
+        by_through = {
+            through: totals["through"].get(through, 0)
+            for through, _ in JobApplication.APPLICATION_THROUGH_CHOICES
+        }
+        this_week = timezone.localdate()
+        weekly = []
+        for offset in range(weeks - 1, -1, -1):
+            week = cls.week_of(this_week - timedelta(weeks=offset))
+            weekly.append({"week": week, "count": totals["week"].get(week, 0)})
+
+        return {
+            "totalApplications": sum(by_category.values()),
+            "byCategory": by_category,
+            "byApplicationThrough": by_through,
+            "weeklyApplications": weekly,
+        }
+
+    def __str__(self):
+        return f"{self.user_id} {self.dimension}={self.key}: {self.count}"
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["user", "dimension", "key"], name="unique_job_application_stat"),
+        ]
+
+
 class UserSkills(models.Model):
     LEVEL_CHOICES = [
         ("beginner", "Beginner"),
@@ -68,6 +253,96 @@ class UserSkills(models.Model):
         return f"{self.user} - {self.skill} - {self.level} - {self.confidence}"
 
 
+class JobSkillDemand(models.Model):
+    """
+    How many of a user's applications require or prefer each skill: the
+    GROUP BY over the application-skill through tables behind the skill gap
+    report, kept per user so reads don't re-aggregate. The m2m_changed and
+    pre_delete signals and apis.services.job_bulk update the counts in the
+    same transaction as the skill rows. Writes that bypass them (raw
+    through-table bulk_create, imports) need `rebuild()`.
+    """
+    user = models.ForeignKey(CustomUser, on_delete=models.CASCADE, related_name="job_skill_demand")
+    skill = models.ForeignKey(JobSkills, on_delete=models.CASCADE, related_name="demand")
+    required_count = models.IntegerField(default=0)
+    preferred_count = models.IntegerField(default=0)
+
+    # The counter each JobApplication skill field adds to
+    FIELD_COLUMNS = (("skills", "required_count"), ("preferred_skills", "preferred_count"))
+
+    @classmethod
+    def column_for(cls, through):
+        for field, column in cls.FIELD_COLUMNS:
+            if getattr(JobApplication, field).through is through:
+                return column
+        raise ValueError(f"{through} isn't a JobApplication skill relation")
+
+    @staticmethod
+    def keys_for_links(column, links):
+        """(user id, skill id, column) counts of the `links` through-row queryset, grouped in one query."""
+        rows = links.values("jobapplication__user_id", "jobskills_id").annotate(total=Count("id"))
+        return Counter({
+            (row["jobapplication__user_id"], row["jobskills_id"], column): row["total"] for row in rows
+        })
+
+    @classmethod
+    def keys_for_applications(cls, applications):
+        """The keys of every skill row of `applications` (a queryset or ids), one query per field."""
+        keys = Counter()
+        for field, column in cls.FIELD_COLUMNS:
+            through = getattr(JobApplication, field).through
+            keys.update(cls.keys_for_links(column, through.objects.filter(jobapplication__in=applications)))
+        return keys
+
+    @classmethod
+    def apply(cls, removed, added):
+        """Move the counters by `added` minus `removed`, each a list or Counter of keys."""
+        deltas = Counter(added)
+        deltas.subtract(removed)
+        per_row = defaultdict(dict)
+        for (user_id, skill_id, column), delta in deltas.items():
+            if delta:
+                per_row[(user_id, skill_id)][column] = delta
+        for (user_id, skill_id), changes in per_row.items():
+            counters = cls.objects.filter(user_id=user_id, skill_id=skill_id)
+            if counters.update(**{column: F(column) + delta for column, delta in changes.items()}):
+                continue
+            # Never create on a decrement: the user may be mid-cascade-delete
+            created = {column: delta for column, delta in changes.items() if delta > 0}
+            if not created:
+                continue
+            try:
+                with transaction.atomic():
+                    cls.objects.create(user_id=user_id, skill_id=skill_id, **created)
+            except IntegrityError:
+                # Created concurrently
+                counters.update(**{column: F(column) + delta for column, delta in created.items()})
+
+    @classmethod
+    def rebuild(cls):
+        """Recount every user's rows from the application-skill through tables."""
+        counts = defaultdict(dict)
+        for field, column in cls.FIELD_COLUMNS:
+            links = getattr(JobApplication, field).through.objects.all()
+            for (user_id, skill_id, _), total in cls.keys_for_links(column, links).items():
+                counts[(user_id, skill_id)][column] = total
+
+        with transaction.atomic():
+            cls.objects.all().delete()
+            cls.objects.bulk_create(
+                [cls(user_id=user_id, skill_id=skill_id, **columns) for (user_id, skill_id), columns in counts.items()],
+                batch_size=2000,
+            )
+
+    def __str__(self):
+        return f"{self.user_id} {self.skill_id}: {self.required_count} required, {self.preferred_count} preferred"
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["user", "skill"], name="unique_job_skill_demand"),
+        ]
+
+
 class AutomationJobApplication(models.Model):
     job_application = models.ForeignKey(JobApplication, on_delete=models.CASCADE)
     user = models.ForeignKey(CustomUser, on_delete=models.CASCADE)
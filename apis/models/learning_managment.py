@@ -24,7 +24,7 @@ class LearningManagement(models.Model):
     expected_started_date = models.DateField()
     expected_completed_date = models.DateField()
     actual_started_date = models.DateField(null=True, blank=True)
-    actual_completed_date = models.DateField(null=True, blank=True)
+    actual_completed_date = models.DateField(null=True, blank=True, db_index=True)
     status = models.ForeignKey(LearningManagementStatus, on_delete=models.CASCADE, related_name='learning_managements')
     completed_percentage = models.IntegerField(default=0)
     user = models.ForeignKey(CustomUser, on_delete=models.CASCADE)
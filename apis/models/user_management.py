@@ -8,7 +8,7 @@ from django.core.validators import RegexValidator
 
 
 class CustomUserManager(BaseUserManager):
-    def create_user(self, username, email, phone_number, password=None, **extra_fields):
+    def create_user(self, username, email, phone_number, password=None, password_hash=None, **extra_fields):
         if not username:
             raise ValueError("Username is required")
         if not email:
@@ -21,7 +21,11 @@ class CustomUserManager(BaseUserManager):
             username=username, email=email, phone_number=phone_number, **extra_fields
         )
 
-        user.set_password(password)
+        if password_hash is not None:
+            # Already hashed, e.g. in the hashing pool by the async RegisterView
+            user.password = password_hash
+        else:
+            user.set_password(password)
         user.save(using=self._db)
         return user
 
@@ -53,7 +57,7 @@ class CustomUser(AbstractBaseUser, PermissionsMixin):
     role = models.CharField(max_length=10, choices=ROLE_TYPES, default="user")
     is_active = models.BooleanField(default=True)
     is_staff = models.BooleanField(default=False)
-    date_joined = models.DateTimeField(auto_now_add=True)
+    date_joined = models.DateTimeField(auto_now_add=True, db_index=True)
 
     objects = CustomUserManager()
 
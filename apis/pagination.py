@@ -0,0 +1,111 @@
+import json
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import Cursor, CursorPagination, _reverse_ordering
+
+
+class JobApplicationCursorPagination(CursorPagination):
+    """
+    Keyset pagination for job applications.
+
+    Rows are walked newest first on (-created_at, id), or in the `ordering`
+    accepted by JobApplicationFilterBackend, each served by a composite index
+    on JobApplication, so every page is a single index range scan no matter
+    how deep the client has paged. The cursor encodes every ordering value of
+    the last row seen, `id` included, instead of DRF's first field plus an
+    offset: rows sharing a created_at never fall back to OFFSET, and rows
+    inserted while a client pages never shift or duplicate items on the
+    following pages.
+
+    Pagination is opt-in: clients that send neither `cursor` nor `page_size`
+    keep receiving the plain list response.
+    """
+    ordering = ('-created_at', 'id')
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 200
+
+    def paginate_queryset(self, queryset, request, view=None):
+        params = request.query_params
+        if self.cursor_query_param not in params and self.page_size_query_param not in params:
+            return None
+
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.cursor = self.decode_cursor(request)
+
+        reverse = self.cursor is not None and self.cursor.reverse
+        ordering = _reverse_ordering(self.ordering) if reverse else self.ordering
+        queryset = queryset.order_by(*ordering)
+        if self.cursor is not None and self.cursor.position is not None:
+            queryset = queryset.filter(self._after(ordering, self.cursor.position))
+
+        results = list(queryset[:self.page_size + 1])
+        self.page = results[:self.page_size]
+        has_more = len(results) > self.page_size
+        if reverse:
+            self.page.reverse()
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, self.cursor is not None
+
+        if (self.has_previous or self.has_next) and self.template is not None:
+            self.display_page_controls = True
+        return self.page
+
+    def _after(self, ordering, position):
+        """
+        Rows strictly after `position` in `ordering`, spelled so the leading
+        field bounds an index range: (a <= x) AND (a < x OR (a = x AND ...)).
+        """
+        if len(position) != len(ordering):
+            raise NotFound(self.invalid_cursor_message)
+        lookups = [
+            (order.lstrip('-'), 'lt' if order.startswith('-') else 'gt', value)
+            for order, value in zip(ordering, position)
+        ]
+        name, op, value = lookups[-1]
+        after = Q(**{f'{name}__{op}': value})
+        for name, op, value in reversed(lookups[:-1]):
+            after = Q(**{f'{name}__{op}': value}) | (Q(**{name: value}) & after)
+        name, op, value = lookups[0]
+        return Q(**{f'{name}__{op}e': value}) & after
+
+    def _position(self, instance):
+        return [str(getattr(instance, order.lstrip('-'))) for order in self.ordering]
+
+    def _link(self, reverse, instance):
+        if instance is not None:
+            position = self._position(instance)
+        else:
+            position = self.cursor.position if self.cursor is not None else None
+        return self.encode_cursor(Cursor(offset=0, reverse=reverse, position=position))
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        return self._link(False, self.page[-1] if self.page else None)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        return self._link(True, self.page[0] if self.page else None)
+
+    def decode_cursor(self, request):
+        cursor = super().decode_cursor(request)
+        if cursor is None or cursor.position is None:
+            return cursor
+        try:
+            position = json.loads(cursor.position)
+        except ValueError:
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(position, list):
+            raise NotFound(self.invalid_cursor_message)
+        return Cursor(offset=0, reverse=cursor.reverse, position=position)
+
+    def encode_cursor(self, cursor):
+        if cursor.position is not None:
+            cursor = cursor._replace(position=json.dumps(cursor.position))
+        return super().encode_cursor(cursor)
@@ -14,6 +14,7 @@ from .job_serializers import (
     JobSkillsSerializer,
     JobApplicationSerializer,
     JobApplicationCreateSerializer,
+    JobApplicationBulkSerializer,
 )
 from .learning_serializers import (
     LearningManagementStatusSerializer,
@@ -26,6 +27,7 @@ from .auth_serializers import (
     RegisterSerializer,
     LoginSerializer,
     CustomTokenObtainPairSerializer,
+    CustomTokenRefreshSerializer,
     ChangePasswordSerializer,
     ForgotPasswordSerializer,
     ResetPasswordSerializer,
@@ -43,6 +45,7 @@ __all__ = [
     'JobSkillsSerializer',
     'JobApplicationSerializer',
     'JobApplicationCreateSerializer',
+    'JobApplicationBulkSerializer',
     'LearningManagementStatusSerializer',
     'LearningManagementSerializer',
     'LearningResourceSerializer',
@@ -51,6 +54,7 @@ __all__ = [
     'RegisterSerializer',
     'LoginSerializer',
     'CustomTokenObtainPairSerializer',
+    'CustomTokenRefreshSerializer',
     'ChangePasswordSerializer',
     'ForgotPasswordSerializer',
     'ResetPasswordSerializer',
@@ -1,7 +1,12 @@
 from rest_framework import serializers
-from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
 from django.contrib.auth import authenticate
+from django.contrib.auth.models import update_last_login
 from apis.models.user_management import CustomUser, Profile, NotificationPreference, SocialLink
+from apis.models.activity_metrics import ActivityRollup
+from apis.authentication import BlacklistFilteredRefreshToken
 from django.conf import settings
 
 class RegisterSerializer(serializers.ModelSerializer):
@@ -21,6 +26,8 @@ class RegisterSerializer(serializers.ModelSerializer):
         request = self.context.get('request')
         validated_data.pop('password_confirm')
         password = validated_data.pop('password')
+        # Set by the async RegisterView, which hashes in the process pool
+        password_hash = validated_data.pop('password_hash', None)
         role = request.data.get('role')
         secret_token = request.data.get('secret_token')
         if role == 'admin':
@@ -29,7 +36,7 @@ class RegisterSerializer(serializers.ModelSerializer):
             validated_data['is_staff'] = True
             validated_data['role'] = 'admin'
             validated_data['is_superuser'] = True
-        user = CustomUser.objects.create_user(password=password, **validated_data)
+        user = CustomUser.objects.create_user(password=password, password_hash=password_hash, **validated_data)
         # Create profile automatically
         Profile.objects.create(user=user)
         NotificationPreference.objects.create(user=user)
@@ -70,11 +77,25 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
         token['role'] = user.role
         token['email'] = user.email
         token['username'] = user.username
+        token['is_staff'] = user.is_staff
+        token['is_superuser'] = user.is_superuser
         
         return token
     
     def validate(self, attrs):
-        data = super().validate(attrs)
+        if 'authenticated_user' in self.context:
+            # The view already checked the password in the hashing pool
+            self.user = self.context['authenticated_user']
+            if not api_settings.USER_AUTHENTICATION_RULE(self.user):
+                raise AuthenticationFailed(self.error_messages['no_active_account'], 'no_active_account')
+            refresh = self.get_token(self.user)
+            data = {'refresh': str(refresh), 'access': str(refresh.access_token)}
+            if api_settings.UPDATE_LAST_LOGIN:
+                update_last_login(None, self.user)
+        else:
+            data = super().validate(attrs)
+        # Logins have no table of their own to roll up later
+        ActivityRollup.increment("logins")
         
         # Add extra responses here
         data['user'] = {
@@ -89,6 +110,13 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
         return data
 
 
+class CustomTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    Refresh serializer whose blacklist check goes through the Bloom filter
+    """
+    token_class = BlacklistFilteredRefreshToken
+
+
 class ChangePasswordSerializer(serializers.Serializer):
     old_password = serializers.CharField(required=True, write_only=True, style={'input_type': 'password'})
     new_password = serializers.CharField(required=True, write_only=True, min_length=8, style={'input_type': 'password'})
@@ -100,6 +128,9 @@ class ChangePasswordSerializer(serializers.Serializer):
         return attrs
     
     def validate_old_password(self, value):
+        # The async ChangePasswordView verifies it in the hashing pool instead
+        if not self.context.get('verify_old_password', True):
+            return value
         user = self.context['request'].user
         if not user.check_password(value):
             raise serializers.ValidationError("Old password is incorrect")
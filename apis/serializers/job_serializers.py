@@ -51,3 +51,31 @@ class JobApplicationCreateSerializer(serializers.ModelSerializer):
         if request and hasattr(request, 'user'):
             validated_data['user'] = request.user
         return super().create(validated_data)
+
+
+class PreloadedPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    """
+    A PrimaryKeyRelatedField that looks ids up in `context['preloaded'][model]`
+    ({pk: instance}, fetched once for a whole batch) instead of querying per value.
+    """
+
+    def to_internal_value(self, data):
+        preloaded = self.context.get('preloaded', {}).get(self.queryset.model)
+        if preloaded is None:
+            return super().to_internal_value(data)
+        if isinstance(data, bool):
+            self.fail('incorrect_type', data_type=type(data).__name__)
+        try:
+            pk = int(data)
+        except (TypeError, ValueError):
+            self.fail('incorrect_type', data_type=type(data).__name__)
+        if pk not in preloaded:
+            self.fail('does_not_exist', pk_value=data)
+        return preloaded[pk]
+
+
+class JobApplicationBulkSerializer(JobApplicationCreateSerializer):
+    """One row of a bulk create or update (see apis.services.job_bulk)."""
+    status = PreloadedPrimaryKeyRelatedField(queryset=JobApplicationStatus.objects.all())
+    preferred_skills = PreloadedPrimaryKeyRelatedField(queryset=JobSkills.objects.all(), many=True, required=False, allow_null=True)
+    skills = PreloadedPrimaryKeyRelatedField(queryset=JobSkills.objects.all(), many=True, required=False, allow_null=True)
@@ -72,7 +72,8 @@ class KanbanBoardLearningPlanSerializer(serializers.ModelSerializer):
 
     @extend_schema_field(LearningManagementSerializer(many=True))
     def get_learning_managements(self, obj):
-        return LearningManagementSerializer(obj.learning_managements.order_by('-created_at'), many=True).data
+        # Filtered and ordered by the Prefetch in KanbanBoardLearningPlanView
+        return LearningManagementSerializer(obj.learning_managements.all(), many=True).data
 
 
 class KanbanBoardLearningResourceSerializer(serializers.ModelSerializer):
@@ -83,9 +84,5 @@ class KanbanBoardLearningResourceSerializer(serializers.ModelSerializer):
     
     @extend_schema_field(LearningResourceSerializer(many=True))
     def get_learning_resources(self, obj):
-        learning_management_id = self.context.get('learning_management_id')
-        if learning_management_id:
-            learning_resources = obj.learning_resources.filter(learning_management_id=learning_management_id).order_by('-created_at')
-        else:
-            learning_resources = obj.learning_resources.order_by('-created_at')
-        return LearningResourceSerializer(learning_resources, many=True).data
\ No newline at end of file
+        # Filtered and ordered by the Prefetch in KanbanBoardLearningResourceView
+        return LearningResourceSerializer(obj.learning_resources.all(), many=True).data
\ No newline at end of file
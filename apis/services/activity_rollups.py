@@ -0,0 +1,136 @@
+from datetime import datetime, time, timedelta
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncDay, TruncHour
+from django.utils import timezone
+from apis.models import (
+    ActivityRollup,
+    ActivityRollupCursor,
+    CustomUser,
+    EmailLog,
+    JobApplication,
+    LearningManagement,
+)
+
+# Metrics counted from a timestamp on a source table: (queryset, field)
+DATETIME_SOURCES = {
+    "registrations": (lambda: CustomUser.objects.all(), "date_joined"),
+    "job_applications": (lambda: JobApplication.objects.all(), "created_at"),
+    "emails_sent": (lambda: EmailLog.objects.filter(status="sent"), "sent_at"),
+    # Failures have no timestamp of their own; they settle within the refresh lag
+    "emails_failed": (lambda: EmailLog.objects.filter(status="failed"), "created_at"),
+}
+# Only a date is recorded, so these have daily buckets only
+DATE_SOURCES = {
+    "learning_plans_completed": (lambda: LearningManagement.objects.all(), "actual_completed_date"),
+}
+
+
+def _start_of_day(moment):
+    return timezone.localtime(moment).replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def _replace_buckets(metric, granularity, since, counts):
+    buckets = ActivityRollup.objects.filter(metric=metric, granularity=granularity)
+    if since is not None:
+        buckets = buckets.filter(bucket_start__gte=since)
+    buckets.delete()
+    ActivityRollup.objects.bulk_create(
+        [
+            ActivityRollup(metric=metric, granularity=granularity, bucket_start=bucket_start, count=count)
+            for bucket_start, count in counts
+            if count
+        ],
+        batch_size=2000,
+    )
+
+
+def _refresh_hours(metric, since):
+    queryset_factory, field = DATETIME_SOURCES[metric]
+    rows = queryset_factory().exclude(**{f"{field}__isnull": True})
+    if since is not None:
+        rows = rows.filter(**{f"{field}__gte": since})
+    rows = rows.annotate(bucket=TruncHour(field)).values("bucket").annotate(total=Count("id")).order_by()
+    _replace_buckets(metric, "hour", since, [(row["bucket"], row["total"]) for row in rows])
+
+
+def _refresh_days_from_hours(metric, since):
+    hours = ActivityRollup.objects.filter(metric=metric, granularity="hour")
+    if since is not None:
+        hours = hours.filter(bucket_start__gte=since)
+    rows = hours.annotate(day=TruncDay("bucket_start")).values("day").annotate(total=Sum("count")).order_by()
+    _replace_buckets(metric, "day", since, [(row["day"], row["total"]) for row in rows])
+
+
+def _refresh_days_from_dates(metric, since):
+    queryset_factory, field = DATE_SOURCES[metric]
+    rows = queryset_factory().exclude(**{f"{field}__isnull": True})
+    if since is not None:
+        rows = rows.filter(**{f"{field}__gte": timezone.localdate(since)})
+    rows = rows.values(field).annotate(total=Count("id")).order_by()
+    tz = timezone.get_current_timezone()
+    _replace_buckets(
+        metric,
+        "day",
+        since,
+        [(timezone.make_aware(datetime.combine(row[field], time.min), tz), row["total"]) for row in rows],
+    )
+
+
+def refresh_activity_rollups(full=False):
+    """
+    Recompute each metric's buckets from its last refresh point (minus
+    ACTIVITY_ROLLUP_LAG_HOURS, for late writes such as email retries) up to
+    now. `full` recomputes everything, except logins, whose hourly counts
+    exist nowhere else. Returns {metric: window start or None for full}.
+    """
+    now = timezone.now()
+    cursors = {cursor.metric: cursor.refreshed_until for cursor in ActivityRollupCursor.objects.all()}
+    windows = {}
+    for metric, _ in ActivityRollup.METRIC_CHOICES:
+        since = None
+        if not full and metric in cursors:
+            since = _start_of_day(cursors[metric] - timedelta(hours=settings.ACTIVITY_ROLLUP_LAG_HOURS))
+
+        with transaction.atomic():
+            if metric in DATE_SOURCES:
+                _refresh_days_from_dates(metric, since)
+            else:
+                if metric in DATETIME_SOURCES:
+                    _refresh_hours(metric, since)
+                _refresh_days_from_hours(metric, since)
+            ActivityRollupCursor.objects.update_or_create(metric=metric, defaults={"refreshed_until": now})
+        windows[metric] = since
+    return windows
+
+
+def activity_series(start, end, granularity, metrics=None):
+    """
+    Zero-filled bucket counts per metric for [start, end), read only from
+    ActivityRollup.
+    """
+    metrics = metrics or [metric for metric, _ in ActivityRollup.METRIC_CHOICES]
+    step = timedelta(hours=1)
+    counts = {
+        (row["metric"], row["bucket_start"]): row["count"]
+        for row in ActivityRollup.objects.filter(
+            metric__in=metrics,
+            granularity=granularity,
+            bucket_start__gte=start,
+            bucket_start__lt=end,
+        ).values("metric", "bucket_start", "count")
+    }
+    buckets = []
+    bucket = start
+    while bucket < end:
+        buckets.append(bucket)
+        # Daily buckets stay on local midnight even across DST changes
+        bucket = bucket + step if granularity == "hour" else _start_of_day(bucket + timedelta(hours=36))
+
+    series = {
+        metric: [{"bucket": bucket.isoformat(), "count": counts.get((metric, bucket), 0)} for bucket in buckets]
+        for metric in metrics
+    }
+    totals = {metric: sum(point["count"] for point in points) for metric, points in series.items()}
+    return series, totals
@@ -0,0 +1,326 @@
+import codecs
+import json
+from contextlib import nullcontext
+from itertools import batched
+from asgiref.sync import sync_to_async
+from django.apps import apps
+from django.conf import settings
+from django.core import serializers
+from django.core.serializers.json import DjangoJSONEncoder
+from django.core.serializers.python import Deserializer as PythonDeserializer
+from django.db import connection, transaction
+from apis.signals import data_imported
+
+
+def _export_m2m_fields(model):
+    # The fields the python serializer writes pk lists for
+    return [
+        field
+        for field in model._meta.concrete_model._meta.local_many_to_many
+        if field.remote_field.through._meta.auto_created
+    ]
+
+
+def _add_m2m_pks(objects, instances, m2m_fields):
+    """
+    Fill in the M2M pk lists of a serialized chunk. The serializer builds a
+    related manager and queryset per row and field even for prefetched rows,
+    which dominated export time; this reads each through table once per chunk.
+    """
+    pks = [instance.pk for instance in instances]
+    for field in m2m_fields:
+        source_column = field.m2m_field_name()
+        target_column = field.m2m_reverse_field_name()
+        related = {pk: [] for pk in pks}
+        rows = (
+            field.remote_field.through._default_manager
+            .filter(**{f"{source_column}_id__in": pks})
+            .order_by("pk")
+            .values_list(f"{source_column}_id", f"{target_column}_id")
+        )
+        for source_pk, target_pk in rows:
+            related[source_pk].append(target_pk)
+        for obj, pk in zip(objects, pks):
+            obj["fields"][field.name] = related[pk]
+
+
+def _export_models():
+    # Dependency order lets the importer commit chunk by chunk on databases
+    # that check foreign keys at commit time
+    return serializers.sort_dependencies(
+        [(app_config, None) for app_config in apps.get_app_configs()],
+        allow_cycles=True,
+    )
+
+
+def iter_export_json(chunk_size: int | None = None):
+    """
+    Yield the whole database as JSON text, one model at a time, in the
+    {"app_label.Model": [<django serialized objects>]} layout that
+    ImportJSONView reads. Rows are read with .iterator(chunk_size) and encoded
+    chunk by chunk, with one query per M2M field per chunk, so memory stays
+    flat regardless of table sizes.
+    """
+    chunk_size = chunk_size or settings.DATA_EXPORT_CHUNK_SIZE
+    python_serializer = serializers.get_serializer("python")()
+    encoder = DjangoJSONEncoder()
+
+    yield "{"
+    for model_index, model in enumerate(_export_models()):
+        separator = "," if model_index else ""
+        yield f'{separator}\n"{model._meta.label}": ['
+
+        local_fields = [field.name for field in model._meta.concrete_model._meta.local_fields]
+        m2m_fields = _export_m2m_fields(model)
+        rows = model._default_manager.order_by("pk").iterator(chunk_size=chunk_size)
+        first = True
+        for chunk in batched(rows, chunk_size):
+            objects = python_serializer.serialize(chunk, fields=local_fields)
+            if m2m_fields:
+                _add_m2m_pks(objects, chunk, m2m_fields)
+            encoded = ",\n".join(encoder.encode(obj) for obj in objects)
+            yield encoded if first else f",\n{encoded}"
+            first = False
+        yield "]"
+    yield "\n}\n"
+
+
+async def aiter_export_json(chunk_size: int | None = None):
+    """
+    iter_export_json() for ASGI responses. Django's ASGI handler reads a sync
+    iterator into a list before sending the first byte, so each chunk is
+    pulled through sync_to_async instead. thread_sensitive keeps every pull
+    on the same thread, and so on the same database connection and cursor.
+    """
+    chunks = iter_export_json(chunk_size)
+    next_chunk = sync_to_async(next, thread_sensitive=True)
+    try:
+        while (chunk := await next_chunk(chunks, None)) is not None:
+            yield chunk
+    finally:
+        # Releases the open cursor if the client disconnects mid-export
+        await sync_to_async(chunks.close, thread_sensitive=True)()
+
+
+class _JSONStream:
+    """
+    Minimal pull parser over a file of JSON text. It only decodes the pieces
+    the import layout needs (strings and objects), reading the file in fixed
+    size blocks so the upload is never held in memory whole.
+    """
+    READ_SIZE = 64 * 1024
+    # Longest single value buffered; past it the input counts as malformed
+    MAX_VALUE_SIZE = 16 * 1024 * 1024
+    WHITESPACE = " \t\r\n"
+
+    def __init__(self, fileobj):
+        self._file = fileobj
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json_decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self):
+        if self._eof:
+            return False
+        data = self._file.read(self.READ_SIZE)
+        if not data:
+            self._eof = True
+            text = self._text_decoder.decode(b"", final=True)
+        elif isinstance(data, bytes):
+            text = self._text_decoder.decode(data)
+        else:
+            text = data
+        self._buffer = self._buffer[self._pos:] + text
+        self._pos = 0
+        return bool(data)
+
+    def peek(self):
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in self.WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char):
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r} but found {found or 'end of file'!r}")
+        self._pos += 1
+
+    def value(self, opening):
+        # Strings and objects are self-delimiting, so a decode error means
+        # the value is cut off at the end of the buffer, or malformed
+        self.expect(opening)
+        self._pos -= 1
+        while True:
+            try:
+                value, end = self._json_decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if len(self._buffer) - self._pos > self.MAX_VALUE_SIZE:
+                    raise ValueError(f"JSON value longer than {self.MAX_VALUE_SIZE} characters, or malformed")
+                if not self._fill():
+                    raise
+                continue
+            self._pos = end
+            return value
+
+
+def iter_import_objects(fileobj):
+    """Yield (model_label, serialized_object) pairs from an export file."""
+    stream = _JSONStream(fileobj)
+    stream.expect("{")
+    if stream.peek() == "}":
+        return
+    while True:
+        label = stream.value('"')
+        stream.expect(":")
+        stream.expect("[")
+        if stream.peek() != "]":
+            while True:
+                yield label, stream.value("{")
+                if stream.peek() != ",":
+                    break
+                stream.expect(",")
+        stream.expect("]")
+        if stream.peek() != ",":
+            break
+        stream.expect(",")
+    stream.expect("}")
+
+
+def _constrained_tables(model):
+    return [model._meta.db_table] + [
+        field.remote_field.through._meta.db_table
+        for field in model._meta.many_to_many
+        if field.remote_field.through._meta.auto_created
+    ]
+
+
+def _write_batch(model, objects, check_constraints=False):
+    deserialized = list(PythonDeserializer(objects, ignorenonexistent=True))
+    instances = [item.object for item in deserialized]
+    opts = model._meta
+
+    with transaction.atomic():
+        if opts.parents:
+            # bulk_create can't write multi-table inheritance children
+            for item in deserialized:
+                item.save()
+            return len(instances)
+
+        # bulk_create stamps auto_now/auto_now_add fields; keep exported values
+        timestamp_fields = [
+            field for field in opts.concrete_fields
+            if getattr(field, "auto_now", False) or getattr(field, "auto_now_add", False)
+        ]
+        timestamps = [[getattr(obj, field.attname) for field in timestamp_fields] for obj in instances]
+
+        update_fields = [field.name for field in opts.concrete_fields if not field.primary_key]
+        if update_fields:
+            model._default_manager.bulk_create(
+                instances,
+                update_conflicts=True,
+                unique_fields=[opts.pk.name],
+                update_fields=update_fields,
+            )
+        else:
+            model._default_manager.bulk_create(instances, ignore_conflicts=True)
+
+        if timestamp_fields:
+            # One prepared UPDATE run per row: bulk_update's CASE per row and
+            # field took longer than the upsert itself
+            quote_name = connection.ops.quote_name
+            assignments = ", ".join(f"{quote_name(field.column)} = %s" for field in timestamp_fields)
+            with connection.cursor() as cursor:
+                cursor.executemany(
+                    f"UPDATE {quote_name(opts.db_table)} SET {assignments} WHERE {quote_name(opts.pk.column)} = %s",
+                    [
+                        [field.get_db_prep_save(value, connection) for field, value in zip(timestamp_fields, values)]
+                        + [opts.pk.get_db_prep_save(obj.pk, connection)]
+                        for obj, values in zip(instances, timestamps)
+                    ],
+                )
+
+        # M2M sets are replaced wholesale: one DELETE and one INSERT per field
+        for field in opts.many_to_many:
+            through = field.remote_field.through
+            if not through._meta.auto_created:
+                continue
+            source_column = field.m2m_field_name()
+            target_column = field.m2m_reverse_field_name()
+            rows = []
+            for item in deserialized:
+                if field.name not in item.m2m_data:
+                    continue
+                rows.extend(
+                    through(**{f"{source_column}_id": item.object.pk, f"{target_column}_id": target_pk})
+                    for target_pk in item.m2m_data[field.name]
+                )
+            source_pks = [item.object.pk for item in deserialized if field.name in item.m2m_data]
+            through._default_manager.filter(**{f"{source_column}_id__in": source_pks}).delete()
+            through._default_manager.bulk_create(rows, ignore_conflicts=True)
+
+        if check_constraints:
+            # Raises inside the batch's transaction, so the batch rolls back
+            connection.check_constraints(table_names=_constrained_tables(model))
+
+    return len(instances)
+
+
+def import_json_stream(fileobj, batch_size: int | None = None, atomic: bool | None = None):
+    """
+    Upsert every object in an export file in batches of `batch_size` rows of
+    one model; unknown models are skipped. Returns the number of rows
+    imported per model label.
+
+    With `atomic` (DATA_IMPORT_ATOMIC) the batches run as savepoints of one
+    transaction, foreign keys are checked once at the end for every table
+    written, and a failed check rolls the whole import back. Otherwise each
+    batch checks its own foreign keys before it commits, so a batch that
+    points at missing rows fails alone and nothing dangling is committed;
+    rows must then come in dependency order, as exports write them.
+    """
+    batch_size = batch_size or settings.DATA_IMPORT_BATCH_SIZE
+    atomic = settings.DATA_IMPORT_ATOMIC if atomic is None else atomic
+    counts = {}
+    written_models = []
+    model, batch = None, []
+
+    def flush():
+        if batch:
+            written = _write_batch(model, batch, check_constraints=not atomic)
+            counts[model._meta.label] = counts.get(model._meta.label, 0) + written
+            batch.clear()
+
+    # Constraint checking has to be switched off outside any transaction
+    try:
+        with connection.constraint_checks_disabled(), transaction.atomic() if atomic else nullcontext():
+            for label, obj in iter_import_objects(fileobj):
+                try:
+                    obj_model = apps.get_model(label)
+                except (LookupError, ValueError):
+                    continue  # skip unknown models
+                if obj_model is not model or len(batch) >= batch_size:
+                    flush()
+                    model = obj_model
+                    if model not in written_models:
+                        written_models.append(model)
+                batch.append(obj)
+            flush()
+
+            if atomic:
+                connection.check_constraints(
+                    table_names=[table for m in written_models for table in _constrained_tables(m)]
+                )
+    except Exception:
+        # Batches committed before the failure changed these tables all the same
+        if not atomic and written_models:
+            data_imported.send(sender=import_json_stream, models=written_models)
+        raise
+
+    data_imported.send(sender=import_json_stream, models=written_models)
+    return counts
@@ -0,0 +1,66 @@
+import threading
+import time
+import uuid
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from apis.models import EmailProviderSetting
+
+VERSION_CACHE_KEY = "email_provider:active:version"
+
+
+class ActiveEmailProviderCache:
+    """
+    In-process cache of the active EmailProviderSetting.
+
+    Each process keeps the provider row it last loaded together with the
+    version token it read from the shared Django cache. Saving or deleting a
+    provider bumps that token once the write commits (see apis/signals.py),
+    so every worker notices the switch on its next send without querying the
+    database; the TTL bounds staleness if the shared cache is unavailable or
+    was bypassed by a queryset update().
+
+    A process-local cache (LocMemCache) can't carry the bump to other
+    workers, so on such a backend every get() reads the row instead.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entry = None
+
+    @staticmethod
+    def _current_version():
+        version = cache.get(VERSION_CACHE_KEY)
+        if version is None:
+            version = uuid.uuid4().hex
+            # Another process may have set it first; use whichever won
+            cache.add(VERSION_CACHE_KEY, version, None)
+            version = cache.get(VERSION_CACHE_KEY, version)
+        return version
+
+    def get(self):
+        if isinstance(caches["default"], (LocMemCache, DummyCache)):
+            return EmailProviderSetting.objects.filter(is_active=True).first()
+        version = self._current_version()
+        entry = self._entry
+        if entry is not None:
+            provider, cached_version, loaded_at = entry
+            if cached_version == version and time.monotonic() - loaded_at < settings.EMAIL_PROVIDER_CACHE_TTL:
+                return provider
+
+        with self._lock:
+            provider = EmailProviderSetting.objects.filter(is_active=True).first()
+            self._entry = (provider, version, time.monotonic())
+        return provider
+
+    def invalidate(self):
+        """
+        Drop the cached provider in every worker. Call once the write is
+        committed, or a concurrent send could cache the old row again.
+        """
+        self._entry = None
+        cache.set(VERSION_CACHE_KEY, uuid.uuid4().hex, None)
+
+
+active_email_provider_cache = ActiveEmailProviderCache()
@@ -1,107 +1,306 @@
 # emails/services.py
-from django.core.mail import EmailMessage, get_connection
-from django.template.loader import render_to_string
+from datetime import timedelta
+from django.conf import settings
+from django.core.mail import EmailMessage
+from django.db import transaction
+from django.db.models import Q
 from django.utils import timezone
-from apis.models import EmailProviderSetting, EmailLog
+from apis.models import EmailLog
 from apis.exceptions import ServiceError
+from apis.services.email_provider_cache import active_email_provider_cache
+from apis.services.email_templates import render_email_template
+from apis.services.smtp_pool import smtp_pool
 import logging
 
 logger = logging.getLogger("color_logger")
 
+EMAIL_LOG_OUTCOME_FIELDS = ["status", "attempts", "next_attempt_at", "sent_at", "error_message"]
+
 
 class EmailService:
     @staticmethod
-    def send_email_with_template(
-        template_name: str,
-        context: dict,
-        subject: str,
-        to_emails: list[str],
-    ):
-        
-        provider = EmailProviderSetting.objects.filter(is_active=True).first()
+    def _get_active_provider():
+        provider = active_email_provider_cache.get()
         if not provider:
             raise ServiceError("No active email provider configured", status_code=503)
+        return provider
 
-        body = render_to_string(f"emails/{template_name}", context)
-
-        email_log = EmailLog.objects.create(
+    @staticmethod
+    def _send_smtp(connection, provider, subject: str, body: str, to_emails: list[str]):
+        email = EmailMessage(
             subject=subject,
             body=body,
+            from_email=provider.from_email,
             to=to_emails,
-            email_provider=provider,
+            connection=connection,
+        )
+        email.content_subtype = "html"
+        try:
+            email.send()
+        except Exception as e:
+            # Reconnect so one dropped socket doesn't fail the rest of the batch.
+            # If that fails too, the error propagates and _deliver() fails the
+            # messages not yet sent.
+            if not smtp_pool.is_alive(connection):
+                connection.close()
+                connection.open()
+            return e
+        return None
+
+    @staticmethod
+    def _send_sendgrid(client, provider, subject: str, body: str, to_emails: list[str]):
+        from sendgrid.helpers.mail import Mail
+
+        mail = Mail(
             from_email=provider.from_email,
+            to_emails=to_emails,
+            subject=subject,
+            html_content=body,
         )
+        try:
+            response = client.send(mail)
+        except Exception as e:
+            return e
+        if response.status_code not in [200, 202]:
+            return ServiceError(
+                f"SendGrid returned {response.status_code}",
+                status_code=response.status_code,
+            )
+        return None
+
+    @staticmethod
+    def _deliver(provider, messages: list[tuple[str, str, list[str]]]):
+        """
+        Send (subject, body, to_emails) messages through `provider` over a
+        single connection. Returns one exception, or None on success, per
+        message. Outcomes are recorded as messages go, so if the connection
+        can't be opened or reopened only the messages not yet sent fail.
+        """
+        if provider.provider_type not in ("smtp", "sendgrid"):
+            error = ServiceError("Unsupported email provider type", status_code=400)
+            return [error] * len(messages)
 
+        errors = []
         try:
             if provider.provider_type == "smtp":
-                connection = get_connection(
-                    backend="django.core.mail.backends.smtp.EmailBackend",
-                    host=provider.host,
-                    port=provider.port,
-                    username=provider.username,
-                    password=provider.password,
-                    use_tls=provider.use_tls,
-                    use_ssl=provider.use_ssl,
+                with smtp_pool.connection(provider) as connection:
+                    for message in messages:
+                        errors.append(EmailService._send_smtp(connection, provider, *message))
+            else:
+                import sendgrid
+
+                client = sendgrid.SendGridAPIClient(api_key=provider.api_key)
+                for message in messages:
+                    errors.append(EmailService._send_sendgrid(client, provider, *message))
+        except Exception as e:
+            errors += [e] * (len(messages) - len(errors))
+        return errors
+
+    @staticmethod
+    def _lease_expiry():
+        return timezone.now() + timedelta(seconds=settings.EMAIL_QUEUE_LEASE_SECONDS)
+
+    @staticmethod
+    def _render(template_name: str, context: dict):
+        return render_email_template(template_name, context)
+
+    @staticmethod
+    def _create_log(template_name, context, subject, to_emails, provider, **extra_fields):
+        return EmailLog.objects.create(
+            template_name=template_name,
+            subject=subject,
+            body=EmailService._render(template_name, context),
+            to=", ".join(to_emails),
+            email_provider=provider,
+            **extra_fields,
+        )
+
+    @staticmethod
+    def _record_outcome(email_log: EmailLog, error: Exception | None):
+        email_log.attempts += 1
+        if error is None:
+            email_log.status = "sent"
+            email_log.sent_at = timezone.now()
+            email_log.error_message = None
+            logger.info(f"Email sent to {email_log.to}")
+            return
+
+        error_message = error.error_message if isinstance(error, ServiceError) else str(error)
+        email_log.error_message = error_message
+        if email_log.attempts >= settings.EMAIL_QUEUE_MAX_ATTEMPTS:
+            email_log.status = "failed"
+        else:
+            # Exponential backoff: base, 2 * base, 4 * base, ...
+            delay = settings.EMAIL_QUEUE_RETRY_BASE_SECONDS * 2 ** (email_log.attempts - 1)
+            email_log.status = "queued"
+            email_log.next_attempt_at = timezone.now() + timedelta(seconds=delay)
+        logger.error(f"Email failed to send to {email_log.to} (attempt {email_log.attempts}): {error_message}")
+
+    @staticmethod
+    def _send_logs(email_logs: list[EmailLog]):
+        """
+        Deliver claimed EmailLog rows, one connection per provider, and write
+        all outcomes back with a single bulk_update.
+        """
+        by_provider = {}
+        for email_log in email_logs:
+            by_provider.setdefault(email_log.email_provider_id, []).append(email_log)
+
+        for provider_logs in by_provider.values():
+            messages = [
+                (
+                    email_log.subject,
+                    email_log.body,
+                    [email.strip() for email in email_log.to.split(",") if email.strip()],
                 )
-                email = EmailMessage(
+                for email_log in provider_logs
+            ]
+            errors = EmailService._deliver(provider_logs[0].email_provider, messages)
+            for email_log, error in zip(provider_logs, errors):
+                EmailService._record_outcome(email_log, error)
+
+        EmailLog.objects.bulk_update(email_logs, EMAIL_LOG_OUTCOME_FIELDS)
+        return email_logs
+
+    @staticmethod
+    def send_email_with_template(
+        template_name: str,
+        context: dict,
+        subject: str,
+        to_emails: list[str],
+    ):
+        """Render and send immediately, inside the caller's request."""
+        provider = EmailService._get_active_provider()
+        # Leased like a claimed row so the queue worker leaves it alone
+        email_log = EmailService._create_log(
+            template_name, context, subject, to_emails, provider,
+            status="sending", next_attempt_at=EmailService._lease_expiry(),
+        )
+        return EmailService._send_logs([email_log])[0]
+
+    @staticmethod
+    def queue_email_with_template(
+        template_name: str,
+        context: dict,
+        subject: str,
+        to_emails: list[str],
+    ):
+        """
+        Render the email and store it as a queued EmailLog row. Delivery happens
+        in the `send_queued_emails` worker, so the caller returns right away.
+        """
+        provider = EmailService._get_active_provider()
+        return EmailService._create_log(template_name, context, subject, to_emails, provider)
+
+    @staticmethod
+    def _context_key(context: dict):
+        try:
+            key = tuple(sorted(context.items()))
+            hash(key)
+            return key
+        except TypeError:
+            # Contexts with unhashable values are rendered individually
+            return None
+
+    @staticmethod
+    def send_bulk_email_with_template(
+        template_name: str,
+        subject: str,
+        recipients: list[dict],
+        context: dict | None = None,
+        queue: bool = False,
+    ):
+        """
+        Send one template to many recipients.
+
+        `recipients` is a list of {"to": [emails], "context": {...}} entries;
+        each recipient's context is merged over the shared `context`. The
+        template is rendered once per distinct context, all EmailLog rows are
+        written with one bulk_create, and the batch is sent over one connection
+        (or left for the worker when `queue` is True). Returns a status entry
+        per recipient.
+        """
+        provider = EmailService._get_active_provider()
+        context = context or {}
+        rendered = {}
+        email_logs = []
+        status = "queued" if queue else "sending"
+        next_attempt_at = timezone.now() if queue else EmailService._lease_expiry()
+
+        for recipient in recipients:
+            recipient_context = {**context, **recipient.get("context", {})}
+            key = EmailService._context_key(recipient_context)
+            if key is None:
+                body = EmailService._render(template_name, recipient_context)
+            elif key in rendered:
+                body = rendered[key]
+            else:
+                body = rendered[key] = EmailService._render(template_name, recipient_context)
+            email_logs.append(
+                EmailLog(
+                    template_name=template_name,
                     subject=subject,
                     body=body,
-                    from_email=provider.from_email,
-                    to=to_emails,
-                    connection=connection,
+                    to=", ".join(recipient["to"]),
+                    email_provider=provider,
+                    status=status,
+                    next_attempt_at=next_attempt_at,
                 )
-                email.content_subtype = "html"
-                email.send()
-                logger.info(f"Email sent to {to_emails}")
+            )
 
-            elif provider.provider_type == "sendgrid":
-                import sendgrid
-                from sendgrid.helpers.mail import Mail
+        email_logs = EmailLog.objects.bulk_create(email_logs)
+        if not queue:
+            EmailService._send_logs(email_logs)
 
-                sg = sendgrid.SendGridAPIClient(api_key=provider.api_key)
-                mail = Mail(
-                    from_email=provider.from_email,
-                    to_emails=to_emails,
-                    subject=subject,
-                    html_content=body,
-                )
-                response = sg.send(mail)
-                if response.status_code not in [200, 202]:
-                    raise ServiceError(
-                        f"SendGrid returned {response.status_code}",
-                        status_code=response.status_code,
-                    )
-                logger.info(f"Email sent to {to_emails}")
-            else:
-                raise ServiceError("Unsupported email provider type", status_code=400)
+        return [
+            {
+                "email_log_id": email_log.id,
+                "to": email_log.to,
+                "status": email_log.status,
+                "error": email_log.error_message,
+            }
+            for email_log in email_logs
+        ]
 
-            email_log.status = "sent"
-            email_log.sent_at = timezone.now()
-            email_log.save()
+    @staticmethod
+    def claim_queued_emails(batch_size: int) -> list[EmailLog]:
+        """
+        Lease up to `batch_size` due rows to this worker. Rows left in "sending"
+        by a worker that died become claimable again once their lease expires.
+        """
+        now = timezone.now()
+        due = Q(status__in=["queued", "sending"], next_attempt_at__lte=now)
+        # The lease timestamp doubles as a claim marker, so on databases without
+        # SELECT ... FOR UPDATE a row taken by a concurrent worker is skipped.
+        lease_expiry = EmailService._lease_expiry()
+        with transaction.atomic():
+            ids = list(
+                EmailLog.objects.select_for_update(skip_locked=True)
+                .filter(due)
+                .order_by("next_attempt_at", "id")
+                .values_list("id", flat=True)[:batch_size]
+            )
+            EmailLog.objects.filter(due, id__in=ids).update(status="sending", next_attempt_at=lease_expiry)
+        return list(
+            EmailLog.objects.select_related("email_provider")
+            .filter(id__in=ids, status="sending", next_attempt_at=lease_expiry)
+            .order_by("id")
+        )
 
-        except ServiceError as e:
-            # Custom exception already raised — just update log
-            email_log.status = "failed"
-            email_log.error_message = e.message
-            email_log.save()
-            logger.error(f"Email failed to send to {to_emails}: {e}")
-            
+    @staticmethod
+    def process_queue(batch_size: int | None = None) -> int:
+        """Send one batch of due queued emails. Returns the number of rows processed."""
+        email_logs = EmailService.claim_queued_emails(batch_size or settings.EMAIL_QUEUE_BATCH_SIZE)
+        if email_logs:
+            EmailService._send_logs(email_logs)
+        return len(email_logs)
 
-        except Exception as e:
-            # Convert any other errors into ServiceError
-            email_log.status = "failed"
-            email_log.error_message = str(e)
-            email_log.save()
-            logger.error(f"Email failed to send to {to_emails}: {e}")
-    
-
-    def resend_email(self, email_log_id: int):
-        email_log = EmailLog.objects.get(id=email_log_id)
-        self.send_email_with_template(
-            email_log.subject,
-            email_log.body,
-            email_log.to,
-            email_log.email_provider,
+    @staticmethod
+    def resend_email(email_log_id: int):
+        """Put a logged email back on the queue with a fresh retry budget."""
+        EmailLog.objects.filter(id=email_log_id).update(
+            status="queued",
+            attempts=0,
+            error_message=None,
+            next_attempt_at=timezone.now(),
         )
-            
-    
@@ -0,0 +1,31 @@
+from pathlib import Path
+from django.template import Context, Engine
+
+EMAIL_TEMPLATES_DIR = Path(__file__).resolve().parent.parent / "templates"
+
+# Email templates get their own engine so they are always served by the cached
+# loader, even when TEMPLATES runs uncached under DEBUG. Each template is read
+# and parsed once per process.
+email_template_engine = Engine(
+    dirs=[str(EMAIL_TEMPLATES_DIR)],
+    loaders=[
+        ("django.template.loaders.cached.Loader", ["django.template.loaders.filesystem.Loader"]),
+    ],
+    autoescape=True,
+)
+
+
+def render_email_template(template_name: str, context: dict) -> str:
+    template = email_template_engine.get_template(f"emails/{template_name}")
+    return template.render(Context(context, autoescape=email_template_engine.autoescape))
+
+
+def precompile_email_templates() -> list[str]:
+    """Load every template under templates/emails/ into the cached loader."""
+    template_names = sorted(
+        path.relative_to(EMAIL_TEMPLATES_DIR / "emails").as_posix()
+        for path in (EMAIL_TEMPLATES_DIR / "emails").rglob("*.html")
+    )
+    for template_name in template_names:
+        email_template_engine.get_template(f"emails/{template_name}")
+    return template_names
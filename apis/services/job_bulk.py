@@ -0,0 +1,233 @@
+import csv
+import io
+import json
+import re
+from collections import Counter
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from apis.models import JobApplication, JobApplicationStat, JobApplicationStatus, JobSkillDemand, JobSkills
+from apis.serializers import JobApplicationBulkSerializer
+from apis.services import response_cache
+from apis.signals import job_application_signals_muted
+from apis.utils.common import ServiceError
+
+M2M_FIELDS = ("skills", "preferred_skills")
+# Separators accepted between skill ids in one CSV cell
+_ID_SEPARATORS = re.compile(r"[\s,;|]+")
+
+
+def _check_size(rows):
+    if len(rows) > settings.JOB_APPLICATION_BULK_MAX_ROWS:
+        raise ServiceError(
+            f"At most {settings.JOB_APPLICATION_BULK_MAX_ROWS} rows per request, got {len(rows)}", status_code=400
+        )
+
+
+def read_upload(upload):
+    """
+    Rows from an uploaded .csv (a header row of field names; skills as ids
+    separated by spaces, commas, semicolons or |) or .ndjson/.jsonl file (one
+    JSON object per line). Unparseable lines become rows that fail validation.
+    """
+    name = (upload.name or "").lower()
+    text = io.TextIOWrapper(upload, encoding="utf-8-sig", newline="")
+    rows = []
+    if name.endswith(".csv"):
+        for record in csv.DictReader(text):
+            # Empty cells are left out, so the field's default applies
+            row = {key.strip(): value.strip() for key, value in record.items() if key and value and value.strip()}
+            for field in M2M_FIELDS:
+                if field in row:
+                    row[field] = [part for part in _ID_SEPARATORS.split(row[field]) if part]
+            rows.append(row)
+    elif name.endswith((".ndjson", ".jsonl")):
+        for line in text:
+            if not line.strip():
+                continue
+            try:
+                rows.append(json.loads(line))
+            except ValueError:
+                rows.append(None)
+    else:
+        raise ServiceError("Upload a .csv, .ndjson or .jsonl file", status_code=400)
+    _check_size(rows)
+    return rows
+
+
+def _as_id(value):
+    """`value` as a primary key if it is an int or a string of digits (CSV cells), else None."""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str) and value.strip().isdigit():
+        return int(value)
+    return None
+
+
+def _preload(rows):
+    """Every status and skill the rows reference, with one query per model."""
+    status_ids, skill_ids = set(), set()
+    for row in rows:
+        if not isinstance(row, dict):
+            continue
+        status_ids.add(_as_id(row.get("status")))
+        for field in M2M_FIELDS:
+            if isinstance(row.get(field), list):
+                skill_ids.update(_as_id(value) for value in row[field])
+    status_ids.discard(None)
+    skill_ids.discard(None)
+    return {
+        JobApplicationStatus: JobApplicationStatus.objects.in_bulk(status_ids),
+        JobSkills: JobSkills.objects.in_bulk(skill_ids),
+    }
+
+
+def _validate(rows, instances=None):
+    """
+    (validated rows, errors) in one pass. Validated rows are
+    (index, instance or None, validated_data); errors are
+    {"index": i, "errors": {...}} with i the row's position in `rows`.
+    """
+    context = {"preloaded": _preload(rows)}
+    validated, errors = [], []
+    for index, row in enumerate(rows):
+        if not isinstance(row, dict):
+            errors.append({"index": index, "errors": {"non_field_errors": ["Expected an object."]}})
+            continue
+        instance = None
+        if instances is not None:
+            instance = instances.get(_as_id(row.get("id")))
+            if instance is None:
+                errors.append({"index": index, "errors": {"id": ["Not found."]}})
+                continue
+        serializer = JobApplicationBulkSerializer(instance, data=row, partial=instance is not None, context=context)
+        if serializer.is_valid():
+            validated.append((index, instance, serializer.validated_data))
+        else:
+            errors.append({"index": index, "errors": serializer.errors})
+    return validated, errors
+
+
+def _write_skills(user_id, applications, skill_lists, replace):
+    """
+    Bulk insert the through rows for each M2M field, and move the user's
+    skill demand counters by them; `replace` first drops the existing ones.
+    """
+    removed, added = Counter(), Counter()
+    for field, column in JobSkillDemand.FIELD_COLUMNS:
+        through = getattr(JobApplication, field).through
+        pairs = [
+            (application.id, list(dict.fromkeys(skill.id for skill in skills)))
+            for application, lists in zip(applications, skill_lists)
+            if (skills := lists.get(field)) is not None
+        ]
+        if replace and pairs:
+            old = through.objects.filter(jobapplication_id__in=[application_id for application_id, _ in pairs])
+            removed.update(JobSkillDemand.keys_for_links(column, old))
+            old.delete()
+        through.objects.bulk_create(
+            [
+                through(jobapplication_id=application_id, jobskills_id=skill_id)
+                for application_id, skill_ids in pairs
+                for skill_id in skill_ids
+            ],
+            batch_size=settings.JOB_APPLICATION_BULK_BATCH_SIZE,
+        )
+        added.update((user_id, skill_id, column) for _, skill_ids in pairs for skill_id in skill_ids)
+    # bulk_create skips the m2m signals that keep the counters
+    JobSkillDemand.apply(removed, added)
+
+
+def _after_write(user_id, removed_keys, added_keys):
+    # bulk_create/bulk_update skip save() and the m2m signals, so do their work once per batch
+    JobApplicationStat.apply(user_id, removed_keys, added_keys)
+    transaction.on_commit(lambda: response_cache.invalidate_for_users(JobApplication, [user_id]))
+
+
+def bulk_create(user, rows, skip_invalid=False):
+    """
+    Validate every row, then insert the valid ones, their skills and their
+    stats in one transaction. Unless `skip_invalid`, any invalid row means
+    nothing is written. Returns (created applications, errors).
+    """
+    _check_size(rows)
+    validated, errors = _validate(rows)
+    if errors and not skip_invalid:
+        return [], errors
+
+    applications, skill_lists = [], []
+    for _, _, data in validated:
+        data = dict(data)
+        skill_lists.append({field: data.pop(field, None) or [] for field in M2M_FIELDS})
+        applications.append(JobApplication(user=user, **data))
+
+    with transaction.atomic():
+        JobApplication.objects.bulk_create(applications, batch_size=settings.JOB_APPLICATION_BULK_BATCH_SIZE)
+        _write_skills(user.id, applications, skill_lists, replace=False)
+        _after_write(user.id, [], [key for application in applications for key in JobApplicationStat.keys_for(application)])
+    return applications, errors
+
+
+def bulk_update(user, rows, skip_invalid=False):
+    """
+    Partially update the user's applications named by each row's `id`.
+    `skills`/`preferred_skills`, when given, replace the current ones.
+    Returns (updated applications, errors).
+    """
+    _check_size(rows)
+    ids = [_as_id(row.get("id")) for row in rows if isinstance(row, dict)]
+    instances = JobApplication.objects.filter(user=user, id__in=ids).select_related("status").in_bulk()
+    validated, errors = _validate(rows, instances)
+    if errors and not skip_invalid:
+        return [], errors
+
+    applications, skill_lists, fields = [], [], {"updated_at"}
+    removed_keys, added_keys = [], []
+    now = timezone.now()
+    for _, application, data in validated:
+        removed_keys += JobApplicationStat.keys_for(application)
+        lists = {}
+        for field, value in data.items():
+            if field in M2M_FIELDS:
+                lists[field] = value or []
+            else:
+                setattr(application, field, value)
+                fields.add(field)
+        # bulk_update doesn't apply auto_now
+        application.updated_at = now
+        added_keys += JobApplicationStat.keys_for(application)
+        applications.append(application)
+        skill_lists.append(lists)
+
+    with transaction.atomic():
+        JobApplication.objects.bulk_update(
+            applications, sorted(fields), batch_size=settings.JOB_APPLICATION_BULK_BATCH_SIZE
+        )
+        _write_skills(user.id, applications, skill_lists, replace=True)
+        _after_write(user.id, removed_keys, added_keys)
+    return applications, errors
+
+
+def bulk_delete(user, ids):
+    """
+    Delete the user's applications with these ids, and whatever cascades
+    from them. Returns (deleted ids, ids that don't exist or aren't the user's).
+    """
+    _check_size(ids)
+    ids = list(dict.fromkeys(pk for pk in map(_as_id, ids) if pk is not None))
+    applications = JobApplication.objects.filter(user=user, id__in=ids)
+
+    with transaction.atomic():
+        found = list(applications.values_list("id", flat=True))
+        removed_keys = JobApplicationStat.keys_for_rows(applications)
+        removed_demand = JobSkillDemand.keys_for_applications(applications)
+        # The per-row stats, skill demand and list-version handlers would each
+        # write once per application; this does their work once for the batch
+        with job_application_signals_muted():
+            applications.delete()
+        JobSkillDemand.apply(removed_demand, [])
+        _after_write(user.id, removed_keys, [])
+    deleted = set(found)
+    return found, [pk for pk in ids if pk not in deleted]
@@ -0,0 +1,197 @@
+import logging
+import re
+import unicodedata
+from abc import ABC, abstractmethod
+from functools import cache, reduce
+from operator import or_
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, OperationalError, connections
+from django.db.models import Case, IntegerField, Q, Value, When
+from django.db.models.functions import Greatest
+from django.utils.module_loading import import_string
+from apis.models import JobApplication
+
+logger = logging.getLogger("color_logger")
+
+# Searched fields, most telling first. A result's rank is the first of them
+# (its tier) by which every query term has been found, so a term found only
+# in the description ranks below one found in the position.
+RANKED_FIELDS = ("position", "company_name", "location", "description")
+MAX_QUERY_TERMS = 8
+
+# Letters and digits; the FTS5 unicode61 tokenizer splits on everything else, underscores included
+_TOKEN = re.compile(r"[^\W_]+")
+
+
+def _tokens(text):
+    text = unicodedata.normalize("NFKD", text or "")
+    return _TOKEN.findall("".join(ch for ch in text if not unicodedata.combining(ch)).lower())
+
+
+def parse_query(query):
+    """
+    Split a search box value into terms. The last term is matched as a prefix
+    while it is still being typed, i.e. unless the query ends in whitespace.
+    """
+    terms = _tokens(query)[:MAX_QUERY_TERMS]
+    prefix = bool(terms) and not query[-1].isspace()
+    return terms, prefix
+
+
+class JobSearchBackend(ABC):
+    """
+    Finds job applications whose position, company name, location or
+    description contain every query term, ranked by tier (RANKED_FIELDS) and
+    newest first within a tier. Every match is reachable by paging; backends
+    return one page of the ranking from the database.
+    """
+
+    def install(self, using=DEFAULT_DB_ALIAS):
+        """Create whatever index the backend needs, if missing. Runs after every migrate."""
+
+    def rebuild(self, using=DEFAULT_DB_ALIAS):
+        """Recreate the index from the JobApplication table."""
+
+    @abstractmethod
+    def ranked_ids(self, terms, prefix, user_id, limit, offset):
+        """Ids of the matches ranked `offset` to `offset + limit`."""
+
+    def search(self, query, user_id=None, limit=20, offset=0):
+        """Ids of matching applications, best first. `user_id` None searches everyone's."""
+        terms, prefix = parse_query(query)
+        if not terms:
+            return []
+        return self.ranked_ids(terms, prefix, user_id, limit, offset)
+
+
+class IcontainsSearchBackend(JobSearchBackend):
+    """Unindexed `icontains` scans. Works on every database; used where FTS5 is unavailable."""
+
+    def ranked_ids(self, terms, prefix, user_id, limit, offset):
+        queryset = JobApplication.objects.all() if user_id is None else JobApplication.objects.filter(user_id=user_id)
+        term_tiers = []
+        for term in terms:
+            matches = [Q(**{f"{field}__icontains": term}) for field in RANKED_FIELDS]
+            queryset = queryset.filter(reduce(or_, matches))
+            # The first field the term appears in
+            term_tiers.append(Case(
+                *[When(match, then=Value(tier)) for tier, match in enumerate(matches)],
+                output_field=IntegerField(),
+            ))
+        tier = Greatest(*term_tiers) if len(term_tiers) > 1 else term_tiers[0]
+        queryset = queryset.annotate(tier=tier).order_by("tier", "-id")
+        return list(queryset.values_list("id", flat=True)[offset:offset + limit])
+
+
+class SQLiteFTS5SearchBackend(JobSearchBackend):
+    """
+    An SQLite FTS5 table holding a copy of the searched fields, kept in sync
+    with the JobApplication table by triggers, so bulk writes and imports
+    are indexed too. Each row also carries an `owner` token to scope
+    searches to one user inside the index.
+    """
+    table = f"{JobApplication._meta.db_table}_fts"
+
+    @classmethod
+    def is_supported(cls, using=DEFAULT_DB_ALIAS):
+        connection = connections[using]
+        if connection.vendor != "sqlite":
+            return False
+        with connection.cursor() as cursor:
+            cursor.execute("PRAGMA compile_options")
+            return "ENABLE_FTS5" in {row[0] for row in cursor.fetchall()}
+
+    def _statements(self):
+        source = JobApplication._meta.db_table
+        columns = ", ".join(RANKED_FIELDS)
+        values = ", ".join(f"coalesce(new.{field}, '')" for field in RANKED_FIELDS)
+        assignments = ", ".join(f"{field} = coalesce(new.{field}, '')" for field in RANKED_FIELDS)
+        return [
+            # prefix= keeps 2 and 3 character prefix indexes for type-ahead
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {self.table} USING fts5("
+            f"owner, {columns}, tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')",
+            f"CREATE TRIGGER IF NOT EXISTS {self.table}_insert AFTER INSERT ON {source} BEGIN "
+            f"INSERT INTO {self.table} (rowid, owner, {columns}) VALUES (new.id, 'u' || new.user_id, {values}); END",
+            f"CREATE TRIGGER IF NOT EXISTS {self.table}_update AFTER UPDATE OF user_id, {columns} ON {source} BEGIN "
+            f"UPDATE {self.table} SET owner = 'u' || new.user_id, {assignments} WHERE rowid = old.id; END",
+            f"CREATE TRIGGER IF NOT EXISTS {self.table}_delete AFTER DELETE ON {source} BEGIN "
+            f"DELETE FROM {self.table} WHERE rowid = old.id; END",
+        ]
+
+    def install(self, using=DEFAULT_DB_ALIAS):
+        # Table rebuilds during migrations drop the triggers, so this re-creates them
+        connection = connections[using]
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE name = %s", [self.table])
+            exists = cursor.fetchone() is not None
+            for statement in self._statements():
+                cursor.execute(statement)
+        if not exists:
+            self._populate(using)
+
+    def _populate(self, using):
+        columns = ", ".join(RANKED_FIELDS)
+        values = ", ".join(f"coalesce({field}, '')" for field in RANKED_FIELDS)
+        with connections[using].cursor() as cursor:
+            cursor.execute(f"DELETE FROM {self.table}")
+            cursor.execute(
+                f"INSERT INTO {self.table} (rowid, owner, {columns}) "
+                f"SELECT id, 'u' || user_id, {values} FROM {JobApplication._meta.db_table}"
+            )
+            cursor.execute(f"INSERT INTO {self.table} ({self.table}) VALUES ('optimize')")
+
+    def rebuild(self, using=DEFAULT_DB_ALIAS):
+        with connections[using].cursor() as cursor:
+            cursor.execute(f"DROP TABLE IF EXISTS {self.table}")
+        self.install(using)
+
+    def _match(self, terms, prefix, user_id, tier):
+        phrases = [f'"{term}"' for term in terms]
+        if prefix:
+            phrases[-1] += "*"
+        group = " ".join(phrases)
+        match = f"{{{' '.join(RANKED_FIELDS[:tier + 1])}}} : ({group})"
+        if tier:
+            # Rows of the earlier tiers are left out, so each row is in exactly one
+            match = f"({match}) NOT ({{{' '.join(RANKED_FIELDS[:tier])}}} : ({group}))"
+        if user_id is not None:
+            match = f'owner : "u{int(user_id)}" AND ({match})'
+        return match
+
+    def ranked_ids(self, terms, prefix, user_id, limit, offset):
+        # Each tier is read newest first in rowid order straight off the index,
+        # so LIMIT ends the walk early and no match is scored. A page starts in
+        # a later tier only once the earlier ones are used up.
+        ids = []
+        with connections[DEFAULT_DB_ALIAS].cursor() as cursor:
+            for tier in range(len(RANKED_FIELDS)):
+                match = self._match(terms, prefix, user_id, tier)
+                cursor.execute(
+                    f"SELECT rowid FROM {self.table} WHERE {self.table} MATCH %s "
+                    f"ORDER BY rowid DESC LIMIT %s OFFSET %s",
+                    [match, limit - len(ids), offset],
+                )
+                rows = [row[0] for row in cursor.fetchall()]
+                ids += rows
+                if len(ids) >= limit:
+                    break
+                if rows or not offset:
+                    offset = 0
+                else:
+                    # The page starts past the end of this tier
+                    cursor.execute(f"SELECT count(*) FROM {self.table} WHERE {self.table} MATCH %s", [match])
+                    offset -= cursor.fetchone()[0]
+        return ids
+
+
+@cache
+def get_search_backend():
+    """The JOB_SEARCH_BACKEND class, or SQLite FTS5 when the database supports it and icontains otherwise."""
+    if settings.JOB_SEARCH_BACKEND:
+        return import_string(settings.JOB_SEARCH_BACKEND)()
+    try:
+        if SQLiteFTS5SearchBackend.is_supported():
+            return SQLiteFTS5SearchBackend()
+    except OperationalError:
+        logger.exception("Could not check for SQLite FTS5 support")
+    return IcontainsSearchBackend()
@@ -0,0 +1,135 @@
+import asyncio
+import logging
+import multiprocessing
+import threading
+import django
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from django.conf import settings
+from django.contrib.auth import hashers
+from rest_framework import status
+from apis.utils.common import ServiceError
+
+logger = logging.getLogger("color_logger")
+
+
+class PasswordHashingBusy(ServiceError):
+    """Raised instead of queueing when the hashing pool already has PASSWORD_HASH_MAX_PENDING jobs."""
+
+    def __init__(self):
+        super().__init__(
+            "Too many password operations in progress, please retry shortly",
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        )
+        # DRF's exception handler turns `wait` into a Retry-After header
+        self.wait = settings.PASSWORD_HASH_RETRY_AFTER
+
+
+def _make_password(password):
+    return hashers.make_password(password)
+
+
+def _check_password(password, encoded):
+    # Mirrors hashers.check_password's setter without sending the user across processes
+    needs_rehash = []
+    is_correct = hashers.check_password(password, encoded, setter=lambda raw: needs_rehash.append(True))
+    return is_correct, bool(needs_rehash)
+
+
+class PasswordHashingPool:
+    """
+    Process pool that runs password hashing for the async auth views.
+
+    PBKDF2/scrypt/Argon2 are CPU bound and would otherwise pin the event loop
+    (or the single thread Django runs sync views on) for each login. Jobs run
+    in PASSWORD_HASH_WORKERS separate processes so they don't contend on the
+    GIL with request handling. At most PASSWORD_HASH_MAX_PENDING jobs may be
+    running or queued per server process; beyond that callers get
+    PasswordHashingBusy (503 + Retry-After) instead of an ever-growing queue.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._executor = None
+        self._pending = 0
+        self._peak_pending = 0
+        self._submitted = 0
+        self._completed = 0
+        self._rejected = 0
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                # spawn, not fork: the server process has an event loop and threads running
+                self._executor = ProcessPoolExecutor(
+                    max_workers=settings.PASSWORD_HASH_WORKERS,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=django.setup,
+                )
+            return self._executor
+
+    async def run(self, fn, *args):
+        with self._lock:
+            if self._pending >= settings.PASSWORD_HASH_MAX_PENDING:
+                self._rejected += 1
+                logger.warning(f"Password hashing pool saturated ({self._pending} pending), rejecting request")
+                raise PasswordHashingBusy()
+            self._pending += 1
+            self._submitted += 1
+            self._peak_pending = max(self._peak_pending, self._pending)
+
+        executor = self._get_executor()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(executor, fn, *args)
+        except BrokenProcessPool:
+            # A worker died; start a fresh pool for the next caller
+            with self._lock:
+                if self._executor is executor:
+                    self._executor = None
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        finally:
+            with self._lock:
+                self._pending -= 1
+                self._completed += 1
+
+    def stats(self):
+        with self._lock:
+            workers = settings.PASSWORD_HASH_WORKERS
+            return {
+                "workers": workers,
+                "maxPending": settings.PASSWORD_HASH_MAX_PENDING,
+                "running": min(self._pending, workers),
+                "queueDepth": max(0, self._pending - workers),
+                "peakPending": self._peak_pending,
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "rejected": self._rejected,
+            }
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+password_hashing_pool = PasswordHashingPool()
+
+
+async def amake_password(password):
+    return await password_hashing_pool.run(_make_password, password)
+
+
+async def acheck_password(user, password):
+    """
+    Async counterpart of user.check_password: verifies in the hashing pool
+    and upgrades outdated hashes the same way the sync setter does.
+    """
+    if password is None or not user.has_usable_password():
+        return False
+    is_correct, needs_rehash = await password_hashing_pool.run(_check_password, password, user.password)
+    if is_correct and needs_rehash:
+        user.password = await amake_password(password)
+        await user.asave(update_fields=["password"])
+    return is_correct
@@ -0,0 +1,54 @@
+import hashlib
+import time
+import uuid
+from django.core.cache import cache
+
+
+def _version_key(model, scope=None):
+    if scope is None:
+        return f"response_cache:{model._meta.label_lower}:version"
+    return f"response_cache:{model._meta.label_lower}:{scope}:version"
+
+
+def user_scope(user_id):
+    return f"user:{user_id}"
+
+
+# Listings that span every user's rows (what staff see)
+ALL_USERS_SCOPE = "all"
+
+
+def current_versions(models):
+    """
+    (version token, last-modified timestamp) of each model's cached responses,
+    read in one cache round trip. Items are models, or (model, scope) pairs for
+    tables versioned per owner. Anything without a version yet gets a fresh one.
+    """
+    keys = [_version_key(*item) if isinstance(item, tuple) else _version_key(item) for item in models]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            # No timeout: queryset.update() bypasses signals, but cached bodies expire
+            cache.add(key, (uuid.uuid4().hex, int(time.time())), None)
+            versions[key] = cache.get(key)
+    return [versions[key] for key in keys]
+
+
+def invalidate(model, scope=None):
+    cache.set(_version_key(model, scope), (uuid.uuid4().hex, int(time.time())), None)
+
+
+def invalidate_for_users(model, user_ids):
+    """Bump the versions of the given owners' rows and of the all-users listing."""
+    cache.set_many(
+        {
+            _version_key(model, scope): (uuid.uuid4().hex, int(time.time()))
+            for scope in [ALL_USERS_SCOPE, *(user_scope(user_id) for user_id in set(user_ids))]
+        },
+        None,
+    )
+
+
+def build_etag(versions, *parts):
+    digest = hashlib.md5("|".join([token for token, _ in versions] + list(parts)).encode()).hexdigest()
+    return f'"{digest}"'
@@ -0,0 +1,76 @@
+from collections import defaultdict
+from django.db.models import Case, Exists, F, IntegerField, OuterRef, Q, Subquery, Value, When
+from apis.models import JobApplication, JobSkillDemand, LearningManagementSkill, UserSkills
+
+# Skills the user has at these levels still count as gaps
+WEAK_LEVELS = ("beginner", "intermediate")
+LEVEL_RANKS = {"beginner": 1, "intermediate": 2, "advanced": 3, "expert": 4}
+
+
+def skill_gap_report(user_id, limit=20):
+    """
+    The skills the user's applications ask for most that the user lacks or
+    has only at a WEAK_LEVELS level, most demanded first, with the user's
+    own level and any learning plans that already cover each skill.
+    """
+    own_skills = UserSkills.objects.filter(user_id=user_id, skill_id=OuterRef("skill_id")).annotate(
+        rank=Case(
+            *[When(level=level, then=Value(rank)) for level, rank in LEVEL_RANKS.items()],
+            default=Value(0),
+            output_field=IntegerField(),
+        )
+    ).order_by("-rank", "-confidence")
+    planned = LearningManagementSkill.objects.filter(
+        learning_management__user_id=user_id, skill_id=OuterRef("skill_id")
+    )
+    # Counters of skills no application lists any more stay behind at zero
+    gaps = list(
+        JobSkillDemand.objects.filter(Q(required_count__gt=0) | Q(preferred_count__gt=0), user_id=user_id)
+        .annotate(
+            own_level=Subquery(own_skills.values("level")[:1]),
+            own_confidence=Subquery(own_skills.values("confidence")[:1]),
+            covered=Exists(planned),
+            weight=F("required_count") * 2 + F("preferred_count"),
+        )
+        .filter(Q(own_level__isnull=True) | Q(own_level__in=WEAK_LEVELS))
+        .order_by("-weight", "-required_count", "skill_id")
+        .values(
+            "skill_id", "skill__name", "required_count", "preferred_count",
+            "own_level", "own_confidence", "covered",
+        )[:limit]
+    )
+
+    plans = defaultdict(list)
+    covered_ids = [gap["skill_id"] for gap in gaps if gap["covered"]]
+    rows = (
+        LearningManagementSkill.objects.filter(learning_management__user_id=user_id, skill_id__in=covered_ids)
+        .order_by("learning_management_id")
+        .values(
+            "skill_id", "level", "learning_management_id", "learning_management__name",
+            "learning_management__status__category",
+        )
+    )
+    for row in rows:
+        plans[row["skill_id"]].append({
+            "id": row["learning_management_id"],
+            "name": row["learning_management__name"],
+            "status": row["learning_management__status__category"],
+            "targetLevel": row["level"],
+        })
+
+    return {
+        "applicationCount": JobApplication.objects.filter(user_id=user_id).count(),
+        "gaps": [
+            {
+                "skill": {"id": gap["skill_id"], "name": gap["skill__name"]},
+                "requiredIn": gap["required_count"],
+                "preferredIn": gap["preferred_count"],
+                "gap": "missing" if gap["own_level"] is None else "weak",
+                "userLevel": gap["own_level"],
+                "userConfidence": gap["own_confidence"],
+                "coveredByLearningPlan": gap["covered"],
+                "learningPlans": plans[gap["skill_id"]],
+            }
+            for gap in gaps
+        ],
+    }
@@ -0,0 +1,138 @@
+import numpy as np
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count
+from apis.models import JobApplication, JobSkills, UserSkills
+from apis.services import response_cache
+
+LEVEL_WEIGHTS = {
+    "beginner": 0.25,
+    "intermediate": 0.5,
+    "advanced": 0.75,
+    "expert": 1.0,
+}
+# A preferred skill counts half as much as a required one
+REQUIRED_WEIGHT = 1.0
+PREFERRED_WEIGHT = 0.5
+
+
+def skill_strengths(user_id):
+    """
+    The user's sparse skill vector as (sorted skill ids, strengths in 0..1).
+    Strength is the level weight scaled by confidence (a 0-100 percentage):
+    an unrated skill counts half, a fully confident one in full.
+    """
+    rows = sorted(UserSkills.objects.filter(user_id=user_id).values_list("skill_id", "level", "confidence"))
+    strengths = {}
+    for skill_id, level, confidence in rows:
+        strength = LEVEL_WEIGHTS.get(level, 0.0) * (0.5 + min(max(confidence, 0), 100) / 200)
+        # A skill listed twice counts at its strongest
+        strengths[skill_id] = max(strength, strengths.get(skill_id, 0.0))
+    return np.fromiter(strengths, dtype=np.int64), np.fromiter(strengths.values(), dtype=np.float64)
+
+
+def _positions(application_ids, rows):
+    """
+    `rows` (application id first) restricted to the applications in the
+    sorted `application_ids`, with each kept row's index into them.
+    """
+    index = np.searchsorted(application_ids, rows[:, 0])
+    known = index < len(application_ids)
+    known[known] = application_ids[index[known]] == rows[known, 0]
+    return rows[known], index[known]
+
+
+def _incidence(through, user_id, application_ids, skill_ids, strengths):
+    """
+    Per-application (skill total, matched skills, summed strength of matched
+    skills) for one application-skill relation, as arrays aligned with
+    `application_ids`. Only the rows of skills the user has are fetched; the
+    totals come back already grouped. Rows of applications that aren't in
+    `application_ids` (created since they were read) are left out.
+    """
+    size = len(application_ids)
+    rows = through.objects.filter(jobapplication__user_id=user_id)
+
+    totals = np.zeros(size)
+    grouped, index = _positions(application_ids, np.array(
+        list(rows.values("jobapplication_id").annotate(total=Count("id")).values_list("jobapplication_id", "total")),
+        dtype=np.int64,
+    ).reshape(-1, 2))
+    totals[index] = grouped[:, 1]
+
+    matched, application_index = _positions(application_ids, np.array(
+        list(rows.filter(jobskills_id__in=skill_ids.tolist()).values_list("jobapplication_id", "jobskills_id")),
+        dtype=np.int64,
+    ).reshape(-1, 2))
+    # Sparse matrix-vector product: each incidence row adds its skill's strength to its application
+    weights = strengths[np.searchsorted(skill_ids, matched[:, 1])]
+    return (
+        totals,
+        np.bincount(application_index, minlength=size),
+        np.bincount(application_index, weights=weights, minlength=size),
+    )
+
+
+def score_applications(user_id):
+    """
+    Match score (0-100) of every one of the user's applications in one pass,
+    best first. Applications that list no skills score None and come last.
+    """
+    # One transaction, so backends with snapshot reads see the applications
+    # and their skill rows as of the same moment
+    with transaction.atomic():
+        applications = list(JobApplication.objects.filter(user_id=user_id).order_by("id").values_list(
+            "id", "position", "company_name"
+        ))
+        if not applications:
+            return []
+        application_ids = np.fromiter((row[0] for row in applications), dtype=np.int64, count=len(applications))
+        skill_ids, strengths = skill_strengths(user_id)
+
+        required_total, required_matched, required_strength = _incidence(
+            JobApplication.skills.through, user_id, application_ids, skill_ids, strengths
+        )
+        preferred_total, preferred_matched, preferred_strength = _incidence(
+            JobApplication.preferred_skills.through, user_id, application_ids, skill_ids, strengths
+        )
+
+    possible = REQUIRED_WEIGHT * required_total + PREFERRED_WEIGHT * preferred_total
+    achieved = REQUIRED_WEIGHT * required_strength + PREFERRED_WEIGHT * preferred_strength
+    scores = np.divide(achieved * 100, possible, out=np.full(len(applications), np.nan), where=possible > 0)
+
+    # Best score first, unscored last, newest first among ties
+    order = np.lexsort((-application_ids, np.nan_to_num(-scores, nan=np.inf)))
+    return [
+        {
+            "jobApplication": applications[i][0],
+            "position": applications[i][1],
+            "companyName": applications[i][2],
+            "score": None if np.isnan(scores[i]) else round(float(scores[i]), 1),
+            "requiredMatched": int(required_matched[i]),
+            "requiredTotal": int(required_total[i]),
+            "preferredMatched": int(preferred_matched[i]),
+            "preferredTotal": int(preferred_total[i]),
+        }
+        for i in order.tolist()
+    ]
+
+
+def cached_scores(user_id):
+    """
+    score_applications(), cached per user. The key is built from the version
+    stamps apis/signals.py bumps when the user's skills, applications or
+    application skills change (and from the skill catalog's), so any such
+    write makes the next call recompute.
+    """
+    scope = response_cache.user_scope(user_id)
+    versions = response_cache.current_versions(
+        [JobSkills, UserSkills, JobApplication, (UserSkills, scope), (JobApplication, scope)]
+    )
+    digest = response_cache.build_etag(versions)[1:-1]
+    cache_key = f"skill_match:{user_id}:{digest}"
+    scores = cache.get(cache_key)
+    if scores is None:
+        scores = score_applications(user_id)
+        cache.set(cache_key, scores, settings.RESPONSE_CACHE_TIMEOUT)
+    return scores
@@ -0,0 +1,162 @@
+import atexit
+import smtplib
+import threading
+import time
+from contextlib import contextmanager
+from django.conf import settings
+from django.core.mail import get_connection
+import logging
+
+logger = logging.getLogger("color_logger")
+
+
+class SMTPConnectionPool:
+    """
+    Process-wide pool of open, authenticated email backend connections.
+
+    Connections are keyed by the EmailProviderSetting they were opened for
+    together with its connection parameters, so editing the provider never
+    reuses a connection opened with the old credentials. A connection is
+    handed to one caller at a time, checked with NOOP when it has been idle
+    for a while, and closed once it has been idle longer than
+    EMAIL_SMTP_POOL_IDLE_TIMEOUT. Saving or deleting a provider closes its
+    idle connections in this process (see apis.signals); other processes
+    never match the old key again and close theirs on the idle timeout.
+    """
+
+    # Connections used more recently than this are handed out without a NOOP
+    PING_AFTER_SECONDS = 5
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._idle = {}
+
+    @staticmethod
+    def _key(provider):
+        return (
+            provider.pk,
+            settings.EMAIL_SMTP_BACKEND,
+            provider.host,
+            provider.port,
+            provider.username,
+            provider.password,
+            provider.use_tls,
+            provider.use_ssl,
+        )
+
+    @staticmethod
+    def _open(provider):
+        backend = get_connection(
+            backend=settings.EMAIL_SMTP_BACKEND,
+            host=provider.host,
+            port=provider.port,
+            username=provider.username,
+            password=provider.password,
+            use_tls=provider.use_tls,
+            use_ssl=provider.use_ssl,
+        )
+        backend.open()
+        return backend
+
+    @staticmethod
+    def is_alive(backend):
+        if not hasattr(backend, "connection"):
+            # Non-SMTP backends (locmem, console) have no socket to go stale
+            return True
+        if backend.connection is None:
+            return False
+        try:
+            return backend.connection.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+
+    @staticmethod
+    def _close(backend):
+        try:
+            backend.close()
+        except Exception as e:
+            logger.error(f"Error closing pooled SMTP connection: {e}")
+
+    def _checkout(self, key):
+        now = time.monotonic()
+        expired = []
+        backend = None
+        with self._lock:
+            idle = self._idle.get(key, [])
+            while idle:
+                candidate, last_used = idle.pop()
+                if now - last_used > settings.EMAIL_SMTP_POOL_IDLE_TIMEOUT:
+                    expired.append(candidate)
+                    continue
+                backend = (candidate, last_used)
+                break
+        for candidate in expired:
+            self._close(candidate)
+
+        if backend is None:
+            return None
+        candidate, last_used = backend
+        if now - last_used > self.PING_AFTER_SECONDS and not self.is_alive(candidate):
+            self._close(candidate)
+            return None
+        return candidate
+
+    def _checkin(self, key, backend):
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < settings.EMAIL_SMTP_POOL_MAX_IDLE:
+                idle.append((backend, time.monotonic()))
+                return
+        self._close(backend)
+
+    @contextmanager
+    def connection(self, provider):
+        """
+        Yield an open backend for the EmailProviderSetting `provider`, reusing
+        an idle pooled one when possible. A connection that raised while in
+        use is closed rather than returned to the pool.
+        """
+        key = self._key(provider)
+        backend = self._checkout(key) or self._open(provider)
+        try:
+            yield backend
+        except Exception:
+            self._close(backend)
+            raise
+        else:
+            self._checkin(key, backend)
+
+    def close_idle(self):
+        """Close every pooled connection idle for longer than the timeout."""
+        now = time.monotonic()
+        expired = []
+        with self._lock:
+            for key, idle in self._idle.items():
+                keep = []
+                for backend, last_used in idle:
+                    if now - last_used > settings.EMAIL_SMTP_POOL_IDLE_TIMEOUT:
+                        expired.append(backend)
+                    else:
+                        keep.append((backend, last_used))
+                self._idle[key] = keep
+        for backend in expired:
+            self._close(backend)
+
+    def discard(self, provider_id):
+        """Close the idle connections of one provider, whatever its settings were."""
+        with self._lock:
+            keys = [key for key in self._idle if key[0] == provider_id]
+            backends = [backend for key in keys for backend, _ in self._idle.pop(key)]
+        for backend in backends:
+            self._close(backend)
+
+    def close_all(self):
+        with self._lock:
+            backends = [backend for idle in self._idle.values() for backend, _ in idle]
+            self._idle.clear()
+        for backend in backends:
+            self._close(backend)
+
+
+smtp_pool = SMTPConnectionPool()
+atexit.register(smtp_pool.close_all)
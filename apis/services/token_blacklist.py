@@ -0,0 +1,153 @@
+import hashlib
+import logging
+import math
+import threading
+import time
+import uuid
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.utils import timezone
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+
+logger = logging.getLogger("color_logger")
+
+SEQ_CACHE_KEY = "token_blacklist:bloom:seq"
+GENERATION_CACHE_KEY = "token_blacklist:bloom:generation"
+
+
+def _entry_key(seq):
+    return f"token_blacklist:bloom:jti:{seq}"
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings. No false negatives; false positives at ~error_rate."""
+
+    def __init__(self, capacity, error_rate):
+        capacity = max(1, capacity)
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, value):
+        digest = hashlib.blake2b(value.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def add(self, value):
+        for position in self._positions(value):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, value):
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(value))
+
+
+class TokenBlacklistFilter:
+    """
+    Per-process Bloom filter of blacklisted refresh-token JTIs, so the common
+    "not blacklisted" case skips the token_blacklist tables.
+
+    Each process builds its filter from the unexpired BlacklistedToken rows on
+    first use. New blacklist entries are appended to a log in the shared Django
+    cache (a sequence counter plus one key per JTI); every check first applies
+    the entries it hasn't seen. If the log was evicted or the generation was
+    bumped (prune_token_blacklist --rebuild-filter), the filter is rebuilt.
+
+    A process-local cache (LocMemCache) can't carry other workers' writes, so
+    TOKEN_BLACKLIST_BLOOM_FILTER defaults to enabled only on a shared backend.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._bloom = None
+        self._seq = 0
+        self._generation = None
+        self._gap_since = None
+        self.enabled_override = None
+
+    @property
+    def enabled(self):
+        if self.enabled_override is not None:
+            return self.enabled_override
+        if settings.TOKEN_BLACKLIST_BLOOM_FILTER is not None:
+            return settings.TOKEN_BLACKLIST_BLOOM_FILTER
+        return not isinstance(caches["default"], (LocMemCache, DummyCache))
+
+    @staticmethod
+    def _shared_state():
+        state = cache.get_many([SEQ_CACHE_KEY, GENERATION_CACHE_KEY])
+        if SEQ_CACHE_KEY not in state:
+            cache.add(SEQ_CACHE_KEY, 0, None)
+        if GENERATION_CACHE_KEY not in state:
+            cache.add(GENERATION_CACHE_KEY, uuid.uuid4().hex, None)
+        if len(state) < 2:
+            state = cache.get_many([SEQ_CACHE_KEY, GENERATION_CACHE_KEY])
+        return state.get(SEQ_CACHE_KEY, 0), state.get(GENERATION_CACHE_KEY)
+
+    def _rebuild(self, seq, generation):
+        # Expired tokens fail verification anyway, so only live rows matter
+        live = BlacklistedToken.objects.filter(token__expires_at__gt=timezone.now())
+        count = live.count()
+        bloom = BloomFilter(
+            max(settings.TOKEN_BLACKLIST_BLOOM_CAPACITY, count * 2),
+            settings.TOKEN_BLACKLIST_BLOOM_ERROR_RATE,
+        )
+        for jti in live.values_list("token__jti", flat=True).iterator(chunk_size=10000):
+            bloom.add(jti)
+        self._bloom, self._seq, self._generation = bloom, seq, generation
+        logger.info(f"Token blacklist filter rebuilt with {count} entries ({len(bloom.bits) / 1024 / 1024:.1f} MiB)")
+
+    def _sync(self):
+        """Bring the filter up to date; False while it may be missing entries."""
+        # The log position is read before the rebuild scan: anything logged
+        # later is replayed on top, and adds are idempotent
+        seq, generation = self._shared_state()
+        if self._bloom is None or generation != self._generation or seq < self._seq:
+            self._rebuild(seq, generation)
+            return True
+
+        keys = [_entry_key(n) for n in range(self._seq + 1, seq + 1)]
+        entries = cache.get_many(keys)
+        for key in keys:
+            if key not in entries:
+                break
+            self._bloom.add(entries[key])
+            self._seq += 1
+        if self._seq == seq:
+            self._gap_since = None
+            return True
+
+        # A writer may sit between incr and set; only a lasting gap means eviction
+        self._gap_since = self._gap_since or time.monotonic()
+        if time.monotonic() - self._gap_since > settings.TOKEN_BLACKLIST_BLOOM_GAP_SECONDS:
+            self._gap_since = None
+            self._rebuild(seq, generation)
+            return True
+        return False
+
+    def might_contain(self, jti):
+        with self._lock:
+            if not self._sync():
+                return True
+            return jti in self._bloom
+
+    def publish(self, jti):
+        with self._lock:
+            if self._bloom is not None:
+                self._bloom.add(jti)
+        try:
+            seq = cache.incr(SEQ_CACHE_KEY)
+        except ValueError:
+            cache.add(SEQ_CACHE_KEY, 0, None)
+            seq = cache.incr(SEQ_CACHE_KEY)
+        cache.set(_entry_key(seq), jti, int(api_settings.REFRESH_TOKEN_LIFETIME.total_seconds()))
+
+    def reset(self):
+        """Make every process rebuild its filter on its next check."""
+        cache.set(GENERATION_CACHE_KEY, uuid.uuid4().hex, None)
+
+
+token_blacklist_filter = TokenBlacklistFilter()
@@ -0,0 +1,212 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete, pre_delete, m2m_changed, post_migrate
+from django.dispatch import Signal, receiver
+from apis.models import (
+    EmailProviderSetting,
+    CustomUser,
+    LoginIdentifier,
+    JobSkills,
+    JobApplicationStatus,
+    JobApplication,
+    JobApplicationStat,
+    JobSkillDemand,
+    UserSkills,
+    LearningManagementStatus,
+    LearningManagement,
+    LearningResource,
+    LearningManagementSkill,
+)
+from apis.services.email_provider_cache import active_email_provider_cache
+from apis.services.smtp_pool import smtp_pool
+from apis.authentication import authenticated_user_cache
+from apis.services.token_blacklist import token_blacklist_filter
+from apis.services import response_cache
+from apis.services.job_search import get_search_backend
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+
+# Sent after ImportJSONView bulk-writes rows, which bypasses model signals.
+# `models` lists every model class that was written.
+data_imported = Signal()
+
+
+@receiver([post_save, post_delete], sender=EmailProviderSetting)
+def invalidate_active_email_provider(sender, **kwargs):
+    transaction.on_commit(active_email_provider_cache.invalidate)
+
+
+@receiver([post_save, post_delete], sender=EmailProviderSetting)
+def discard_pooled_smtp_connections(sender, instance, **kwargs):
+    # Idle connections opened with the old settings are never reused; close them now
+    provider_id = instance.pk
+    transaction.on_commit(lambda: smtp_pool.discard(provider_id))
+
+
+LOGIN_IDENTIFIER_FIELDS = {"username", "email", "phone_number"}
+
+
+@receiver(post_save, sender=CustomUser)
+def sync_login_identifiers(sender, instance, raw=False, update_fields=None, **kwargs):
+    # Saves such as the last_login update on every login don't touch identifiers
+    if raw or (update_fields is not None and not LOGIN_IDENTIFIER_FIELDS.intersection(update_fields)):
+        return
+    LoginIdentifier.sync_for_users([instance])
+
+
+@receiver(post_save, sender=CustomUser)
+def invalidate_authenticated_user(sender, instance, **kwargs):
+    user_id, active = instance.pk, instance.is_active
+    transaction.on_commit(lambda: authenticated_user_cache.invalidate(user_id, active))
+
+
+@receiver(post_delete, sender=CustomUser)
+def revoke_authenticated_user(sender, instance, **kwargs):
+    # The pk is read now: the collector clears it once the delete finishes
+    user_id = instance.pk
+    transaction.on_commit(lambda: authenticated_user_cache.invalidate(user_id, active=False))
+
+
+@receiver(post_save, sender=BlacklistedToken)
+def publish_blacklisted_token(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        jti = instance.token.jti
+        # Other workers must not learn of it before the row is visible
+        transaction.on_commit(lambda: token_blacklist_filter.publish(jti))
+
+
+CACHED_CATALOG_MODELS = (JobSkills, JobApplicationStatus)
+
+
+@receiver([post_save, post_delete], sender=JobSkills)
+@receiver([post_save, post_delete], sender=JobApplicationStatus)
+def invalidate_catalog_responses(sender, **kwargs):
+    # After commit, or a concurrent reader could cache the old rows as new
+    transaction.on_commit(lambda: response_cache.invalidate(sender))
+
+
+USER_VERSIONED_MODELS = (
+    JobApplication,
+    UserSkills,
+    LearningManagementStatus,
+    LearningManagement,
+    LearningResource,
+    LearningManagementSkill,
+)
+
+
+def _owner_ids(instance):
+    if isinstance(instance, (LearningResource, LearningManagementSkill)):
+        return list(
+            LearningManagement.objects.filter(pk=instance.learning_management_id).values_list('user_id', flat=True)
+        )
+    return [instance.user_id]
+
+
+# Set while apis.services.job_bulk writes a batch and updates the stats and
+# list versions once for it, instead of once per row
+_job_application_signals_muted = ContextVar("job_application_signals_muted", default=False)
+
+
+@contextmanager
+def job_application_signals_muted():
+    token = _job_application_signals_muted.set(True)
+    try:
+        yield
+    finally:
+        _job_application_signals_muted.reset(token)
+
+
+def invalidate_user_list_versions(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    if sender is JobApplication and _job_application_signals_muted.get():
+        return
+    # Resolved now: on delete the parent row may be gone by commit time
+    user_ids = _owner_ids(instance)
+    transaction.on_commit(lambda: response_cache.invalidate_for_users(sender, user_ids))
+
+
+# Connected per model: a receiver without a sender listens to every model's
+# post_delete, which stops Django from fast-deleting any table
+for _model in USER_VERSIONED_MODELS:
+    post_save.connect(invalidate_user_list_versions, sender=_model)
+    post_delete.connect(invalidate_user_list_versions, sender=_model)
+
+
+@receiver(m2m_changed, sender=JobApplication.skills.through)
+@receiver(m2m_changed, sender=JobApplication.preferred_skills.through)
+def invalidate_job_application_skills(sender, instance, action, reverse, pk_set, **kwargs):
+    if not action.startswith('post_'):
+        return
+    if not reverse:
+        user_ids = [instance.user_id]
+    elif pk_set:
+        user_ids = list(JobApplication.objects.filter(pk__in=pk_set).values_list('user_id', flat=True))
+    else:
+        # Cleared from the skill's side: the owners are no longer known
+        transaction.on_commit(lambda: response_cache.invalidate(JobApplication))
+        return
+    transaction.on_commit(lambda: response_cache.invalidate_for_users(JobApplication, user_ids))
+
+
+@receiver(m2m_changed, sender=JobApplication.skills.through)
+@receiver(m2m_changed, sender=JobApplication.preferred_skills.through)
+def update_job_skill_demand(sender, instance, action, reverse, pk_set, **kwargs):
+    # Runs inside the add/remove/clear transaction
+    if action not in ("post_add", "pre_remove", "pre_clear") or (action != "pre_clear" and not pk_set):
+        return
+    own, other = ("jobskills", "jobapplication") if reverse else ("jobapplication", "jobskills")
+    links = sender.objects.filter(**{own: instance})
+    if pk_set:
+        links = links.filter(**{f"{other}_id__in": pk_set})
+    # Counted from the rows themselves: pk_set may name links that didn't
+    # exist (remove) and, once removed, the rows are gone
+    keys = JobSkillDemand.keys_for_links(JobSkillDemand.column_for(sender), links)
+    if action == "post_add":
+        JobSkillDemand.apply([], keys)
+    else:
+        JobSkillDemand.apply(keys, [])
+
+
+@receiver(pre_delete, sender=JobApplication)
+def decrement_job_skill_demand(sender, instance, **kwargs):
+    if _job_application_signals_muted.get():
+        return
+    # Before the delete cascades to the application's skill rows
+    JobSkillDemand.apply(JobSkillDemand.keys_for_applications([instance.pk]), [])
+
+
+@receiver(post_delete, sender=JobApplication)
+def decrement_job_application_stats(sender, instance, **kwargs):
+    if _job_application_signals_muted.get():
+        return
+    # Runs inside the delete's transaction, cascades included
+    JobApplicationStat.apply(instance.user_id, JobApplicationStat.keys_for(instance), [])
+
+
+@receiver(post_migrate)
+def install_job_search_index(sender, using, **kwargs):
+    # The FTS5 backend's triggers index every later write, bulk ones included
+    if sender.name == "apis":
+        get_search_backend().install(using=using)
+
+
+@receiver(data_imported)
+def invalidate_after_import(sender, models, **kwargs):
+    if EmailProviderSetting in models:
+        active_email_provider_cache.invalidate()
+    if CustomUser in models:
+        LoginIdentifier.rebuild()
+        authenticated_user_cache.clear()
+    if JobApplication in models or JobApplicationStatus in models:
+        JobApplicationStat.rebuild()
+    if JobApplication in models or JobSkills in models:
+        JobSkillDemand.rebuild()
+    for model in CACHED_CATALOG_MODELS:
+        if model in models:
+            response_cache.invalidate(model)
+    for model in USER_VERSIONED_MODELS:
+        if model in models:
+            # Bulk writes don't say whose rows changed; bump the model-wide stamp
+            response_cache.invalidate(model)
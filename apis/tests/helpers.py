@@ -0,0 +1,26 @@
+import tempfile
+from itertools import count
+from django.test import override_settings
+from apis.models import CustomUser
+from apis.serializers import CustomTokenObtainPairSerializer
+
+_phone_numbers = count(5550000000)
+
+
+def create_user(username, **fields):
+    fields.setdefault("email", f"{username}@example.com")
+    fields.setdefault("phone_number", f"+1{next(_phone_numbers)}")
+    return CustomUser.objects.create_user(username=username, password="s3cret-Passw0rd", **fields)
+
+
+def auth_header(user):
+    """The Authorization header value of a fresh access token for `user`."""
+    return f"Bearer {CustomTokenObtainPairSerializer.get_token(user).access_token}"
+
+
+def shared_cache(location=None):
+    """Settings override for a default cache that other processes can share."""
+    return override_settings(CACHES={"default": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": location or tempfile.mkdtemp(),
+    }})
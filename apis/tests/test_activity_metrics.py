@@ -0,0 +1,26 @@
+from datetime import date, timedelta
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from apis.tests.helpers import auth_header, create_user
+
+
+class AdminActivityMetricsViewTests(TestCase):
+    def setUp(self):
+        admin = create_user("admin", is_staff=True, is_superuser=True)
+        self.client.defaults["HTTP_AUTHORIZATION"] = auth_header(admin)
+        self.url = reverse("admin_activity_metrics")
+
+    def test_rejects_dates_that_are_not_dates(self):
+        for params in ({"end": "foo"}, {"start": "foo"}, {"start": "2025-02-30"}, {"start": "2025-03-02", "end": "2025-03-01"}):
+            with self.subTest(params=params):
+                response = self.client.get(self.url, params)
+                self.assertEqual(response.status_code, 400)
+                self.assertIn("error", response.json())
+
+    def test_defaults_to_the_last_30_days(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual(date.fromisoformat(body["end"]), timezone.localdate())
+        self.assertEqual(date.fromisoformat(body["end"]) - date.fromisoformat(body["start"]), timedelta(days=29))
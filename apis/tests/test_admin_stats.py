@@ -0,0 +1,21 @@
+from django.test import TestCase
+from django.urls import reverse
+from apis.authentication import authenticated_user_cache
+from apis.tests.helpers import auth_header, create_user
+
+
+class AdminStatsTests(TestCase):
+    def setUp(self):
+        self.addCleanup(authenticated_user_cache.clear)
+
+    def test_anonymous_and_regular_users_are_refused(self):
+        self.assertEqual(self.client.get(reverse("admin_stats")).status_code, 401)
+        user = create_user("alice")
+        response = self.client.get(reverse("admin_stats"), headers={"Authorization": auth_header(user)})
+        self.assertEqual(response.status_code, 403)
+
+    def test_admins_see_the_password_hashing_pool(self):
+        admin = create_user("admin", is_staff=True)
+        response = self.client.get(reverse("admin_stats"), headers={"Authorization": auth_header(admin)})
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("passwordHashing", response.json())
@@ -0,0 +1,55 @@
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from apis.authentication import ClaimsUser, StatelessJWTAuthentication, authenticated_user_cache
+from apis.models import CustomUser
+from apis.serializers import CustomTokenObtainPairSerializer
+from apis.tests.helpers import auth_header, create_user, shared_cache
+
+
+class AuthenticatedUserCacheTests(TestCase):
+    def setUp(self):
+        self.user = create_user("alice")
+        self.addCleanup(authenticated_user_cache.clear)
+
+    def test_invalidation_waits_for_commit(self):
+        self.assertTrue(authenticated_user_cache.get(self.user.id).is_active)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.is_active = False
+            self.user.save()
+            self.assertTrue(authenticated_user_cache.get(self.user.id).is_active)
+        self.assertFalse(authenticated_user_cache.get(self.user.id).is_active)
+
+
+class StatelessJWTAuthenticationTests(TestCase):
+    def setUp(self):
+        self.user = create_user("bob")
+        self.token = CustomTokenObtainPairSerializer.get_token(self.user).access_token
+        self.addCleanup(authenticated_user_cache.clear)
+
+    def test_loads_the_user_with_a_process_local_cache(self):
+        self.assertIsInstance(StatelessJWTAuthentication().get_user(self.token), CustomUser)
+
+    def test_reads_the_claims_with_a_shared_cache(self):
+        with shared_cache():
+            self.addCleanup(cache.clear)
+            with self.assertNumQueries(0):
+                user = StatelessJWTAuthentication().get_user(self.token)
+        self.assertIsInstance(user, ClaimsUser)
+        self.assertEqual(str(user.id), str(self.user.id))
+
+    def test_rejects_a_deactivated_user_on_either_cache(self):
+        url = reverse("kanban_board_learning_plans")
+        header = auth_header(self.user)
+        for label, caches in (("locmem", override_settings()), ("shared", shared_cache())):
+            with self.subTest(cache=label), caches:
+                self.addCleanup(cache.clear)
+                with self.captureOnCommitCallbacks(execute=True):
+                    self.user.is_active = True
+                    self.user.save()
+                self.assertEqual(self.client.get(url, HTTP_AUTHORIZATION=header).status_code, 200)
+                with self.captureOnCommitCallbacks(execute=True):
+                    self.user.is_active = False
+                    self.user.save()
+                with self.assertLogs("color_logger", level="ERROR"):
+                    self.assertEqual(self.client.get(url, HTTP_AUTHORIZATION=header).status_code, 401)
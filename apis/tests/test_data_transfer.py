@@ -0,0 +1,148 @@
+import io
+import json
+from datetime import UTC, datetime
+from unittest import mock
+from asgiref.sync import async_to_sync, sync_to_async
+from django.core import serializers
+from django.db import IntegrityError, connection
+from django.test import SimpleTestCase, TestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from apis.models import JobApplication, JobApplicationStatus, JobSkills
+from apis.services.data_transfer import (
+    _JSONStream,
+    aiter_export_json,
+    import_json_stream,
+    iter_export_json,
+    iter_import_objects,
+)
+from apis.tests.helpers import auth_header, create_user
+
+
+class ExportTests(TestCase):
+    def setUp(self):
+        JobSkills.objects.bulk_create(JobSkills(name=f"Skill {i}") for i in range(5))
+
+    def test_async_export_matches_sync_export(self):
+        async def collect():
+            return "".join([chunk async for chunk in aiter_export_json(chunk_size=2)])
+
+        exported = async_to_sync(collect)()
+        self.assertEqual(exported, "".join(iter_export_json(chunk_size=2)))
+        self.assertEqual(len(json.loads(exported)["apis.JobSkills"]), 5)
+
+    def test_export_matches_the_django_serializer(self):
+        user = create_user("alice")
+        status = JobApplicationStatus.objects.create(name="Applied", category="applied", color="#2563eb")
+        skills = list(JobSkills.objects.order_by("pk"))
+        for i in range(5):
+            application = JobApplication.objects.create(
+                user=user, status=status, position="Engineer", company_name=f"Acme {i}", location="Remote"
+            )
+            application.skills.set(skills[:i])
+            application.preferred_skills.set(skills[i:i + 1])
+
+        with CaptureQueriesContext(connection) as queries:
+            exported = json.loads("".join(iter_export_json(chunk_size=2)))["apis.JobApplication"]
+        # One query per chunk of 2 for each M2M field, not one per row
+        through_table = JobApplication.skills.through._meta.db_table
+        self.assertEqual(sum(f'FROM "{through_table}"' in query["sql"] for query in queries), 3)
+        expected = json.loads(serializers.serialize("json", JobApplication.objects.order_by("pk")))
+        self.assertEqual(exported, expected)
+
+    async def test_asgi_export_streams_an_async_iterator(self):
+        # Django's ASGI handler lists a sync iterator whole before sending it
+        admin = await sync_to_async(create_user)("admin", is_staff=True, is_superuser=True)
+        header = await sync_to_async(auth_header)(admin)
+        response = await self.async_client.get(reverse("export_all_tables"), headers={"Authorization": header})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.is_async)
+        body = b"".join([chunk async for chunk in response.streaming_content])
+        self.assertEqual(len(json.loads(body)["apis.JobSkills"]), 5)
+
+    def test_wsgi_export_streams_a_sync_iterator(self):
+        admin = create_user("admin", is_staff=True, is_superuser=True)
+        response = self.client.get(reverse("export_all_tables"), headers={"Authorization": auth_header(admin)})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.is_async)
+        self.assertEqual(len(json.loads(b"".join(response.streaming_content))["apis.JobSkills"]), 5)
+
+
+def export_file(objects):
+    """An export file holding `objects`, a list of (model label, fields) in file order."""
+    sections = {}
+    for pk, (label, fields) in enumerate(objects, start=1):
+        sections.setdefault(label, []).append({"model": label.lower(), "pk": pk, "fields": fields})
+    return io.BytesIO(json.dumps(sections).encode())
+
+
+class ImportTests(TransactionTestCase):
+    # Outside a test transaction, so SQLite really runs with foreign keys off
+    def dangling_import(self, atomic):
+        application = {
+            "position": "Engineer", "company_name": "Acme", "location": "Remote",
+            "application_through": "email", "status": 999, "user": 999,
+            "created_at": "2025-01-01T00:00:00Z", "updated_at": "2025-01-01T00:00:00Z",
+            "skills": [], "preferred_skills": [],
+        }
+        fileobj = export_file([("apis.JobSkills", {"name": "Python"}), ("apis.JobApplication", application)])
+        with self.assertRaises(IntegrityError):
+            import_json_stream(fileobj, batch_size=1, atomic=atomic)
+
+    def test_non_atomic_import_never_commits_a_dangling_foreign_key(self):
+        self.dangling_import(atomic=False)
+        # The batch before the bad one stays committed
+        self.assertEqual(list(JobSkills.objects.values_list("name", flat=True)), ["Python"])
+        self.assertFalse(JobApplication.objects.exists())
+
+    def test_atomic_import_rolls_everything_back(self):
+        self.dangling_import(atomic=True)
+        self.assertFalse(JobSkills.objects.exists())
+        self.assertFalse(JobApplication.objects.exists())
+
+    def test_import_round_trips_an_export(self):
+        JobSkills.objects.bulk_create(JobSkills(name=f"Skill {i}") for i in range(5))
+        exported = io.BytesIO("".join(iter_export_json(chunk_size=2)).encode())
+        JobSkills.objects.all().delete()
+        counts = import_json_stream(exported, batch_size=2, atomic=False)
+        self.assertEqual(counts["apis.JobSkills"], 5)
+        self.assertEqual(JobSkills.objects.count(), 5)
+
+
+    def test_import_keeps_exported_timestamps_and_skills(self):
+        user = create_user("alice")
+        status = JobApplicationStatus.objects.create(name="Applied", category="applied", color="#2563eb")
+        python = JobSkills.objects.create(name="Python")
+        application = JobApplication.objects.create(
+            user=user, status=status, position="Engineer", company_name="Acme", location="Remote"
+        )
+        application.skills.add(python)
+        stamped = datetime(2024, 1, 2, 3, 4, 5, tzinfo=UTC)
+        JobApplication.objects.update(created_at=stamped, updated_at=stamped)
+        exported = io.BytesIO("".join(iter_export_json()).encode())
+        JobApplication.objects.all().delete()
+
+        import_json_stream(exported, atomic=True)
+        application = JobApplication.objects.get()
+        self.assertEqual((application.created_at, application.updated_at), (stamped, stamped))
+        self.assertEqual(list(application.skills.all()), [python])
+
+class JSONStreamTests(SimpleTestCase):
+    def test_malformed_value_is_rejected_without_reading_the_whole_file(self):
+        body = b'{"apis.JobSkills": [{"name": "' + b"x" * (1024 * 1024)
+        fileobj = io.BytesIO(body)
+        with mock.patch.object(_JSONStream, "MAX_VALUE_SIZE", 100 * 1024), mock.patch.object(
+            _JSONStream, "READ_SIZE", 16 * 1024
+        ):
+            with self.assertRaisesMessage(ValueError, "malformed"):
+                list(iter_import_objects(fileobj))
+        self.assertLess(fileobj.tell(), 200 * 1024)
+
+    def test_values_split_across_reads_are_parsed(self):
+        names = [f"Skill {i} " + "y" * 100 for i in range(50)]
+        fileobj = export_file([("apis.JobSkills", {"name": name}) for name in names])
+        with mock.patch.object(_JSONStream, "READ_SIZE", 7):
+            parsed = [obj["fields"]["name"] for _, obj in iter_import_objects(fileobj)]
+        self.assertEqual(parsed, names)
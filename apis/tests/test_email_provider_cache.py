@@ -0,0 +1,85 @@
+import os
+import subprocess
+import sys
+import tempfile
+from django.conf import settings
+from django.core.cache import cache
+from django.test import TestCase
+from apis.models import EmailProviderSetting
+from apis.services.email_provider_cache import VERSION_CACHE_KEY, active_email_provider_cache
+from apis.tests.helpers import shared_cache
+
+
+def create_provider(name):
+    return EmailProviderSetting.objects.create(
+        name=name, provider_type="smtp", host=f"{name}.example.com", port=587, from_email=f"noreply@{name}.example.com"
+    )
+
+
+def invalidate_in_another_process(cache_location):
+    """Run active_email_provider_cache.invalidate() in a separate interpreter, as another worker would."""
+    env = {**os.environ, "CACHE_BACKEND": "file", "CACHE_LOCATION": cache_location, "CACHE_KEY_PREFIX": ""}
+    subprocess.run(
+        [
+            sys.executable, "-c",
+            "import django; django.setup(); "
+            "from apis.services.email_provider_cache import active_email_provider_cache; "
+            "active_email_provider_cache.invalidate()",
+        ],
+        cwd=settings.BASE_DIR, env=env, check=True, capture_output=True,
+    )
+
+
+class SharedActiveEmailProviderCacheTests(TestCase):
+    def setUp(self):
+        self.cache_location = tempfile.mkdtemp()
+        caches = shared_cache(self.cache_location)
+        caches.enable()
+        self.addCleanup(caches.disable)
+        self.addCleanup(active_email_provider_cache.invalidate)
+        self.first = create_provider("first")
+        active_email_provider_cache.invalidate()
+
+    def test_cached_lookup_does_no_queries(self):
+        self.assertEqual(active_email_provider_cache.get(), self.first)
+        with self.assertNumQueries(0):
+            self.assertEqual(active_email_provider_cache.get(), self.first)
+
+    def test_invalidation_from_another_process_is_seen(self):
+        self.assertEqual(active_email_provider_cache.get(), self.first)
+        # TestCase never runs on_commit callbacks, so this process isn't told
+        second = create_provider("second")
+        self.assertEqual(active_email_provider_cache.get(), self.first)
+
+        invalidate_in_another_process(self.cache_location)
+        self.assertEqual(active_email_provider_cache.get(), second)
+
+    def test_invalidation_waits_for_commit(self):
+        self.assertEqual(active_email_provider_cache.get(), self.first)
+        version = cache.get(VERSION_CACHE_KEY)
+        with self.captureOnCommitCallbacks(execute=True):
+            second = create_provider("second")
+            # Not yet committed: a concurrent worker must not be told to reload
+            self.assertEqual(cache.get(VERSION_CACHE_KEY), version)
+            self.assertEqual(active_email_provider_cache.get(), self.first)
+        self.assertNotEqual(cache.get(VERSION_CACHE_KEY), version)
+        self.assertEqual(active_email_provider_cache.get(), second)
+
+    def test_deleting_the_active_provider_takes_effect(self):
+        self.assertEqual(active_email_provider_cache.get(), self.first)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.first.delete()
+        self.assertIsNone(active_email_provider_cache.get())
+
+
+class LocalActiveEmailProviderCacheTests(TestCase):
+    def setUp(self):
+        self.first = create_provider("first")
+
+    def test_process_local_cache_reads_the_row_every_time(self):
+        # Other workers' invalidations could never arrive, so nothing is cached
+        with self.assertNumQueries(1):
+            self.assertEqual(active_email_provider_cache.get(), self.first)
+        second = create_provider("second")
+        with self.assertNumQueries(1):
+            self.assertEqual(active_email_provider_cache.get(), second)
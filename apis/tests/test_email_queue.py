@@ -0,0 +1,120 @@
+import smtplib
+from datetime import timedelta
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from apis.models import EmailLog, EmailProviderSetting
+from apis.services.email_provider_cache import active_email_provider_cache
+from apis.services.email_service import EmailService
+from apis.services.smtp_pool import smtp_pool
+
+
+class BouncingBackend(EmailBackend):
+    """locmem, except that mail to bounce@ addresses is refused."""
+
+    def send_messages(self, messages):
+        for message in messages:
+            if any(address.startswith("bounce@") for address in message.to):
+                raise smtplib.SMTPRecipientsRefused({message.to[0]: (550, b"No such user")})
+        return super().send_messages(messages)
+
+
+@override_settings(
+    EMAIL_SMTP_BACKEND="apis.tests.test_email_queue.BouncingBackend",
+    EMAIL_QUEUE_MAX_ATTEMPTS=3,
+    EMAIL_QUEUE_RETRY_BASE_SECONDS=30,
+    EMAIL_QUEUE_LEASE_SECONDS=300,
+)
+class EmailQueueTests(TestCase):
+    def setUp(self):
+        self.addCleanup(smtp_pool.close_all)
+        self.addCleanup(active_email_provider_cache.invalidate)
+        self.provider = EmailProviderSetting.objects.create(
+            name="smtp", provider_type="smtp", host="smtp.example.com", port=587, from_email="noreply@example.com"
+        )
+
+    def enqueue(self, *addresses, **fields):
+        return EmailLog.objects.bulk_create(
+            EmailLog(template_name="t", subject="s", body="b", to=address, email_provider=self.provider, **fields)
+            for address in addresses
+        )
+
+    def test_queueing_returns_before_anything_is_sent(self):
+        email_log = EmailService.queue_email_with_template(
+            "password_reset.html", {"reset_url": "https://example.com/reset"}, "Reset", ["alice@example.com"]
+        )
+        self.assertEqual((email_log.status, email_log.attempts), ("queued", 0))
+        self.assertEqual(mail.outbox, [])
+
+        with self.assertLogs("color_logger", level="INFO"):
+            self.assertEqual(EmailService.process_queue(), 1)
+        email_log.refresh_from_db()
+        self.assertEqual((email_log.status, email_log.attempts), ("sent", 1))
+        self.assertEqual(mail.outbox[0].to, ["alice@example.com"])
+
+    def test_claim_leases_rows_to_one_worker(self):
+        self.enqueue("a@example.com", "b@example.com", "c@example.com")
+
+        first = EmailService.claim_queued_emails(2)
+        self.assertEqual(len(first), 2)
+        for email_log in first:
+            self.assertEqual(email_log.status, "sending")
+            self.assertGreater(email_log.next_attempt_at, timezone.now() + timedelta(seconds=290))
+
+        # A second worker gets only what is left, then nothing
+        second = EmailService.claim_queued_emails(2)
+        self.assertEqual([email_log.to for email_log in second], ["c@example.com"])
+        self.assertEqual(EmailService.claim_queued_emails(2), [])
+
+    def test_rows_not_yet_due_are_not_claimed(self):
+        self.enqueue("later@example.com", next_attempt_at=timezone.now() + timedelta(minutes=5))
+        self.assertEqual(EmailService.claim_queued_emails(10), [])
+
+    def test_failures_back_off_exponentially_then_fail(self):
+        (email_log,) = self.enqueue("bounce@example.com")
+
+        for attempt, delay in ((1, 30), (2, 60)):
+            with self.subTest(attempt=attempt), self.assertLogs("color_logger", level="ERROR"):
+                before = timezone.now()
+                self.assertEqual(EmailService.process_queue(), 1)
+                email_log.refresh_from_db()
+                self.assertEqual((email_log.status, email_log.attempts), ("queued", attempt))
+                self.assertIn("No such user", email_log.error_message)
+                self.assertGreaterEqual(email_log.next_attempt_at, before + timedelta(seconds=delay))
+                self.assertLess(email_log.next_attempt_at, before + timedelta(seconds=delay + 5))
+
+                # Not retried before the backoff has passed
+                self.assertEqual(EmailService.process_queue(), 0)
+                EmailLog.objects.filter(pk=email_log.pk).update(next_attempt_at=timezone.now())
+
+        with self.assertLogs("color_logger", level="ERROR"):
+            EmailService.process_queue()
+        email_log.refresh_from_db()
+        self.assertEqual((email_log.status, email_log.attempts), ("failed", 3))
+        self.assertEqual(EmailService.process_queue(), 0)
+
+    def test_expired_lease_is_claimed_again(self):
+        # Left in "sending" by a worker that died mid-batch
+        (abandoned,) = self.enqueue(
+            "a@example.com", status="sending", next_attempt_at=timezone.now() - timedelta(seconds=1)
+        )
+        (leased,) = self.enqueue(
+            "b@example.com", status="sending", next_attempt_at=timezone.now() + timedelta(minutes=5)
+        )
+
+        claimed = EmailService.claim_queued_emails(10)
+        self.assertEqual([email_log.pk for email_log in claimed], [abandoned.pk])
+
+        with self.assertLogs("color_logger", level="INFO"):
+            EmailService._send_logs(claimed)
+        self.assertEqual(EmailLog.objects.get(pk=abandoned.pk).status, "sent")
+        self.assertEqual(EmailLog.objects.get(pk=leased.pk).status, "sending")
+
+    def test_resend_puts_a_failed_email_back_on_the_queue(self):
+        (email_log,) = self.enqueue("a@example.com", status="failed", attempts=3, error_message="boom")
+        EmailService.resend_email(email_log.pk)
+        with self.assertLogs("color_logger", level="INFO"):
+            self.assertEqual(EmailService.process_queue(), 1)
+        email_log.refresh_from_db()
+        self.assertEqual((email_log.status, email_log.attempts, email_log.error_message), ("sent", 1, None))
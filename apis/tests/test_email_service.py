@@ -0,0 +1,133 @@
+import smtplib
+from unittest import mock
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from apis.models import EmailLog, EmailProviderSetting
+from apis.services.email_provider_cache import active_email_provider_cache
+from apis.services.email_service import EmailService
+from apis.services.smtp_pool import smtp_pool
+from apis.tests.test_email_queue import BouncingBackend
+
+
+class DroppingBackend(EmailBackend):
+    """Sends FAIL_AT messages, then loses its socket and can't reconnect."""
+    FAIL_AT = 2
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.connection = object()
+        self.sent = 0
+
+    def send_messages(self, messages):
+        if self.sent >= self.FAIL_AT:
+            self.connection = None
+            raise smtplib.SMTPServerDisconnected("Connection unexpectedly closed")
+        self.sent += len(messages)
+        return super().send_messages(messages)
+
+    def open(self):
+        if self.connection is None:
+            raise smtplib.SMTPConnectError(421, "Service not available")
+        return True
+
+
+@override_settings(EMAIL_SMTP_BACKEND="apis.tests.test_email_service.DroppingBackend", EMAIL_QUEUE_MAX_ATTEMPTS=3)
+class SendLogsTests(TestCase):
+    def setUp(self):
+        self.addCleanup(smtp_pool.close_all)
+        provider = EmailProviderSetting.objects.create(
+            name="smtp", provider_type="smtp", host="smtp.example.com", port=587, from_email="noreply@example.com"
+        )
+        self.email_logs = EmailLog.objects.bulk_create(
+            EmailLog(template_name="t", subject="s", body="b", to=f"user{i}@example.com", email_provider=provider)
+            for i in range(5)
+        )
+
+    def test_failed_reconnect_only_fails_messages_not_yet_sent(self):
+        with self.assertLogs("color_logger", level="INFO"):
+            EmailService._send_logs(self.email_logs)
+
+        statuses = list(EmailLog.objects.order_by("id").values_list("status", "attempts"))
+        self.assertEqual(statuses[:2], [("sent", 1)] * 2)
+        # Requeued for a retry, not marked sent
+        self.assertEqual(statuses[2:], [("queued", 1)] * 3)
+        self.assertIn("Service not available", EmailLog.objects.order_by("id")[2].error_message)
+
+
+class CountingBouncingBackend(BouncingBackend):
+    opens = 0
+
+    def open(self):
+        CountingBouncingBackend.opens += 1
+        return super().open()
+
+
+@override_settings(EMAIL_SMTP_BACKEND="apis.tests.test_email_service.CountingBouncingBackend")
+class BulkEmailTests(TestCase):
+    def setUp(self):
+        CountingBouncingBackend.opens = 0
+        self.addCleanup(smtp_pool.close_all)
+        self.addCleanup(active_email_provider_cache.invalidate)
+        EmailProviderSetting.objects.create(
+            name="smtp", provider_type="smtp", host="smtp.example.com", port=587, from_email="noreply@example.com"
+        )
+        active_email_provider_cache.get()
+
+    def recipients(self, count, **context):
+        return [{"to": [f"user{i}@example.com"], "context": context} for i in range(count)]
+
+    def test_renders_once_per_distinct_context(self):
+        recipients = self.recipients(3, reset_url="https://example.com/a") + self.recipients(2)
+        with mock.patch.object(EmailService, "_render", return_value="<p>hi</p>") as render:
+            with self.assertLogs("color_logger", level="INFO"):
+                EmailService.send_bulk_email_with_template("password_reset.html", "Hi", recipients)
+        self.assertEqual(render.call_count, 2)
+
+    def test_log_writes_do_not_grow_with_the_batch(self):
+        queries = []
+        for count in (2, 40):
+            with CaptureQueriesContext(connection) as captured, self.assertLogs("color_logger", level="INFO"):
+                EmailService.send_bulk_email_with_template("password_reset.html", "Hi", self.recipients(count))
+            queries.append(len(captured))
+        self.assertEqual(queries[0], queries[1])
+        self.assertEqual(EmailLog.objects.filter(status="sent").count(), 42)
+
+    def test_batch_shares_one_connection(self):
+        with self.assertLogs("color_logger", level="INFO"):
+            EmailService.send_bulk_email_with_template("password_reset.html", "Hi", self.recipients(10))
+        self.assertEqual(CountingBouncingBackend.opens, 1)
+        self.assertEqual(len(mail.outbox), 10)
+
+    def test_reports_status_per_recipient(self):
+        recipients = [
+            {"to": ["alice@example.com"]},
+            {"to": ["bounce@example.com"]},
+            {"to": ["bob@example.com", "carol@example.com"], "context": {"reset_url": "https://example.com/b"}},
+        ]
+        with self.assertLogs("color_logger", level="INFO"):
+            results = EmailService.send_bulk_email_with_template("password_reset.html", "Hi", recipients)
+
+        self.assertEqual(
+            [(result["to"], result["status"]) for result in results],
+            [
+                ("alice@example.com", "sent"),
+                ("bounce@example.com", "queued"),
+                ("bob@example.com, carol@example.com", "sent"),
+            ],
+        )
+        self.assertIsNone(results[0]["error"])
+        self.assertIn("No such user", results[1]["error"])
+        self.assertEqual(EmailLog.objects.get(pk=results[1]["email_log_id"]).status, "queued")
+
+    def test_queue_leaves_the_batch_for_the_worker(self):
+        results = EmailService.send_bulk_email_with_template(
+            "password_reset.html", "Hi", self.recipients(3), queue=True
+        )
+        self.assertEqual({result["status"] for result in results}, {"queued"})
+        self.assertEqual(mail.outbox, [])
+        with self.assertLogs("color_logger", level="INFO"):
+            self.assertEqual(EmailService.process_queue(), 3)
+        self.assertEqual(len(mail.outbox), 3)
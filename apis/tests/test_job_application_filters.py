@@ -0,0 +1,39 @@
+from django.db import connection
+from django.test import TestCase
+from django.urls import reverse
+from apis.management.commands.check_job_application_query_plans import FULL_SCAN, filter_plans
+from apis.models import JobApplicationStatus, JobSkills
+from apis.tests.helpers import auth_header, create_user
+from apis.tests.test_job_applications import create_applications
+
+
+class JobApplicationQueryPlanTests(TestCase):
+    def test_every_filter_combination_uses_an_index(self):
+        if connection.vendor == "postgresql":
+            # Tiny test tables are cheaper to scan; make the planner pick an index whenever one applies
+            with connection.cursor() as cursor:
+                cursor.execute("SET LOCAL enable_seqscan = off")
+        for label, plan in filter_plans():
+            with self.subTest(filters=label):
+                self.assertIsNone(FULL_SCAN.search(plan), plan)
+
+
+class JobApplicationFilterTests(TestCase):
+    def setUp(self):
+        self.user = create_user("alice")
+        self.client.defaults["HTTP_AUTHORIZATION"] = auth_header(self.user)
+        applied = JobApplicationStatus.objects.create(name="Applied", category="applied", color="#000")
+        interview = JobApplicationStatus.objects.create(name="Interview", category="interview", color="#000")
+        python, django = JobSkills.objects.bulk_create([JobSkills(name="Python"), JobSkills(name="Django")])
+        self.python = create_applications(self.user, 2, applied, [python])
+        self.django = create_applications(self.user, 1, interview, [django])
+
+    def ids(self, **params):
+        response = self.client.get(reverse("job_application_list_create"), params)
+        self.assertEqual(response.status_code, 200)
+        return sorted(item["id"] for item in response.json())
+
+    def test_filters(self):
+        self.assertEqual(self.ids(category="interview"), [a.id for a in self.django])
+        self.assertEqual(self.ids(skills=str(self.django[0].skills.get().id)), [a.id for a in self.django])
+        self.assertEqual(self.ids(), sorted(a.id for a in self.python + self.django))
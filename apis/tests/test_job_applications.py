@@ -0,0 +1,62 @@
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.db import connection
+from django.urls import reverse
+from apis.authentication import authenticated_user_cache
+from apis.models import JobApplication, JobApplicationStatus, JobSkills
+from apis.tests.helpers import auth_header, create_user
+
+
+def create_applications(user, count, status, skills):
+    applications = JobApplication.objects.bulk_create(
+        JobApplication(
+            user=user, status=status, position=f"Engineer {i}", company_name=f"Company {i}", location="Remote"
+        )
+        for i in range(count)
+    )
+    for field in ("skills", "preferred_skills"):
+        through = getattr(JobApplication, field).through
+        through.objects.bulk_create(
+            through(jobapplication_id=application.id, jobskills_id=skill.id)
+            for application in applications
+            for skill in skills
+        )
+    return applications
+
+
+class JobApplicationQueryCountTests(TestCase):
+    # Auth user, applications, then one prefetch per M2M; statuses are joined
+    LIST_QUERIES = 4
+
+    def setUp(self):
+        self.user = create_user("alice")
+        self.status = JobApplicationStatus.objects.create(name="Applied", category="applied", color="#2563eb")
+        self.skills = JobSkills.objects.bulk_create(JobSkills(name=f"Skill {i}") for i in range(3))
+        self.client.defaults["HTTP_AUTHORIZATION"] = auth_header(self.user)
+        self.addCleanup(authenticated_user_cache.clear)
+
+    def list_queries(self):
+        authenticated_user_cache.clear()
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("job_application_list_create"))
+        self.assertEqual(response.status_code, 200)
+        return response.json(), len(queries)
+
+    def test_list_query_count_does_not_grow_with_the_number_of_applications(self):
+        created = 0
+        for count in (1, 100, 1000):
+            with self.subTest(applications=count):
+                create_applications(self.user, count - created, self.status, self.skills)
+                created = count
+                items, queries = self.list_queries()
+                self.assertEqual(len(items), count)
+                self.assertEqual(len(items[0]["skills_detail"]), 3)
+                self.assertEqual(items[0]["status_detail"]["name"], "Applied")
+                self.assertEqual(queries, self.LIST_QUERIES)
+
+    def test_detail_is_served_with_the_same_plan(self):
+        application = create_applications(self.user, 1, self.status, self.skills)[0]
+        authenticated_user_cache.clear()
+        with self.assertNumQueries(self.LIST_QUERIES):
+            response = self.client.get(reverse("job_application_detail", args=[application.id]))
+        self.assertEqual(len(response.json()["preferred_skills_detail"]), 3)
@@ -0,0 +1,271 @@
+import json
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from apis.models import JobApplication, JobApplicationStat, JobApplicationStatus, JobSkills
+from apis.models.job_management import AutomationJobApplication
+from apis.services import response_cache
+from apis.services.job_bulk import bulk_create, bulk_delete
+from apis.tests.helpers import auth_header, create_user
+
+
+class BulkTestCase(TestCase):
+    def setUp(self):
+        self.user = create_user("alice")
+        self.client.defaults["HTTP_AUTHORIZATION"] = auth_header(self.user)
+        self.applied = JobApplicationStatus.objects.create(name="Applied", category="applied", color="#000")
+        self.interview = JobApplicationStatus.objects.create(name="Interview", category="interview", color="#111")
+        self.python, self.django, self.rust = JobSkills.objects.bulk_create(
+            JobSkills(name=name) for name in ("Python", "Django", "Rust")
+        )
+
+    def row(self, position, **fields):
+        return {
+            "position": position, "company_name": "Acme", "location": "Remote", "status": self.applied.id,
+            "application_through": "linkedin", **fields,
+        }
+
+    def stats(self):
+        return {
+            (dimension, key): count
+            for dimension, key, count in JobApplicationStat.objects.filter(user=self.user)
+            .exclude(dimension="week").exclude(count=0).values_list("dimension", "key", "count")
+        }
+
+    def list_version(self):
+        return response_cache.current_versions([(JobApplication, response_cache.user_scope(self.user.id))])[0]
+
+    def write(self, method, body=None, upload=None, skip_invalid=False):
+        """Call the bulk endpoint, running its on-commit callbacks; returns (response, list version changed)."""
+        url = reverse("job_application_bulk") + ("?skip_invalid=true" if skip_invalid else "")
+        version = self.list_version()
+        with self.captureOnCommitCallbacks(execute=True):
+            if upload is not None:
+                response = getattr(self.client, method)(url, {"file": upload})
+            else:
+                response = getattr(self.client, method)(url, json.dumps(body), content_type="application/json")
+        return response, self.list_version() != version
+
+    def skill_ids(self, application_id, field="skills"):
+        return set(getattr(JobApplication.objects.get(pk=application_id), field).values_list("id", flat=True))
+
+
+class BulkCreateTests(BulkTestCase):
+    def test_json_array(self):
+        rows = [
+            self.row("Backend", skills=[self.python.id, self.django.id], preferred_skills=[self.rust.id]),
+            self.row("Frontend", status=self.interview.id, application_through="email"),
+        ]
+        response, bumped = self.write("post", rows)
+
+        self.assertEqual(response.status_code, 201, response.content)
+        body = response.json()
+        self.assertEqual((body["count"], body["errors"]), (2, []))
+        backend, frontend = body["ids"]
+        self.assertEqual(self.skill_ids(backend), {self.python.id, self.django.id})
+        self.assertEqual(self.skill_ids(backend, "preferred_skills"), {self.rust.id})
+        self.assertEqual(JobApplication.objects.get(pk=frontend).status, self.interview)
+        self.assertEqual(self.stats(), {
+            ("category", "applied"): 1, ("category", "interview"): 1,
+            ("through", "linkedin"): 1, ("through", "email"): 1,
+        })
+        self.assertTrue(bumped)
+
+    def test_csv_upload(self):
+        upload = SimpleUploadedFile("applications.csv", (
+            "position,company_name,location,status,application_through,skills,preferred_skills\n"
+            f"Backend,Acme,Remote,{self.applied.id},website,{self.python.id};{self.django.id},\n"
+            f"Data,Initech,Berlin,{self.applied.id},website,{self.python.id} | {self.rust.id},{self.django.id}\n"
+        ).encode(), content_type="text/csv")
+        response, bumped = self.write("post", upload=upload)
+
+        self.assertEqual(response.status_code, 201, response.content)
+        backend, data = response.json()["ids"]
+        self.assertEqual(self.skill_ids(backend), {self.python.id, self.django.id})
+        self.assertEqual(self.skill_ids(backend, "preferred_skills"), set())
+        self.assertEqual(self.skill_ids(data), {self.python.id, self.rust.id})
+        self.assertEqual(JobApplication.objects.get(pk=data).location, "Berlin")
+        self.assertEqual(self.stats(), {("category", "applied"): 2, ("through", "website"): 2})
+        self.assertTrue(bumped)
+
+    def test_ndjson_upload(self):
+        lines = [json.dumps(self.row("Backend", skills=[self.python.id])), "", json.dumps(self.row("Data"))]
+        upload = SimpleUploadedFile("applications.ndjson", "\n".join(lines).encode())
+        response, _ = self.write("post", upload=upload)
+
+        self.assertEqual(response.status_code, 201, response.content)
+        self.assertEqual(
+            list(JobApplication.objects.order_by("id").values_list("position", flat=True)), ["Backend", "Data"]
+        )
+
+    def test_unsupported_upload_is_rejected(self):
+        response, bumped = self.write("post", upload=SimpleUploadedFile("applications.xlsx", b"PK"))
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(bumped)
+
+    def invalid_rows(self):
+        return [
+            self.row("Valid"),
+            self.row("Bad status", status=999_999),
+            "not an object",
+            self.row("Valid too", skills=[self.python.id]),
+            self.row("Bad skill", skills=[999_999]),
+        ]
+
+    def test_any_invalid_row_writes_nothing(self):
+        response, bumped = self.write("post", self.invalid_rows())
+
+        self.assertEqual(response.status_code, 400)
+        errors = response.json()["errors"]
+        self.assertEqual([error["index"] for error in errors], [1, 2, 4])
+        self.assertIn("status", errors[0]["errors"])
+        self.assertIn("non_field_errors", errors[1]["errors"])
+        self.assertIn("skills", errors[2]["errors"])
+        self.assertFalse(JobApplication.objects.exists())
+        self.assertEqual(self.stats(), {})
+        self.assertFalse(bumped)
+
+    def test_skip_invalid_writes_the_valid_rows(self):
+        response, bumped = self.write("post", self.invalid_rows(), skip_invalid=True)
+
+        self.assertEqual(response.status_code, 201)
+        body = response.json()
+        self.assertEqual(body["count"], 2)
+        self.assertEqual([error["index"] for error in body["errors"]], [1, 2, 4])
+        self.assertEqual(
+            list(JobApplication.objects.filter(pk__in=body["ids"]).values_list("position", flat=True)),
+            ["Valid", "Valid too"],
+        )
+        self.assertEqual(self.stats(), {("category", "applied"): 2, ("through", "linkedin"): 2})
+        self.assertTrue(bumped)
+
+    def test_upload_rows_are_indexed_in_file_order(self):
+        lines = [json.dumps(self.row("Valid")), "{broken", json.dumps(self.row("Bad", status="x"))]
+        upload = SimpleUploadedFile("applications.jsonl", "\n".join(lines).encode())
+        response, _ = self.write("post", upload=upload, skip_invalid=True)
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual([error["index"] for error in response.json()["errors"]], [1, 2])
+
+    @override_settings(JOB_APPLICATION_BULK_MAX_ROWS=2)
+    def test_too_many_rows_are_rejected(self):
+        response, _ = self.write("post", [self.row(str(i)) for i in range(3)])
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(JobApplication.objects.exists())
+
+
+class BulkUpdateTests(BulkTestCase):
+    def setUp(self):
+        super().setUp()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.first, self.second = bulk_create(self.user, [
+                self.row("First", skills=[self.python.id, self.django.id], preferred_skills=[self.rust.id]),
+                self.row("Second", skills=[self.rust.id]),
+            ])[0]
+
+    def test_updates_fields_and_replaces_skills(self):
+        response, bumped = self.write("patch", [
+            {"id": self.first.id, "status": self.interview.id, "skills": [self.rust.id], "preferred_skills": []},
+            # Skills not given are kept
+            {"id": str(self.second.id), "position": "Second (renamed)", "application_through": "referral"},
+        ])
+
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(response.json()["ids"], [self.first.id, self.second.id])
+        self.assertEqual(self.skill_ids(self.first.id), {self.rust.id})
+        self.assertEqual(self.skill_ids(self.first.id, "preferred_skills"), set())
+        self.assertEqual(self.skill_ids(self.second.id), {self.rust.id})
+        second = JobApplication.objects.get(pk=self.second.id)
+        self.assertEqual(second.position, "Second (renamed)")
+        self.assertGreater(second.updated_at, self.second.updated_at)
+        self.assertEqual(self.stats(), {
+            ("category", "applied"): 1, ("category", "interview"): 1,
+            ("through", "linkedin"): 1, ("through", "referral"): 1,
+        })
+        self.assertTrue(bumped)
+
+    def test_other_users_and_unknown_ids_are_errors(self):
+        theirs = JobApplication.objects.create(
+            user=create_user("bob"), status=self.applied, position="Theirs", company_name="x", location="y"
+        )
+        rows = [
+            {"id": theirs.id, "position": "Mine now"},
+            {"id": self.first.id, "position": "Renamed"},
+            {"position": "No id"},
+        ]
+        response, bumped = self.write("patch", rows)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual([error["index"] for error in response.json()["errors"]], [0, 2])
+        self.assertEqual(JobApplication.objects.get(pk=self.first.id).position, "First")
+        self.assertFalse(bumped)
+
+        response, bumped = self.write("patch", rows, skip_invalid=True)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["ids"], [self.first.id])
+        self.assertEqual(JobApplication.objects.get(pk=self.first.id).position, "Renamed")
+        self.assertEqual(JobApplication.objects.get(pk=theirs.id).position, "Theirs")
+        self.assertTrue(bumped)
+
+
+class BulkDeleteTests(TestCase):
+    def setUp(self):
+        self.user = create_user("alice")
+        self.status = JobApplicationStatus.objects.create(name="Applied", category="applied", color="#000")
+        self.skill = JobSkills.objects.create(name="Python")
+        rows = [
+            {"position": f"Engineer {i}", "company_name": "Acme", "location": "Remote", "status": self.status.id,
+             "skills": [self.skill.id], "application_through": "linkedin"}
+            for i in range(3)
+        ]
+        with self.captureOnCommitCallbacks(execute=True):
+            self.applications, errors = bulk_create(self.user, rows)
+        self.assertEqual(errors, [])
+
+    def counts(self):
+        return dict(
+            JobApplicationStat.objects.filter(user=self.user, dimension="category").values_list("key", "count")
+        )
+
+    def test_deletes_dependents_and_updates_stats_once(self):
+        first, second, kept = self.applications
+        AutomationJobApplication.objects.create(
+            job_application=first, user=self.user, application_send_date=timezone.now()
+        )
+        other = create_user("bob")
+        others = JobApplication.objects.create(
+            user=other, status=self.status, position="x", company_name="y", location="z"
+        )
+        self.assertEqual(self.counts(), {"applied": 3})
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            deleted, missing = bulk_delete(self.user, [first.id, str(second.id), others.id, 0])
+
+        self.assertEqual(deleted, [first.id, second.id])
+        self.assertEqual(missing, [others.id, 0])
+        self.assertEqual(list(JobApplication.objects.filter(user=self.user).values_list("id", flat=True)), [kept.id])
+        self.assertTrue(JobApplication.objects.filter(pk=others.id).exists())
+        self.assertFalse(AutomationJobApplication.objects.exists())
+        self.assertEqual(JobApplication.skills.through.objects.filter(jobapplication_id__in=[first.id, second.id]).count(), 0)
+        self.assertEqual(self.counts(), {"applied": 1})
+        # One list-version bump for the batch, not one per row
+        self.assertEqual(len(callbacks), 1)
+
+
+
+class BulkDeleteViewTests(BulkTestCase):
+    def test_deletes_and_reports_missing_ids(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            kept, deleted = bulk_create(self.user, [self.row("Kept"), self.row("Deleted", status=self.interview.id)])[0]
+        response, bumped = self.write("delete", {"ids": [deleted.id, 0]})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"count": 1, "ids": [deleted.id], "missing": [0]})
+        self.assertEqual(list(JobApplication.objects.values_list("id", flat=True)), [kept.id])
+        self.assertEqual(self.stats(), {("category", "applied"): 1, ("through", "linkedin"): 1})
+        self.assertTrue(bumped)
+
+    def test_ids_must_be_a_list(self):
+        response, bumped = self.write("delete", [1, 2])
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(bumped)
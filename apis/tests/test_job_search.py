@@ -0,0 +1,73 @@
+from django.test import TestCase
+from apis.models import JobApplication, JobApplicationStatus
+from apis.services.job_search import IcontainsSearchBackend, SQLiteFTS5SearchBackend
+from apis.tests.helpers import create_user
+
+
+class JobSearchRankingTests(TestCase):
+    def setUp(self):
+        self.backends = [IcontainsSearchBackend()]
+        if SQLiteFTS5SearchBackend.is_supported():
+            self.backends.append(SQLiteFTS5SearchBackend())
+        self.user = create_user("alice")
+        status = JobApplicationStatus.objects.create(name="Applied", category="applied", color="#000")
+
+        def application(position, description="", user=self.user, company_name="Acme", location="Remote"):
+            return JobApplication(
+                user=user, status=status, position=position, company_name=company_name, location=location,
+                description=description,
+            )
+
+        self.application = application
+
+        self.strong = JobApplication.objects.bulk_create([application("Rust Engineer")])[0]
+        # Newer applications that only mention the term in their description
+        self.weak = JobApplication.objects.bulk_create(
+            application(f"Engineer {i}", "some rust tooling") for i in range(250)
+        )
+        JobApplication.objects.bulk_create([application("Rust Engineer", user=create_user("bob"))])
+
+    def test_an_old_strong_match_ranks_above_newer_weak_ones(self):
+        for backend in self.backends:
+            with self.subTest(backend=type(backend).__name__):
+                self.assertEqual(backend.search("rust", self.user.id, limit=3), [
+                    self.strong.id, self.weak[-1].id, self.weak[-2].id,
+                ])
+
+    def test_pages_through_every_match(self):
+        for backend in self.backends:
+            with self.subTest(backend=type(backend).__name__):
+                ids = []
+                while page := backend.search("rust", self.user.id, limit=50, offset=len(ids)):
+                    ids += page
+                self.assertEqual(ids, [self.strong.id] + [a.id for a in reversed(self.weak)])
+
+    def test_prefix_of_the_last_term(self):
+        for backend in self.backends:
+            with self.subTest(backend=type(backend).__name__):
+                self.assertEqual(backend.search("ru", self.user.id, limit=1), [self.strong.id])
+                self.assertEqual(backend.search("rust engin", self.user.id, limit=1), [self.strong.id])
+
+    def test_ranks_by_the_last_field_needed_to_find_every_term(self):
+        carol = create_user("carol")
+        in_company, in_position_and_location, in_description = JobApplication.objects.bulk_create([
+            self.application("Engineer", user=carol, company_name="Rust Berlin GmbH"),
+            self.application("Rust Developer", user=carol, location="Berlin"),
+            self.application("Engineer", "rust in berlin", user=carol),
+        ])
+        for backend in self.backends:
+            with self.subTest(backend=type(backend).__name__):
+                self.assertEqual(backend.search("rust berlin", carol.id), [
+                    in_company.id, in_position_and_location.id, in_description.id,
+                ])
+                # A page that starts inside one tier and ends in the next
+                self.assertEqual(backend.search("rust berlin", carol.id, limit=1, offset=1), [in_position_and_location.id])
+                self.assertEqual(backend.search("rust berlin", carol.id, limit=5, offset=2), [in_description.id])
+                self.assertEqual(backend.search("rust berlin", carol.id, limit=5, offset=3), [])
+
+    def test_searches_every_user_without_an_owner(self):
+        for backend in self.backends:
+            with self.subTest(backend=type(backend).__name__):
+                top = backend.search("rust engineer", limit=2)
+                self.assertEqual(set(JobApplication.objects.filter(id__in=top).values_list("position", flat=True)), {"Rust Engineer"})
+                self.assertEqual(len(set(JobApplication.objects.filter(id__in=top).values_list("user", flat=True))), 2)
@@ -0,0 +1,74 @@
+from datetime import date
+from django.test import TestCase
+from django.urls import reverse
+from apis.authentication import authenticated_user_cache
+from apis.models import LearningManagement, LearningManagementStatus, LearningResource
+from apis.tests.helpers import auth_header, create_user
+
+
+def create_board(user, plans_per_column, resources_per_plan):
+    statuses = LearningManagementStatus.objects.bulk_create(
+        LearningManagementStatus(name=category, category=category, color="#000", user=user)
+        for category in ("completed", "start", "in_progress")
+    )
+    plans = LearningManagement.objects.bulk_create(
+        LearningManagement(
+            name=f"{status.category} plan {i}", description="", status=status, user=user,
+            expected_started_date=date(2025, 1, 1), expected_completed_date=date(2025, 2, 1),
+        )
+        for status in statuses
+        for i in range(plans_per_column)
+    )
+    LearningResource.objects.bulk_create(
+        LearningResource(
+            name=f"{plan.name} resource {i}", resource_type="video", resource_url="https://example.com/",
+            learning_management=plan, status=plan.status, description="",
+            expected_started_date=date(2025, 1, 1), expected_completed_date=date(2025, 2, 1),
+        )
+        for plan in plans
+        for i in range(resources_per_plan)
+    )
+    return plans
+
+
+class KanbanBoardQueryCountTests(TestCase):
+    def setUp(self):
+        self.user = create_user("alice")
+        self.client.defaults["HTTP_AUTHORIZATION"] = auth_header(self.user)
+        self.addCleanup(authenticated_user_cache.clear)
+        # Another user's board must not leak into, or cost queries for, this one
+        create_board(create_user("bob"), plans_per_column=3, resources_per_plan=2)
+
+    def get_board(self, name, queries, **params):
+        # A first request caches the token's user, so only the board's own queries are counted
+        self.client.get(reverse(name), params)
+        with self.assertNumQueries(queries):
+            response = self.client.get(reverse(name), params)
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_learning_plan_board_query_count_is_fixed(self):
+        for plans_per_column in (1, 10):
+            with self.subTest(plans_per_column=plans_per_column):
+                LearningManagementStatus.objects.filter(user=self.user).delete()
+                create_board(self.user, plans_per_column, resources_per_plan=3)
+                # Columns, plans, then their resources and skills
+                columns = self.get_board("kanban_board_learning_plans", 4)
+                self.assertEqual([column["category"] for column in columns], ["start", "in_progress", "completed"])
+                for column in columns:
+                    self.assertEqual(len(column["learning_managements"]), plans_per_column)
+                    self.assertTrue(all(len(plan["resources"]) == 3 for plan in column["learning_managements"]))
+
+    def test_learning_resource_board_query_count_is_fixed(self):
+        for resources_per_plan in (1, 10):
+            with self.subTest(resources_per_plan=resources_per_plan):
+                LearningManagementStatus.objects.filter(user=self.user).delete()
+                plans = create_board(self.user, plans_per_column=2, resources_per_plan=resources_per_plan)
+                # Columns, then resources with their status joined
+                columns = self.get_board("kanban_board_learning_resources", 2)
+                self.assertEqual(sum(len(column["learning_resources"]) for column in columns), 6 * resources_per_plan)
+
+                columns = self.get_board("kanban_board_learning_resources", 2, learning_management_id=plans[0].id)
+                resources = [resource for column in columns for resource in column["learning_resources"]]
+                self.assertEqual(len(resources), resources_per_plan)
+                self.assertTrue(all(resource["learning_management"] == plans[0].id for resource in resources))
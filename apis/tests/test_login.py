@@ -0,0 +1,40 @@
+import io
+from django.contrib.auth import authenticate
+from django.core.management import call_command
+from django.test import TestCase
+from apis.backends import EmailPhoneUsernameBackend
+from apis.models import LoginIdentifier
+from apis.tests.helpers import create_user
+
+PASSWORD = "s3cret-Passw0rd"
+
+
+class LoginIdentifierTests(TestCase):
+    def setUp(self):
+        self.user = create_user("jdoe", email="John.Doe@Example.com", phone_number="+1 (555) 123-4567")
+
+    def test_logs_in_with_each_identifier_normalized_for_its_kind(self):
+        for login in ("jdoe", "JDoe", "john.doe@example.com", " JOHN.DOE@EXAMPLE.COM ", "+15551234567", "+1 555.123.4567"):
+            with self.subTest(login=login):
+                self.assertEqual(authenticate(username=login, password=PASSWORD), self.user)
+
+    def test_phone_normalization_does_not_apply_to_usernames_or_emails(self):
+        for login in ("j-d.o(e)", "j d o e", "john.doe@example(.)com"):
+            with self.subTest(login=login):
+                self.assertIsNone(authenticate(username=login, password=PASSWORD))
+
+    def test_username_is_not_compared_with_phone_numbers(self):
+        other = create_user("15551234567", phone_number="+44 20 7946 0000")
+        self.assertEqual(authenticate(username="15551234567", password=PASSWORD), other)
+        self.assertEqual(authenticate(username="+1 555 123 4567", password=PASSWORD), self.user)
+
+    def test_unknown_login_is_a_single_index_probe(self):
+        backend = EmailPhoneUsernameBackend()
+        with self.assertNumQueries(1):
+            self.assertIsNone(backend.get_login_user("nobody@example.com"))
+
+    def test_users_missing_from_the_index_need_a_rebuild(self):
+        LoginIdentifier.objects.filter(user=self.user).delete()
+        self.assertIsNone(authenticate(username="john.doe@example.com", password=PASSWORD))
+        call_command("rebuild_login_identifiers", stdout=io.StringIO())
+        self.assertEqual(authenticate(username="john.doe@example.com", password=PASSWORD), self.user)
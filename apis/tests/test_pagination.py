@@ -0,0 +1,79 @@
+from datetime import timedelta
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from apis.authentication import authenticated_user_cache
+from apis.models import JobApplication, JobApplicationStatus
+from apis.tests.helpers import auth_header, create_user
+from apis.tests.test_job_applications import create_applications
+
+
+class JobApplicationCursorPaginationTests(TestCase):
+    def setUp(self):
+        self.user = create_user("alice")
+        self.status = JobApplicationStatus.objects.create(name="Applied", category="applied", color="#2563eb")
+        self.client.defaults["HTTP_AUTHORIZATION"] = auth_header(self.user)
+        self.addCleanup(authenticated_user_cache.clear)
+        applications = create_applications(self.user, 12, self.status, [])
+        # Runs of equal created_at, which a first-field-only cursor can only page with OFFSET
+        now = timezone.now()
+        for i, application in enumerate(applications):
+            JobApplication.objects.filter(pk=application.pk).update(created_at=now - timedelta(minutes=i // 5))
+
+    def expected_ids(self):
+        return list(JobApplication.objects.filter(user=self.user).order_by("-created_at", "id").values_list("id", flat=True))
+
+    def get(self, url, **params):
+        response = self.client.get(url, params)
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def walk(self, page_size, between_pages=None):
+        page = self.get(reverse("job_application_list_create"), page_size=page_size)
+        ids = [item["id"] for item in page["results"]]
+        while page["next"]:
+            if between_pages:
+                between_pages()
+            page = self.get(page["next"])
+            ids += [item["id"] for item in page["results"]]
+        return ids
+
+    def test_pages_cover_every_row_once_in_order(self):
+        expected = self.expected_ids()
+        for page_size in (1, 3, 5, 7, 12, 50):
+            with self.subTest(page_size=page_size):
+                self.assertEqual(self.walk(page_size), expected)
+
+    def test_cursor_encodes_the_full_sort_key(self):
+        page = self.get(reverse("job_application_list_create"), page_size=2)
+        # The next page is a keyset seek: no OFFSET even inside a run of equal created_at
+        with CaptureQueriesContext(connection) as queries:
+            self.get(page["next"])
+        self.assertFalse(any("OFFSET" in query["sql"] for query in queries.captured_queries))
+
+    def test_inserts_between_pages_cause_no_duplicates_or_gaps(self):
+        expected = self.expected_ids()
+        run_created_at = JobApplication.objects.get(pk=expected[0]).created_at
+
+        def insert():
+            # One row newer than every other, one inside the first created_at run
+            newer, same = create_applications(self.user, 2, self.status, [])
+            JobApplication.objects.filter(pk=newer.pk).update(created_at=run_created_at + timedelta(hours=1))
+            JobApplication.objects.filter(pk=same.pk).update(created_at=run_created_at)
+
+        ids = self.walk(3, between_pages=insert)
+        self.assertEqual(len(ids), len(set(ids)))
+        self.assertEqual([pk for pk in ids if pk in expected], expected)
+
+    def test_previous_link_returns_the_previous_page(self):
+        first = self.get(reverse("job_application_list_create"), page_size=4)
+        second = self.get(first["next"])
+        back = self.get(second["previous"])
+        self.assertEqual([item["id"] for item in back["results"]], [item["id"] for item in first["results"]])
+        self.assertIsNone(back["previous"])
+
+    def test_tampered_cursor_is_rejected(self):
+        response = self.client.get(reverse("job_application_list_create"), {"cursor": "cD1vb3Bz"})  # p=oops
+        self.assertEqual(response.status_code, 404)
@@ -0,0 +1,187 @@
+from django.test import TestCase
+from django.urls import reverse
+from apis.models import (
+    JobApplication,
+    JobApplicationStatus,
+    JobSkillDemand,
+    JobSkills,
+    LearningManagement,
+    LearningManagementSkill,
+    LearningManagementStatus,
+    UserSkills,
+)
+from apis.services.job_bulk import bulk_create, bulk_delete, bulk_update
+from apis.services.skill_gap import skill_gap_report
+from apis.tests.helpers import auth_header, create_user
+
+
+class SkillDemandTestCase(TestCase):
+    def setUp(self):
+        self.user = create_user("alice")
+        self.status = JobApplicationStatus.objects.create(name="Applied", category="applied", color="#2563eb")
+        self.python, self.django, self.rust, self.go = JobSkills.objects.bulk_create(
+            JobSkills(name=name) for name in ("Python", "Django", "Rust", "Go")
+        )
+
+    def application(self, skills=(), preferred_skills=(), user=None):
+        application = JobApplication.objects.create(
+            user=user or self.user, status=self.status, position="Engineer", company_name="Acme", location="Remote"
+        )
+        application.skills.set(skills)
+        application.preferred_skills.set(preferred_skills)
+        return application
+
+    def demand(self, user=None):
+        """The user's non-zero counters as {skill id: (required, preferred)}."""
+        rows = JobSkillDemand.objects.filter(user=user or self.user).values_list(
+            "skill_id", "required_count", "preferred_count"
+        )
+        return {skill_id: (required, preferred) for skill_id, required, preferred in rows if required or preferred}
+
+    def assertDemand(self, expected, user=None):
+        self.assertEqual(self.demand(user), expected)
+        # The incremental counters always agree with a full recount
+        JobSkillDemand.rebuild()
+        self.assertEqual(self.demand(user), expected)
+
+
+class SkillDemandCounterTests(SkillDemandTestCase):
+    def test_create_through_the_api(self):
+        response = self.client.post(
+            reverse("job_application_list_create"),
+            {
+                "position": "Engineer", "company_name": "Acme", "location": "Remote", "status": self.status.id,
+                "application_through": "email", "skills": [self.python.id, self.django.id],
+                "preferred_skills": [self.rust.id],
+            },
+            content_type="application/json",
+            headers={"Authorization": auth_header(self.user)},
+        )
+        self.assertEqual(response.status_code, 201, response.content)
+        self.assertDemand({self.python.id: (1, 0), self.django.id: (1, 0), self.rust.id: (0, 1)})
+
+    def test_update_replaces_the_counted_skills(self):
+        application = self.application([self.python, self.django], [self.rust])
+        self.application([self.python])
+
+        response = self.client.patch(
+            reverse("job_application_detail", args=[application.id]),
+            {"skills": [self.python.id, self.go.id], "preferred_skills": []},
+            content_type="application/json",
+            headers={"Authorization": auth_header(self.user)},
+        )
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertDemand({self.python.id: (2, 0), self.go.id: (1, 0)})
+
+    def test_add_remove_and_clear(self):
+        application = self.application([self.python])
+        application.skills.add(self.python, self.django)
+        self.assertDemand({self.python.id: (1, 0), self.django.id: (1, 0)})
+
+        # Removing a skill the application never listed changes nothing
+        application.skills.remove(self.django, self.rust)
+        self.assertDemand({self.python.id: (1, 0)})
+
+        application.preferred_skills.add(self.go)
+        application.skills.clear()
+        self.assertDemand({self.go.id: (0, 1)})
+
+    def test_changes_from_the_skill_side(self):
+        bob = create_user("bob")
+        mine, theirs = self.application(), self.application(user=bob)
+        self.python.skills.add(mine, theirs)
+        self.assertDemand({self.python.id: (1, 0)})
+        self.assertDemand({self.python.id: (1, 0)}, user=bob)
+
+        self.python.skills.remove(theirs)
+        self.assertDemand({}, user=bob)
+        self.python.skills.clear()
+        self.assertDemand({})
+
+    def test_delete(self):
+        application = self.application([self.python, self.django], [self.rust])
+        self.application([self.python])
+        response = self.client.delete(
+            reverse("job_application_detail", args=[application.id]), headers={"Authorization": auth_header(self.user)}
+        )
+        self.assertEqual(response.status_code, 204)
+        self.assertDemand({self.python.id: (1, 0)})
+
+    def test_deleting_a_skill_or_the_user(self):
+        self.application([self.python, self.django])
+        self.django.delete()
+        self.assertDemand({self.python.id: (1, 0)})
+        self.user.delete()
+        self.assertFalse(JobSkillDemand.objects.exists())
+
+    def test_bulk_paths(self):
+        rows = [
+            {"position": "A", "company_name": "Acme", "location": "Remote", "status": self.status.id,
+             "application_through": "email", "skills": [self.python.id, self.python.id], "preferred_skills": [self.rust.id]},
+            {"position": "B", "company_name": "Acme", "location": "Remote", "status": self.status.id,
+             "application_through": "email", "skills": [self.python.id, self.django.id]},
+        ]
+        first, second = bulk_create(self.user, rows)[0]
+        self.assertDemand({self.python.id: (2, 0), self.django.id: (1, 0), self.rust.id: (0, 1)})
+
+        bulk_update(self.user, [{"id": first.id, "skills": [self.go.id]}, {"id": second.id, "position": "C"}])
+        self.assertDemand({self.python.id: (1, 0), self.django.id: (1, 0), self.go.id: (1, 0), self.rust.id: (0, 1)})
+
+        bulk_delete(self.user, [second.id])
+        self.assertDemand({self.go.id: (1, 0), self.rust.id: (0, 1)})
+
+    def test_reads_do_not_recount(self):
+        self.application([self.python])
+        skill_gap_report(self.user.id)
+        # Written behind the counters' back: the report trusts the counters
+        JobApplication.skills.through.objects.create(
+            jobapplication=JobApplication.objects.get(), jobskills=self.django
+        )
+        self.assertEqual([gap["skill"]["id"] for gap in skill_gap_report(self.user.id)["gaps"]], [self.python.id])
+
+
+class SkillGapReportTests(SkillDemandTestCase):
+    def setUp(self):
+        super().setUp()
+        UserSkills.objects.create(user=self.user, skill=self.python, level="expert", confidence=90)
+        UserSkills.objects.create(user=self.user, skill=self.django, level="beginner", confidence=20)
+        self.application([self.python, self.django, self.rust], [self.go])
+        self.application([self.rust], [self.django])
+        self.application(preferred_skills=[self.go])
+
+    def test_report_lists_missing_and_weak_skills_most_demanded_first(self):
+        status = LearningManagementStatus.objects.create(
+            name="Doing", category="in_progress", color="#000", user=self.user
+        )
+        plan = LearningManagement.objects.create(
+            name="Rust book", description="", expected_started_date="2026-01-01",
+            expected_completed_date="2026-02-01", status=status, user=self.user,
+        )
+        LearningManagementSkill.objects.create(learning_management=plan, skill=self.rust, level="advanced")
+
+        response = self.client.get(
+            reverse("job_application_skill_gaps"), headers={"Authorization": auth_header(self.user)}
+        )
+        self.assertEqual(response.status_code, 200)
+        report = response.json()
+        self.assertEqual(report["applicationCount"], 3)
+        gaps = report["gaps"]
+        # Rust: 2 required (weight 4); Django: 1 required + 1 preferred (3); Go: 2 preferred (2)
+        self.assertEqual([gap["skill"]["name"] for gap in gaps], ["Rust", "Django", "Go"])
+        self.assertEqual((gaps[0]["requiredIn"], gaps[0]["preferredIn"], gaps[0]["gap"]), (2, 0, "missing"))
+        self.assertEqual(
+            gaps[0]["learningPlans"],
+            [{"id": plan.id, "name": "Rust book", "status": "in_progress", "targetLevel": "advanced"}],
+        )
+        self.assertTrue(gaps[0]["coveredByLearningPlan"])
+        self.assertEqual(
+            (gaps[1]["gap"], gaps[1]["userLevel"], gaps[1]["userConfidence"], gaps[1]["learningPlans"]),
+            ("weak", "beginner", 20, []),
+        )
+
+    def test_report_follows_application_and_skill_changes(self):
+        self.assertEqual(len(skill_gap_report(self.user.id, limit=2)["gaps"]), 2)
+        JobApplication.objects.filter(skills=self.rust).delete()
+        UserSkills.objects.filter(skill=self.django).update(level="advanced")
+        # Skills no application lists any more, and strong ones, drop out
+        self.assertEqual([gap["skill"]["name"] for gap in skill_gap_report(self.user.id)["gaps"]], ["Go"])
@@ -0,0 +1,121 @@
+from unittest import mock
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from apis.models import JobApplication, JobApplicationStatus, JobSkills, UserSkills
+from apis.services import skill_match
+from apis.services.skill_match import cached_scores, score_applications
+from apis.tests.helpers import auth_header, create_user
+
+
+class SkillMatchTests(TestCase):
+    def setUp(self):
+        # Rankings are cached by user id, which the rolled-back tests reuse
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.user = create_user("alice")
+        self.status = JobApplicationStatus.objects.create(name="Applied", category="applied", color="#2563eb")
+        self.python, self.django, self.rust = JobSkills.objects.bulk_create(
+            JobSkills(name=name) for name in ("Python", "Django", "Rust")
+        )
+        # Strengths: expert at full confidence 1.0, beginner unrated 0.25 * 0.5
+        UserSkills.objects.create(user=self.user, skill=self.python, level="expert", confidence=100)
+        UserSkills.objects.create(user=self.user, skill=self.django, level="beginner", confidence=0)
+
+    def application(self, position, skills=(), preferred_skills=(), user=None):
+        application = JobApplication.objects.create(
+            user=user or self.user, status=self.status, position=position, company_name="Acme", location="Remote"
+        )
+        application.skills.set(skills)
+        application.preferred_skills.set(preferred_skills)
+        return application
+
+    def test_scores_weigh_strength_and_preferred_skills(self):
+        mixed = self.application("Mixed", [self.python, self.django], [self.rust])
+        perfect = self.application("Perfect", [self.python])
+        unmatched = self.application("Unmatched", [self.rust])
+        preferred = self.application("Preferred only", preferred_skills=[self.django])
+
+        scores = {row["jobApplication"]: row for row in score_applications(self.user.id)}
+        # (1.0 + 0.125) / (1 + 1 + 0.5 required and preferred weights)
+        self.assertEqual(scores[mixed.id]["score"], 45.0)
+        self.assertEqual(
+            [scores[mixed.id][key] for key in ("requiredMatched", "requiredTotal", "preferredMatched", "preferredTotal")],
+            [2, 2, 0, 1],
+        )
+        self.assertEqual(scores[perfect.id]["score"], 100.0)
+        self.assertEqual(scores[unmatched.id]["score"], 0.0)
+        self.assertEqual(scores[preferred.id]["score"], 12.5)
+
+    def test_applications_without_skills_score_null_and_come_last(self):
+        bare = self.application("No skills")
+        weak = self.application("Weak", [self.rust])
+        strong = self.application("Strong", [self.python])
+
+        ranking = score_applications(self.user.id)
+        self.assertEqual([row["jobApplication"] for row in ranking], [strong.id, weak.id, bare.id])
+        self.assertIsNone(ranking[-1]["score"])
+        self.assertEqual((ranking[-1]["requiredTotal"], ranking[-1]["preferredTotal"]), (0, 0))
+
+    def test_user_without_skills_scores_zero(self):
+        UserSkills.objects.filter(user=self.user).delete()
+        application = self.application("Any", [self.python])
+        self.assertEqual(score_applications(self.user.id)[0]["score"], 0.0)
+        self.assertEqual(score_applications(create_user("bob").id), [])
+        self.assertEqual(score_applications(self.user.id)[0]["jobApplication"], application.id)
+
+    def test_application_created_mid_scoring_is_left_out(self):
+        existing = self.application("Existing", [self.python])
+        real_skill_strengths = skill_match.skill_strengths
+
+        def concurrent_insert(user_id):
+            # Lands after the applications were read, before their skill rows are
+            self.application("Concurrent", [self.python, self.django], [self.rust])
+            return real_skill_strengths(user_id)
+
+        with mock.patch.object(skill_match, "skill_strengths", side_effect=concurrent_insert):
+            ranking = score_applications(self.user.id)
+        self.assertEqual([row["jobApplication"] for row in ranking], [existing.id])
+        self.assertEqual(ranking[0]["score"], 100.0)
+
+    def test_cached_ranking_is_recomputed_after_relevant_writes(self):
+        application = self.application("Backend", [self.django])
+        self.assertEqual(cached_scores(self.user.id)[0]["score"], 12.5)
+        with self.assertNumQueries(0):
+            self.assertEqual(cached_scores(self.user.id)[0]["score"], 12.5)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            user_skill = UserSkills.objects.get(user=self.user, skill=self.django)
+            user_skill.level, user_skill.confidence = "expert", 100
+            user_skill.save()
+        self.assertEqual(cached_scores(self.user.id)[0]["score"], 100.0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            application.skills.add(self.rust)
+        self.assertEqual(cached_scores(self.user.id)[0]["score"], 50.0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.application("Newer", [self.python])
+        self.assertEqual(len(cached_scores(self.user.id)), 2)
+
+    def test_other_users_writes_keep_the_cache(self):
+        self.application("Backend", [self.python])
+        cached_scores(self.user.id)
+        bob = create_user("bob")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.application("Bob's", [self.python], user=bob)
+            UserSkills.objects.create(user=bob, skill=self.rust, level="expert", confidence=100)
+        with self.assertNumQueries(0):
+            cached_scores(self.user.id)
+
+    def test_endpoint_pages_the_ranking(self):
+        for position in ("First", "Second", "Third"):
+            self.application(position, [self.python])
+        response = self.client.get(
+            reverse("job_application_skill_match"), {"limit": 2, "offset": 1},
+            headers={"Authorization": auth_header(self.user)},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["count"], 3)
+        # Ties go newest first
+        self.assertEqual([row["position"] for row in response.json()["results"]], ["Second", "First"])
@@ -0,0 +1,164 @@
+from unittest import mock
+from django.core.mail.backends.locmem import EmailBackend
+from django.test import TestCase, override_settings
+from apis.models import EmailLog, EmailProviderSetting
+from apis.services.email_provider_cache import active_email_provider_cache
+from apis.services.email_service import EmailService
+from apis.services.smtp_pool import SMTPConnectionPool, smtp_pool
+
+
+class CountingBackend(EmailBackend):
+    """locmem with an SMTP-like socket whose NOOP answer the test controls."""
+    opened = []
+    closed = []
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.password = kwargs.get("password")
+
+    def open(self):
+        self.connection = mock.Mock(**{"noop.return_value": (250, b"OK")})
+        CountingBackend.opened.append(self)
+        return True
+
+    def close(self):
+        self.connection = None
+        CountingBackend.closed.append(self)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@override_settings(
+    EMAIL_SMTP_BACKEND="apis.tests.test_smtp_pool.CountingBackend",
+    EMAIL_SMTP_POOL_IDLE_TIMEOUT=60,
+    EMAIL_SMTP_POOL_MAX_IDLE=2,
+)
+class SMTPConnectionPoolTests(TestCase):
+    def setUp(self):
+        CountingBackend.opened, CountingBackend.closed = [], []
+        self.pool = SMTPConnectionPool()
+        self.addCleanup(self.pool.close_all)
+        self.clock = Clock()
+        patcher = mock.patch("apis.services.smtp_pool.time.monotonic", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.provider = EmailProviderSetting.objects.create(
+            name="smtp", provider_type="smtp", host="smtp.example.com", port=587,
+            username="mailer", password="old", from_email="noreply@example.com",
+        )
+
+    def use(self, provider=None):
+        with self.pool.connection(provider or self.provider) as backend:
+            return backend
+
+    def test_idle_connection_is_reused(self):
+        first = self.use()
+        self.clock.now += 1
+        self.assertIs(self.use(), first)
+        self.assertEqual(len(CountingBackend.opened), 1)
+        # Used a moment ago, so handed out without a NOOP
+        first.connection.noop.assert_not_called()
+
+    def test_concurrent_users_get_their_own_connections(self):
+        with self.pool.connection(self.provider) as first, self.pool.connection(self.provider) as second:
+            self.assertIsNot(first, second)
+        self.assertEqual(len(CountingBackend.opened), 2)
+
+    def test_idle_connections_past_the_limit_are_closed(self):
+        with self.pool.connection(self.provider), self.pool.connection(self.provider):
+            with self.pool.connection(self.provider):
+                pass
+        # EMAIL_SMTP_POOL_MAX_IDLE=2: the last one checked in is closed
+        self.assertEqual(len(CountingBackend.opened), 3)
+        self.assertEqual(len(CountingBackend.closed), 1)
+
+    def test_connections_idle_past_the_timeout_are_evicted(self):
+        first = self.use()
+        self.clock.now += 61
+        self.assertIsNot(self.use(), first)
+        self.assertIn(first, CountingBackend.closed)
+
+    def test_close_idle_sweeps_expired_connections(self):
+        first = self.use()
+        self.pool.close_idle()
+        self.assertEqual(CountingBackend.closed, [])
+        self.clock.now += 61
+        self.pool.close_idle()
+        self.assertEqual(CountingBackend.closed, [first])
+
+    def test_stale_socket_is_replaced(self):
+        first = self.use()
+        first.connection.noop.return_value = (421, b"Timeout")
+        self.clock.now += SMTPConnectionPool.PING_AFTER_SECONDS + 1
+        self.assertIsNot(self.use(), first)
+        self.assertIn(first, CountingBackend.closed)
+
+    def test_connection_that_raised_is_not_pooled(self):
+        with self.assertRaises(OSError):
+            with self.pool.connection(self.provider) as backend:
+                raise OSError("broken pipe")
+        self.assertIn(backend, CountingBackend.closed)
+        self.assertIsNot(self.use(), backend)
+
+    def test_changed_credentials_never_reuse_the_old_connection(self):
+        first = self.use()
+        self.provider.password = "new"
+        self.assertIsNot(self.use(), first)
+
+    def test_discard_closes_one_providers_idle_connections(self):
+        other = EmailProviderSetting.objects.create(
+            name="other", provider_type="smtp", host="smtp.example.org", port=587,
+            from_email="noreply@example.org", is_active=False,
+        )
+        first, kept = self.use(), self.use(other)
+        self.pool.discard(self.provider.pk)
+        self.assertEqual(CountingBackend.closed, [first])
+        self.assertIs(self.use(other), kept)
+
+
+@override_settings(EMAIL_SMTP_BACKEND="apis.tests.test_smtp_pool.CountingBackend")
+class SMTPPoolInvalidationTests(TestCase):
+    def setUp(self):
+        CountingBackend.opened, CountingBackend.closed = [], []
+        self.addCleanup(smtp_pool.close_all)
+        self.addCleanup(active_email_provider_cache.invalidate)
+        self.provider = EmailProviderSetting.objects.create(
+            name="smtp", provider_type="smtp", host="smtp.example.com", port=587,
+            username="mailer", password="old", from_email="noreply@example.com",
+        )
+
+    def send(self, count):
+        EmailLog.objects.bulk_create(
+            EmailLog(template_name="t", subject="s", body="b", to=f"user{i}@example.com", email_provider=self.provider)
+            for i in range(count)
+        )
+        with self.assertLogs("color_logger", level="INFO"):
+            EmailService.process_queue()
+
+    def test_queued_sends_share_one_connection(self):
+        self.send(5)
+        self.send(5)
+        self.assertEqual(len(CountingBackend.opened), 1)
+
+    def test_editing_the_provider_closes_its_pooled_connection(self):
+        self.send(1)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.provider.password = "new"
+            self.provider.save()
+        self.assertEqual(CountingBackend.closed, CountingBackend.opened)
+
+        self.send(1)
+        self.assertEqual(len(CountingBackend.opened), 2)
+        self.assertEqual(CountingBackend.opened[-1].password, "new")
+
+    def test_deleting_the_provider_closes_its_pooled_connection(self):
+        self.send(1)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.provider.delete()
+        self.assertEqual(CountingBackend.closed, CountingBackend.opened)
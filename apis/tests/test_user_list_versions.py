@@ -0,0 +1,51 @@
+from django.db import DEFAULT_DB_ALIAS
+from django.db.models.deletion import Collector
+from django.test import TestCase
+from apis.models import (
+    ActivityRollup,
+    JobApplication,
+    JobApplicationStatus,
+    JobSkillDemand,
+    JobSkills,
+    PasswordResetToken,
+    UserSkills,
+)
+from apis.services import response_cache
+from apis.tests.helpers import create_user
+
+
+class UserListVersionSignalTests(TestCase):
+    def setUp(self):
+        self.user = create_user("alice")
+
+    def version(self, model):
+        return response_cache.current_versions([(model, response_cache.user_scope(self.user.id))])[0]
+
+    def test_unrelated_tables_keep_fast_deletes(self):
+        # A post_delete receiver without a sender would make every table slow-delete
+        for model in (PasswordResetToken, ActivityRollup, JobSkillDemand):
+            with self.subTest(model=model.__name__):
+                self.assertTrue(Collector(using=DEFAULT_DB_ALIAS).can_fast_delete(model.objects.all()))
+
+    def test_purge_deletes_without_loading_the_rows(self):
+        PasswordResetToken.objects.create(user=self.user, is_used=True)
+        with self.assertNumQueries(1):
+            PasswordResetToken.objects.filter(is_used=True).delete()
+
+    def test_writes_to_versioned_tables_still_bump_the_owner_version(self):
+        status = JobApplicationStatus.objects.create(name="Applied", category="applied", color="#2563eb")
+        for write in (
+            lambda: JobApplication.objects.create(
+                user=self.user, status=status, position="Engineer", company_name="Acme", location="Remote"
+            ),
+            lambda: JobApplication.objects.get(user=self.user).delete(),
+        ):
+            before = self.version(JobApplication)
+            with self.captureOnCommitCallbacks(execute=True):
+                write()
+            self.assertNotEqual(self.version(JobApplication), before)
+
+        before = self.version(UserSkills)
+        with self.captureOnCommitCallbacks(execute=True):
+            UserSkills.objects.create(user=self.user, skill=JobSkills.objects.create(name="Go"))
+        self.assertNotEqual(self.version(UserSkills), before)
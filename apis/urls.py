@@ -27,6 +27,11 @@ from apis.views import (
     JobSkillsRetrieveUpdateDestroyView,
     JobApplicationListCreateView,
     JobApplicationRetrieveUpdateDestroyView,
+    JobApplicationStatsView,
+    JobApplicationSearchView,
+    JobApplicationSkillMatchView,
+    JobApplicationSkillGapView,
+    JobApplicationBulkView,
     # Learning views
     LearningManagementStatusListCreateView,
     LearningManagementStatusRetrieveUpdateDestroyView,
@@ -42,6 +47,8 @@ from apis.views import (
 
     # Admin Views
     AdminStatsView,
+    AdminJobApplicationStatsView,
+    AdminActivityMetricsView,
     ExportAllTablesView,
     ImportJSONView,
 )
@@ -88,6 +95,11 @@ urlpatterns = [
     # Job Application endpoints
     path('job-applications/', JobApplicationListCreateView.as_view(), name='job_application_list_create'),
     path('job-applications/<int:pk>/', JobApplicationRetrieveUpdateDestroyView.as_view(), name='job_application_detail'),
+    path('job-applications/stats/', JobApplicationStatsView.as_view(), name='job_application_stats'),
+    path('job-applications/search/', JobApplicationSearchView.as_view(), name='job_application_search'),
+    path('job-applications/skill-match/', JobApplicationSkillMatchView.as_view(), name='job_application_skill_match'),
+    path('job-applications/skill-gaps/', JobApplicationSkillGapView.as_view(), name='job_application_skill_gaps'),
+    path('job-applications/bulk/', JobApplicationBulkView.as_view(), name='job_application_bulk'),
     
     # Learning Management Status endpoints
     path('learning-statuses/', LearningManagementStatusListCreateView.as_view(), name='learning_status_list_create'),
@@ -106,6 +118,8 @@ urlpatterns = [
     path('kanban-board-learning-resources/', KanbanBoardLearningResourceView.as_view(), name='kanban_board_learning_resources'),
 
     path('admin/stats', AdminStatsView.as_view(), name='admin_stats'),
+    path('admin/job-application-stats/', AdminJobApplicationStatsView.as_view(), name='admin_job_application_stats'),
+    path('admin/activity-metrics/', AdminActivityMetricsView.as_view(), name='admin_activity_metrics'),
     path('admin/export-all-tables/', ExportAllTablesView.as_view(), name='export_all_tables'),
     path('admin/import-json/', ImportJSONView.as_view(), name='import_json'),
     
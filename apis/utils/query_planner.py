@@ -0,0 +1,99 @@
+from functools import lru_cache
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Prefetch
+from rest_framework import serializers
+from rest_framework.relations import ManyRelatedField
+
+
+def _related_field(model, attr):
+    try:
+        return model._meta.get_field(attr)
+    except FieldDoesNotExist:
+        # Reverse relations without a related_name are read as `<model>_set`
+        for relation in model._meta.related_objects:
+            if relation.get_accessor_name() == attr:
+                return relation
+        return None
+
+
+def _plan(serializer, model, prefix=''):
+    """
+    Walk `serializer` and return (select_related, prefetch_related) where
+    prefetch entries are (lookup, related_model, nested_plan) triples.
+    """
+    select_related, prefetch_related = {}, {}
+
+    for field in serializer.fields.values():
+        if field.write_only or field.source == '*':
+            continue
+
+        # Only direct relations are planned; dotted sources are left as they are
+        attrs = field.source_attrs
+        if len(attrs) != 1:
+            continue
+        model_field = _related_field(model, attrs[0])
+        if model_field is None or not model_field.is_relation or model_field.related_model is None:
+            continue
+
+        path = f"{prefix}{attrs[0]}"
+        to_many = model_field.many_to_many or model_field.one_to_many
+
+        if isinstance(field, serializers.ListSerializer):
+            nested = field.child
+        elif isinstance(field, ManyRelatedField):
+            nested = None
+        elif isinstance(field, serializers.BaseSerializer):
+            nested = field
+        elif to_many:
+            nested = None
+        else:
+            # A plain PrimaryKeyRelatedField on a FK only reads `<name>_id`
+            continue
+
+        if to_many:
+            # Relations below a prefetch are planned against its own queryset
+            nested_plan = _plan(nested, model_field.related_model) if nested is not None else ((), ())
+            if path not in prefetch_related or nested is not None:
+                prefetch_related[path] = (path, model_field.related_model, nested_plan)
+        else:
+            select_related[path] = None
+            if nested is not None:
+                nested_select, nested_prefetch = _plan(nested, model_field.related_model, f"{path}__")
+                select_related.update(dict.fromkeys(nested_select))
+                prefetch_related.update({lookup[0]: lookup for lookup in nested_prefetch})
+
+    return tuple(select_related), tuple(prefetch_related.values())
+
+
+@lru_cache(maxsize=None)
+def plan_for_serializer(serializer_class):
+    """
+    Return the lookups needed to render `serializer_class` without per-row
+    queries.
+
+    Nested single-object serializers on FK/one-to-one fields are joined with
+    select_related; many-valued fields (nested serializers with many=True and
+    many PrimaryKeyRelatedFields) are prefetched, and each prefetch joins the
+    relations its own nested serializer reads.
+    """
+    serializer = serializer_class()
+    return _plan(serializer, serializer.Meta.model)
+
+
+def _apply(queryset, plan):
+    select_related, prefetch_related = plan
+    if select_related:
+        queryset = queryset.select_related(*select_related)
+    for lookup, related_model, nested_plan in prefetch_related:
+        if nested_plan == ((), ()):
+            queryset = queryset.prefetch_related(lookup)
+        else:
+            queryset = queryset.prefetch_related(
+                Prefetch(lookup, queryset=_apply(related_model._default_manager.all(), nested_plan))
+            )
+    return queryset
+
+
+def optimize_queryset(queryset, serializer_class):
+    """Apply the lookups planned for `serializer_class` to `queryset`."""
+    return _apply(queryset, plan_for_serializer(serializer_class))
@@ -28,6 +28,11 @@ from .job_views import (
     JobSkillsRetrieveUpdateDestroyView,
     JobApplicationListCreateView,
     JobApplicationRetrieveUpdateDestroyView,
+    JobApplicationStatsView,
+    JobApplicationSearchView,
+    JobApplicationSkillMatchView,
+    JobApplicationSkillGapView,
+    JobApplicationBulkView,
 )
 from .learning_views import (
     LearningManagementStatusListCreateView,
@@ -43,6 +48,8 @@ from .kanban_board_views import (
 )
 from .admin_views import (
     AdminStatsView,
+    AdminJobApplicationStatsView,
+    AdminActivityMetricsView,
     ExportAllTablesView,
     ImportJSONView,
 )
@@ -76,6 +83,11 @@ __all__ = [
     'JobSkillsRetrieveUpdateDestroyView',
     'JobApplicationListCreateView',
     'JobApplicationRetrieveUpdateDestroyView',
+    'JobApplicationStatsView',
+    'JobApplicationSearchView',
+    'JobApplicationSkillMatchView',
+    'JobApplicationSkillGapView',
+    'JobApplicationBulkView',
     # Learning views
     'LearningManagementStatusListCreateView',
     'LearningManagementStatusRetrieveUpdateDestroyView',
@@ -88,6 +100,8 @@ __all__ = [
     'KanbanBoardLearningResourceView',
     # Admin views
     'AdminStatsView',
+    'AdminJobApplicationStatsView',
+    'AdminActivityMetricsView',
     'ExportAllTablesView',
     'ImportJSONView',    
 ]
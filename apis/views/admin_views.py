@@ -1,41 +1,144 @@
 from rest_framework import generics
 from rest_framework.response import Response
-from rest_framework_simplejwt.authentication import JWTAuthentication
-from apis.models import CustomUser, JobSkills
+from apis.authentication import CachedJWTAuthentication
+from apis.models import CustomUser, JobSkills, JobApplicationStat
 from rest_framework import status
-from django.apps import apps
-from django.http import HttpResponse
+from django.http import StreamingHttpResponse
 from rest_framework.parsers import MultiPartParser, FormParser
-from django.db import transaction
+from django.db import IntegrityError
 from rest_framework.permissions import AllowAny, IsAdminUser
-from django.core import serializers
-import json
+from django.core.serializers.base import DeserializationError
 from apis.serializers import FileSerializer
+from apis.services.data_transfer import aiter_export_json, iter_export_json, import_json_stream
+from apis.services.password_hashing import password_hashing_pool
 from django.conf import settings
+from drf_spectacular.utils import extend_schema
+from apis.views.job_views import stats_weeks
+from apis.models import ActivityRollup
+from apis.services.activity_rollups import activity_series
+from datetime import datetime, time, timedelta
+from django.utils import timezone
+from django.utils.dateparse import parse_date
 
 class AdminStatsView(generics.RetrieveAPIView):
+    permission_classes = [IsAdminUser]
+
     def retrieve(self, request, *args, **kwargs):
         stats = {
             "totalUsers": CustomUser.objects.filter(role="user").count(),
             "totalSkills": JobSkills.objects.count(),
-            "recentActivity": 0,
+            # Applications dated this week, across all users
+            "recentActivity": JobApplicationStat.summary(weeks=1)["weeklyApplications"][0]["count"],
+            # Per server process: queue depth and rejections of the hashing pool
+            "passwordHashing": password_hashing_pool.stats(),
         }
         return Response(stats, status=status.HTTP_200_OK)
 
 
-class ExportAllTablesView(generics.GenericAPIView):
+@extend_schema(
+    summary="Job search statistics for all users",
+    description=(
+        "Application counts across every user by status category and application "
+        "channel, plus applications per week for the last `weeks` weeks (default 12)"
+    ),
+    tags=["Admin"]
+)
+class AdminJobApplicationStatsView(generics.GenericAPIView):
     permission_classes = [IsAdminUser]
 
     def get(self, request, *args, **kwargs):
-        all_data = {}
+        stats = JobApplicationStat.summary(weeks=stats_weeks(request))
+        return Response(stats, status=status.HTTP_200_OK)
 
-        for model in apps.get_models():
-            queryset = model.objects.all()
-            json_data = serializers.serialize('json', queryset)
-            all_data[model._meta.label] = json.loads(json_data)
 
-        response = HttpResponse(
-            json.dumps(all_data, indent=4),
+def _date_param(params, name, default):
+    if not params.get(name):
+        return default
+    # parse_date() raises for invalid dates but returns None for text that isn't date-shaped
+    value = parse_date(params[name])
+    if value is None:
+        raise ValueError(f"{name} is not a date")
+    return value
+
+
+@extend_schema(
+    summary="Activity metrics over time",
+    description=(
+        "Registrations, logins, job applications created, learning plans completed and "
+        "emails sent/failed per `day` or `hour` bucket between the `start` and `end` dates "
+        "(YYYY-MM-DD, inclusive; default the last 30 days). Optional `metric` limits the "
+        "response to one metric. Read from the rollup tables refreshed by "
+        "`manage.py refresh_activity_rollups`, so recent buckets lag until the next refresh; "
+        "logins are counted as they happen."
+    ),
+    tags=["Admin"]
+)
+class AdminActivityMetricsView(generics.GenericAPIView):
+    permission_classes = [IsAdminUser]
+
+    def get(self, request, *args, **kwargs):
+        params = request.query_params
+        today = timezone.localdate()
+        try:
+            end = _date_param(params, 'end', today)
+            start = _date_param(params, 'start', end - timedelta(days=29))
+        except ValueError:
+            start = end = None
+        if start is None or start > end:
+            return Response(
+                {"error": "start and end must be dates (YYYY-MM-DD) with start on or before end."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        granularity = params.get('granularity', 'day')
+        if granularity not in ('day', 'hour'):
+            return Response({"error": "granularity must be day or hour."}, status=status.HTTP_400_BAD_REQUEST)
+        if granularity == 'hour' and (end - start).days >= settings.ACTIVITY_ROLLUP_MAX_HOURLY_DAYS:
+            return Response(
+                {"error": f"Hourly metrics cover at most {settings.ACTIVITY_ROLLUP_MAX_HOURLY_DAYS} days."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        metrics = None
+        if params.get('metric'):
+            if params['metric'] not in dict(ActivityRollup.METRIC_CHOICES):
+                return Response({"error": "Unknown metric."}, status=status.HTTP_400_BAD_REQUEST)
+            if granularity == 'hour' and params['metric'] == 'learning_plans_completed':
+                return Response(
+                    {"error": "learning_plans_completed is only recorded per day."},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            metrics = [params['metric']]
+
+        tz = timezone.get_current_timezone()
+        series, totals = activity_series(
+            timezone.make_aware(datetime.combine(start, time.min), tz),
+            timezone.make_aware(datetime.combine(end + timedelta(days=1), time.min), tz),
+            granularity,
+            metrics,
+        )
+        return Response({
+            "start": start.isoformat(),
+            "end": end.isoformat(),
+            "granularity": granularity,
+            "series": series,
+            "totals": totals,
+        }, status=status.HTTP_200_OK)
+
+
+class ExportAllTablesView(generics.GenericAPIView):
+    permission_classes = [IsAdminUser]
+
+    def get(self, request, *args, **kwargs):
+        # Streamed model by model so the export never sits in memory whole.
+        # Under ASGI (daphne) only an async iterator is sent as it is produced;
+        # WSGI servers, unlike ASGI ones, pass their environ in META.
+        if "wsgi.input" in request.META:
+            chunks = iter_export_json()
+        else:
+            chunks = aiter_export_json()
+        response = StreamingHttpResponse(
+            chunks,
             content_type='application/json'
         )
         response['Content-Disposition'] = 'attachment; filename="database_export.json"'
@@ -44,12 +147,11 @@ class ExportAllTablesView(generics.GenericAPIView):
 
 
 class ImportJSONView(generics.GenericAPIView):
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [CachedJWTAuthentication]
     permission_classes = [AllowAny]
     parser_classes = [MultiPartParser, FormParser]
     serializer_class = FileSerializer
 
-    @transaction.atomic
     def post(self, request, *args, **kwargs):
         json_file = request.FILES.get("file")
         secret_token = request.data.get('secret_token')
@@ -61,21 +163,13 @@ class ImportJSONView(generics.GenericAPIView):
         if not json_file:
             return Response({"error": "No file provided."}, status=status.HTTP_400_BAD_REQUEST)
 
+        # Parsed incrementally and upserted in committed batches; see
+        # apis.services.data_transfer.import_json_stream
         try:
-            all_data = json.load(json_file)
-        except json.JSONDecodeError:
+            counts = import_json_stream(json_file)
+        except (ValueError, DeserializationError):
             return Response({"error": "Invalid JSON file."}, status=status.HTTP_400_BAD_REQUEST)
+        except IntegrityError as e:
+            return Response({"error": f"Import failed: {e}"}, status=status.HTTP_400_BAD_REQUEST)
 
-        for model_label, data_json in all_data.items():
-            app_label, model_name = model_label.split('.')
-            try:
-                model = apps.get_model(app_label=app_label, model_name=model_name)
-            except LookupError:
-                continue  # skip unknown models
-
-            # Serialize each object in the list
-            json_data_str = json.dumps(data_json)
-            for obj in serializers.deserialize('json', json_data_str):
-                obj.save()  # save to DB
-
-        return Response({"message": "Data imported successfully!"}, status=status.HTTP_201_CREATED)
\ No newline at end of file
+        return Response({"message": "Data imported successfully!", "imported": counts}, status=status.HTTP_201_CREATED)
@@ -1,3 +1,4 @@
+from asgiref.sync import sync_to_async
 from rest_framework import generics, permissions, status
 from rest_framework.response import Response
 from rest_framework.views import APIView
@@ -8,6 +9,7 @@ from apis.models import CustomUser, PasswordResetToken
 from apis.serializers import (
     RegisterSerializer,
     CustomTokenObtainPairSerializer,
+    CustomTokenRefreshSerializer,
     ChangePasswordSerializer,
     ForgotPasswordSerializer,
     ResetPasswordSerializer,
@@ -16,6 +18,10 @@ from apis.serializers import (
     LogoutSerializer,
 )
 from apis.services.email_service import EmailService
+from apis.services.password_hashing import amake_password, acheck_password
+from apis.backends import EmailPhoneUsernameBackend
+from apis.views.async_views import AsyncAPIView
+from apis.authentication import BlacklistFilteredRefreshToken
 
 
 @extend_schema(
@@ -25,21 +31,26 @@ from apis.services.email_service import EmailService
     request=RegisterSerializer,
     responses={201: UserSerializer}
 )
-class RegisterView(generics.CreateAPIView):
+class RegisterView(AsyncAPIView, generics.CreateAPIView):
     queryset = CustomUser.objects.all()
     serializer_class = RegisterSerializer
     permission_classes = [permissions.AllowAny]
     
-    def create(self, request, *args, **kwargs):
+    async def post(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
-        serializer.is_valid(raise_exception=True)
-        user = serializer.save()
-        
+        await sync_to_async(serializer.is_valid)(raise_exception=True)
+        password_hash = await amake_password(serializer.validated_data['password'])
+        user = await sync_to_async(serializer.save)(password_hash=password_hash)
+        return await sync_to_async(self.registered_response)(user)
+
+    def registered_response(self, user):
         # Generate JWT tokens
         refresh = RefreshToken.for_user(user)
         refresh['role'] = user.role
         refresh['email'] = user.email
         refresh['username'] = user.username
+        refresh['is_staff'] = user.is_staff
+        refresh['is_superuser'] = user.is_superuser
         
         return Response({
             'user': UserSerializer(user).data,
@@ -57,9 +68,24 @@ class RegisterView(generics.CreateAPIView):
     request=CustomTokenObtainPairSerializer,
     responses={200: CustomTokenObtainPairSerializer}
 )
-class CustomTokenObtainPairView(TokenObtainPairView):
+class CustomTokenObtainPairView(AsyncAPIView, TokenObtainPairView):
     serializer_class = CustomTokenObtainPairSerializer
 
+    async def post(self, request, *args, **kwargs):
+        # Checked through the identifier backend directly so ModelBackend
+        # doesn't hash a second time on the request thread after a miss
+        user = await EmailPhoneUsernameBackend().aauthenticate(
+            request,
+            username=request.data.get('username'),
+            password=request.data.get('password'),
+        )
+        serializer = self.get_serializer(
+            data=request.data,
+            context={**self.get_serializer_context(), 'authenticated_user': user},
+        )
+        await sync_to_async(serializer.is_valid)(raise_exception=True)
+        return Response(serializer.validated_data, status=status.HTTP_200_OK)
+
 
 @extend_schema(
     summary="Refresh token",
@@ -70,7 +96,7 @@ class CustomTokenRefreshView(TokenRefreshView):
     """
     Custom refresh view that ensures role is included in the refreshed access token
     """
-    pass
+    serializer_class = CustomTokenRefreshSerializer
 
 
 @extend_schema(
@@ -92,7 +118,7 @@ class LogoutView(APIView):
                     status=status.HTTP_400_BAD_REQUEST
                 )
             
-            token = RefreshToken(refresh_token)
+            token = BlacklistFilteredRefreshToken(refresh_token)
             token.blacklist()
             
             return Response(
@@ -113,16 +139,24 @@ class LogoutView(APIView):
     request=ChangePasswordSerializer,
     responses={200: MessageSerializer}
 )
-class ChangePasswordView(APIView):
+class ChangePasswordView(AsyncAPIView):
     permission_classes = [permissions.IsAuthenticated]
     
-    def post(self, request):
-        serializer = ChangePasswordSerializer(data=request.data, context={'request': request})
+    async def post(self, request):
+        serializer = ChangePasswordSerializer(
+            data=request.data,
+            context={'request': request, 'verify_old_password': False}
+        )
         
         if serializer.is_valid():
             user = request.user
-            user.set_password(serializer.validated_data['new_password'])
-            user.save()
+            if not await acheck_password(user, serializer.validated_data['old_password']):
+                return Response(
+                    {"old_password": ["Old password is incorrect"]},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            user.password = await amake_password(serializer.validated_data['new_password'])
+            await user.asave()
             
             return Response(
                 {"message": "Password changed successfully"},
@@ -152,12 +186,12 @@ class ForgotPasswordView(APIView):
             try:
                 user = CustomUser.objects.get(email=email)
                 
-                # Create password reset token
-                reset_token = PasswordResetToken.objects.create(user=user)
+                # Create password reset token, retiring the oldest outstanding ones
+                reset_token = PasswordResetToken.issue_for(user)
                 
-                # Send email with reset token
+                # Queue the email; the send_queued_emails worker delivers it
                 try:
-                    EmailService.send_email_with_template(
+                    EmailService.queue_email_with_template(
                         template_name='password_reset.html',
                         context={
                             'user': user,
@@ -191,10 +225,10 @@ class ForgotPasswordView(APIView):
     request=ResetPasswordSerializer,
     responses={200: MessageSerializer}
 )
-class ResetPasswordView(APIView):
+class ResetPasswordView(AsyncAPIView):
     permission_classes = [permissions.AllowAny]
     
-    def post(self, request):
+    async def post(self, request):
         serializer = ResetPasswordSerializer(data=request.data)
         
         if serializer.is_valid():
@@ -202,7 +236,7 @@ class ResetPasswordView(APIView):
             new_password = serializer.validated_data['new_password']
             
             try:
-                reset_token = PasswordResetToken.objects.get(token=token_string)
+                reset_token = await PasswordResetToken.objects.select_related('user').aget(token=token_string)
                 
                 if not reset_token.is_valid():
                     return Response(
@@ -212,12 +246,12 @@ class ResetPasswordView(APIView):
                 
                 # Reset password
                 user = reset_token.user
-                user.set_password(new_password)
-                user.save()
+                user.password = await amake_password(new_password)
+                await user.asave()
                 
                 # Mark token as used
                 reset_token.is_used = True
-                reset_token.save()
+                await reset_token.asave()
                 
                 return Response(
                     {"message": "Password has been reset successfully"},
@@ -1,6 +1,9 @@
-from rest_framework import generics, permissions
+from rest_framework import generics, permissions, status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from rest_framework.parsers import JSONParser, MultiPartParser, FormParser
 from drf_spectacular.utils import extend_schema, extend_schema_view
-from apis.models import JobApplicationStatus, JobSkills, JobApplication
+from apis.models import JobApplicationStatus, JobSkills, JobApplication, JobApplicationStat
 from apis.serializers import (
     JobApplicationStatusSerializer,
     JobSkillsSerializer,
@@ -8,6 +11,14 @@ from apis.serializers import (
     JobApplicationCreateSerializer,
 )
 from apis.permissions import IsAdminUserOrAuthenticatedReadOnly
+from apis.pagination import JobApplicationCursorPagination
+from apis.filters import JobApplicationFilterBackend
+from apis.utils.query_planner import optimize_queryset
+from apis.services.job_search import get_search_backend
+from apis.services.skill_match import cached_scores
+from apis.services.skill_gap import skill_gap_report
+from apis.services import job_bulk
+from apis.views.mixins import CachedListResponseMixin, ConditionalListMixin
 
 
 @extend_schema_view(
@@ -22,10 +33,11 @@ from apis.permissions import IsAdminUserOrAuthenticatedReadOnly
         tags=["Job Management"]
     )
 )
-class JobApplicationStatusListCreateView(generics.ListCreateAPIView):
+class JobApplicationStatusListCreateView(CachedListResponseMixin, generics.ListCreateAPIView):
     queryset = JobApplicationStatus.objects.all()
     serializer_class = JobApplicationStatusSerializer
     permission_classes = [permissions.IsAuthenticated]
+    version_models = [JobApplicationStatus]
 
 
 @extend_schema_view(
@@ -68,10 +80,11 @@ class JobApplicationStatusRetrieveUpdateDestroyView(generics.RetrieveUpdateDestr
         tags=["Job Management"]
     )
 )
-class JobSkillsListCreateView(generics.ListCreateAPIView):
+class JobSkillsListCreateView(CachedListResponseMixin, generics.ListCreateAPIView):
     queryset = JobSkills.objects.all()
     serializer_class = JobSkillsSerializer
     permission_classes = [IsAdminUserOrAuthenticatedReadOnly]
+    version_models = [JobSkills]
 
 
 @extend_schema_view(
@@ -105,7 +118,12 @@ class JobSkillsRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
 @extend_schema_view(
     get=extend_schema(
         summary="List job applications",
-        description="Retrieve a list of job applications for the authenticated user",
+        description=(
+            "Retrieve a list of job applications for the authenticated user, "
+            "optionally filtered and ordered by the query parameters below. "
+            "Pass `page_size` (and then the returned `next`/`previous` cursor links) "
+            "to page through the list in that order."
+        ),
         tags=["Job Applications"]
     ),
     post=extend_schema(
@@ -114,8 +132,13 @@ class JobSkillsRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
         tags=["Job Applications"]
     )
 )
-class JobApplicationListCreateView(generics.ListCreateAPIView):
+class JobApplicationListCreateView(ConditionalListMixin, generics.ListCreateAPIView):
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = JobApplicationCursorPagination
+    filter_backends = [JobApplicationFilterBackend]
+    # Statuses and skills are rendered inline
+    version_models = [JobApplicationStatus, JobSkills]
+    user_version_models = [JobApplication]
     
     def get_serializer_class(self):
         if self.request.method == 'POST':
@@ -125,8 +148,10 @@ class JobApplicationListCreateView(generics.ListCreateAPIView):
     def get_queryset(self):
         # Users can only see their own applications unless they're admin
         if self.request.user.is_staff:
-            return JobApplication.objects.all()
-        return JobApplication.objects.filter(user=self.request.user)
+            queryset = JobApplication.objects.all()
+        else:
+            queryset = JobApplication.objects.filter(user=self.request.user)
+        return optimize_queryset(queryset, self.get_serializer_class())
     
     def perform_create(self, serializer):
         # Automatically set the user to the current user
@@ -161,6 +186,164 @@ class JobApplicationRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIV
     
     def get_queryset(self):
         if self.request.user.is_staff:
-            return JobApplication.objects.all()
-        return JobApplication.objects.filter(user=self.request.user)
+            queryset = JobApplication.objects.all()
+        else:
+            queryset = JobApplication.objects.filter(user=self.request.user)
+        return optimize_queryset(queryset, self.get_serializer_class())
 
+
+def stats_weeks(request, default=12):
+    weeks = request.query_params.get('weeks', '')
+    return min(int(weeks), 104) if weeks.isdigit() and int(weeks) > 0 else default
+
+
+def limit_offset(request, default=20, maximum=50):
+    limit = request.query_params.get('limit', '')
+    limit = min(int(limit), maximum) if limit.isdigit() and int(limit) > 0 else default
+    offset = request.query_params.get('offset', '')
+    return limit, int(offset) if offset.isdigit() else 0
+
+
+@extend_schema(
+    summary="Job search statistics",
+    description=(
+        "Counts of the authenticated user's applications by status category and "
+        "application channel, plus applications per week for the last `weeks` weeks (default 12)"
+    ),
+    tags=["Job Applications"]
+)
+class JobApplicationStatsView(APIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        stats = JobApplicationStat.summary(user_id=request.user.id, weeks=stats_weeks(request))
+        return Response(stats, status=status.HTTP_200_OK)
+
+
+@extend_schema(
+    summary="Search job applications",
+    description=(
+        "Full-text search of the authenticated user's applications by position, company name, "
+        "location and description. Every term in `q` must match; the last one also matches as a "
+        "prefix while it is being typed, for type-ahead. Results are ranked by which fields matched "
+        "(position first), then newest first. `limit` (default 20, at most 50) and `offset` page "
+        "through the ranked results."
+    ),
+    tags=["Job Applications"]
+)
+class JobApplicationSearchView(APIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        limit, offset = limit_offset(request)
+        # Staff search everyone's applications, as in the list view
+        user_id = None if request.user.is_staff else request.user.id
+        ids = get_search_backend().search(request.query_params.get('q', ''), user_id, limit, offset)
+        found = optimize_queryset(JobApplication.objects.all(), JobApplicationSerializer).in_bulk(ids)
+        serializer = JobApplicationSerializer([found[pk] for pk in ids if pk in found], many=True)
+        return Response({"results": serializer.data}, status=status.HTTP_200_OK)
+
+
+@extend_schema(
+    summary="Rank job applications by skill match",
+    description=(
+        "Scores each of the authenticated user's applications from 0 to 100 by how well the user's "
+        "skills (weighted by level and confidence) cover its required skills, with preferred skills "
+        "counting half. Applications that list no skills have a null score and come last. "
+        "`limit` (default 50, at most 500) and `offset` page through the ranking."
+    ),
+    tags=["Job Applications"]
+)
+class JobApplicationSkillMatchView(APIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        limit, offset = limit_offset(request, default=50, maximum=500)
+        scores = cached_scores(request.user.id)
+        return Response(
+            {"count": len(scores), "results": scores[offset:offset + limit]},
+            status=status.HTTP_200_OK
+        )
+
+
+@extend_schema(
+    summary="Skill gaps across job applications",
+    description=(
+        "The skills the authenticated user's applications require or prefer most often that the user "
+        "doesn't have, or has only at beginner or intermediate level, most demanded first (required "
+        "counts double). Each gap lists the user's current level and the learning plans that already "
+        "cover the skill. `limit` caps the number of skills (default 20, at most 100)."
+    ),
+    tags=["Job Applications"]
+)
+class JobApplicationSkillGapView(APIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        limit, _ = limit_offset(request, default=20, maximum=100)
+        return Response(skill_gap_report(request.user.id, limit), status=status.HTTP_200_OK)
+
+
+@extend_schema_view(
+    post=extend_schema(
+        summary="Bulk create job applications",
+        description=(
+            "Create many applications at once from a JSON array of objects shaped like the single "
+            "create body, or from an uploaded `file` (.csv with a header row, or .ndjson/.jsonl). "
+            "All rows are validated first; if any fails, nothing is written and `errors` lists each "
+            "failing row by `index`, unless `skip_invalid=true`, which writes the valid rows."
+        ),
+        tags=["Job Applications"]
+    ),
+    patch=extend_schema(
+        summary="Bulk update job applications",
+        description=(
+            "Partially update many of your applications: a JSON array (or uploaded file) of objects, "
+            "each with the `id` to update and the fields to change. `skills` and `preferred_skills` "
+            "replace the current ones when given. Errors work as for bulk create."
+        ),
+        tags=["Job Applications"]
+    ),
+    delete=extend_schema(
+        summary="Bulk delete job applications",
+        description="Delete your applications listed in `ids`. Ids that aren't yours or don't exist are returned in `missing`.",
+        tags=["Job Applications"]
+    ),
+)
+class JobApplicationBulkView(APIView):
+    permission_classes = [permissions.IsAuthenticated]
+    parser_classes = [JSONParser, MultiPartParser, FormParser]
+
+    def _rows(self, request):
+        if 'file' in request.FILES:
+            return job_bulk.read_upload(request.FILES['file'])
+        if isinstance(request.data, list):
+            return request.data
+        return None
+
+    def _write(self, request, write, success_status):
+        rows = self._rows(request)
+        if rows is None:
+            return Response(
+                {"error": "Send a JSON array of applications or upload a file."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        skip_invalid = request.query_params.get('skip_invalid') == 'true'
+        applications, errors = write(request.user, rows, skip_invalid)
+        return Response(
+            {"count": len(applications), "ids": [application.id for application in applications], "errors": errors},
+            status=status.HTTP_400_BAD_REQUEST if errors and not applications else success_status
+        )
+
+    def post(self, request):
+        return self._write(request, job_bulk.bulk_create, status.HTTP_201_CREATED)
+
+    def patch(self, request):
+        return self._write(request, job_bulk.bulk_update, status.HTTP_200_OK)
+
+    def delete(self, request):
+        ids = request.data.get('ids') if isinstance(request.data, dict) else None
+        if not isinstance(ids, list):
+            return Response({"error": "Send the ids to delete as `ids`."}, status=status.HTTP_400_BAD_REQUEST)
+        deleted, missing = job_bulk.bulk_delete(request.user, ids)
+        return Response({"count": len(deleted), "ids": deleted, "missing": missing}, status=status.HTTP_200_OK)
@@ -1,9 +1,30 @@
+from django.db.models import Prefetch
 from django.db.models.aggregates import Case, When, Value, IntegerField
+from rest_framework import permissions
 from rest_framework.generics import ListAPIView
-from apis.serializers import KanbanBoardLearningPlanSerializer, KanbanBoardLearningResourceSerializer
-from apis.models import LearningManagementStatus
+from apis.serializers import (
+    KanbanBoardLearningPlanSerializer,
+    KanbanBoardLearningResourceSerializer,
+    LearningManagementSerializer,
+    LearningResourceSerializer,
+)
+from apis.models import LearningManagementStatus, LearningManagement, LearningResource
+from apis.utils.query_planner import optimize_queryset
+from apis.authentication import StatelessJWTAuthentication
 from drf_spectacular.utils import OpenApiParameter, extend_schema_view, extend_schema
-from rest_framework.response import Response
+
+
+def _board_columns(user_id):
+    # Columns are the user's statuses in workflow order
+    return LearningManagementStatus.objects.filter(user_id=user_id).annotate(
+        order=Case(
+            When(category='start', then=Value(1)),
+            When(category='in_progress', then=Value(2)),
+            When(category='completed', then=Value(3)),
+            output_field=IntegerField(),
+        )
+    ).order_by('order')
+
 
 @extend_schema_view(
     get=extend_schema(
@@ -14,17 +35,17 @@ from rest_framework.response import Response
 )
 class KanbanBoardLearningPlanView(ListAPIView):
     serializer_class = KanbanBoardLearningPlanSerializer
-    
+    authentication_classes = [StatelessJWTAuthentication]
+    permission_classes = [permissions.IsAuthenticated]
+
     def get_queryset(self):
-        return LearningManagementStatus.objects.annotate(
-            order=Case(
-                When(category='start', then=Value(1)),
-                When(category='in_progress', then=Value(2)),
-                When(category='completed', then=Value(3)),
-                output_field=IntegerField(),
-            )
-        ).prefetch_related('learning_managements').order_by('order')
-    
+        learning_managements = optimize_queryset(
+            LearningManagement.objects.filter(user_id=self.request.user.id).order_by('-created_at'),
+            LearningManagementSerializer,
+        )
+        return _board_columns(self.request.user.id).prefetch_related(
+            Prefetch('learning_managements', queryset=learning_managements)
+        )
 
 
 @extend_schema_view(
@@ -45,19 +66,20 @@ class KanbanBoardLearningPlanView(ListAPIView):
 )
 class KanbanBoardLearningResourceView(ListAPIView):
     serializer_class = KanbanBoardLearningResourceSerializer
-    
+    authentication_classes = [StatelessJWTAuthentication]
+    permission_classes = [permissions.IsAuthenticated]
+
     def get_queryset(self):
-        return LearningManagementStatus.objects.prefetch_related('learning_resources').annotate(
-            order=Case(
-                When(category='start', then=Value(1)),
-                When(category='in_progress', then=Value(2)),
-                When(category='completed', then=Value(3)),
-                output_field=IntegerField(),
-            )
-        ).order_by('order')
+        learning_resources = LearningResource.objects.filter(
+            learning_management__user_id=self.request.user.id
+        ).order_by('-created_at')
+        learning_management_id = self.request.query_params.get('learning_management_id')
+        if learning_management_id and learning_management_id.isdigit():
+            learning_resources = learning_resources.filter(learning_management_id=learning_management_id)
 
-    def list(self, request, *args, **kwargs):
-        queryset = self.get_queryset()
-        learning_management_id = request.query_params.get('learning_management_id')
-        serializer = self.get_serializer(queryset, many=True, context={'request': request, 'learning_management_id': learning_management_id})
-        return Response(serializer.data)
\ No newline at end of file
+        return _board_columns(self.request.user.id).prefetch_related(
+            Prefetch(
+                'learning_resources',
+                queryset=optimize_queryset(learning_resources, LearningResourceSerializer),
+            )
+        )
@@ -1,11 +1,12 @@
 from rest_framework import generics, permissions
 from drf_spectacular.utils import extend_schema, extend_schema_view
-from apis.models import LearningManagementStatus, LearningManagement, LearningResource
+from apis.models import LearningManagementStatus, LearningManagement, LearningResource, LearningManagementSkill
 from apis.serializers import (
     LearningManagementStatusSerializer,
     LearningManagementSerializer,
     LearningResourceSerializer,
 )
+from apis.views.mixins import ConditionalListMixin
 
 
 @extend_schema_view(
@@ -77,9 +78,11 @@ class LearningManagementStatusRetrieveUpdateDestroyView(generics.RetrieveUpdateD
         tags=["Learning Management"]
     )
 )
-class LearningManagementListCreateView(generics.ListCreateAPIView):
+class LearningManagementListCreateView(ConditionalListMixin, generics.ListCreateAPIView):
     serializer_class = LearningManagementSerializer
     permission_classes = [permissions.IsAuthenticated]
+    # Plans are rendered with their status, resources and skills
+    user_version_models = [LearningManagement, LearningManagementStatus, LearningResource, LearningManagementSkill]
     
     def get_queryset(self):
         if self.request.user.is_staff:
@@ -0,0 +1,73 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from rest_framework.response import Response
+from apis.services import response_cache
+
+
+class ConditionalListMixin:
+    """
+    Answers If-None-Match / If-Modified-Since on a list endpoint with 304
+    before any query runs or anything is serialized.
+
+    The ETag derives from cache version stamps that apis/signals.py bumps
+    after each committed write: one per model in `version_models` (shared
+    tables) and, for `user_version_models`, one per owning user. Staff, who
+    list every user's rows, get the all-users stamp instead.
+    """
+    version_models = ()
+    user_version_models = ()
+
+    def get_version_scope(self):
+        user = self.request.user
+        if user.is_staff:
+            return response_cache.ALL_USERS_SCOPE
+        return response_cache.user_scope(user.pk)
+
+    def list(self, request, *args, **kwargs):
+        scope = self.get_version_scope()
+        # Per-user tables also carry a model-wide stamp, bumped when a bulk
+        # write can't tell whose rows changed
+        versions = response_cache.current_versions(
+            list(self.version_models)
+            + list(self.user_version_models)
+            + [(model, scope) for model in self.user_version_models]
+        )
+        etag = response_cache.build_etag(
+            versions, scope, request.get_full_path(), request.accepted_renderer.format
+        )
+        last_modified = max(modified for _, modified in versions)
+
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is None:
+            response = self.list_response(request, etag, *args, **kwargs)
+
+        response['ETag'] = etag
+        response['Last-Modified'] = http_date(last_modified)
+        # Authenticated data: clients may keep it but must revalidate
+        response['Cache-Control'] = 'private, no-cache'
+        return response
+
+    def list_response(self, request, etag, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+
+class CachedListResponseMixin(ConditionalListMixin):
+    """
+    ConditionalListMixin for read-mostly catalogs that look the same to every
+    user: the serialized list is also kept in the Django cache under its
+    ETag, so a changed client still gets the body without a database query.
+    """
+
+    def get_version_scope(self):
+        return response_cache.ALL_USERS_SCOPE
+
+    def list_response(self, request, etag, *args, **kwargs):
+        cache_key = f"response_cache:body:{etag}"
+        data = cache.get(cache_key)
+        if data is not None:
+            return Response(data)
+        response = super().list_response(request, etag, *args, **kwargs)
+        cache.set(cache_key, response.data, settings.RESPONSE_CACHE_TIMEOUT)
+        return response
@@ -1,7 +1,7 @@
 from rest_framework.response import Response
 from rest_framework import generics, permissions
 from drf_spectacular.utils import extend_schema, extend_schema_view
-from apis.models import CustomUser, Profile, UserSkills, NotificationPreference, UserEmailSetting
+from apis.models import CustomUser, Profile, UserSkills, NotificationPreference, UserEmailSetting, JobSkills
 from apis.serializers import (
     UserSerializer,
     UserCreateSerializer,
@@ -13,6 +13,7 @@ from apis.serializers import (
     UserEmailSettingSerializer
 )
 from apis.utils.common import ServiceError
+from apis.views.mixins import ConditionalListMixin
 
 
 @extend_schema_view(
@@ -151,9 +152,11 @@ class ProfileRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
         tags=["User Skills"]
     )
 )
-class UserSkillsListCreateView(generics.ListCreateAPIView):
+class UserSkillsListCreateView(ConditionalListMixin, generics.ListCreateAPIView):
     serializer_class = UserSkillsSerializer
     permission_classes = [permissions.IsAuthenticated]
+    version_models = [JobSkills]
+    user_version_models = [UserSkills]
     
     def get_queryset(self):
         # Users can only see their own skills unless they're admin
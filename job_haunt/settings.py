@@ -102,6 +102,40 @@ DATABASES = {
 }
 
 
+# Cache
+# CACHE_BACKEND picks the shared cache: locmem (per process; the default and
+# the stand-in for tests), file, redis (any Redis-compatible server; needs the
+# optional `redis` package) or dummy (caches nothing).
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+
+_CACHE_BACKENDS = {
+    'locmem': 'django.core.cache.backends.locmem.LocMemCache',
+    'file': 'django.core.cache.backends.filebased.FileBasedCache',
+    'redis': 'django.core.cache.backends.redis.RedisCache',
+    'dummy': 'django.core.cache.backends.dummy.DummyCache',
+}
+_CACHE_DEFAULT_LOCATIONS = {
+    'locmem': 'job-haunt',
+    'file': str(BASE_DIR / '.cache'),
+    'redis': 'redis://127.0.0.1:6379/0',
+    'dummy': '',
+}
+CACHE_BACKEND = os.getenv('CACHE_BACKEND', 'locmem')
+CACHES = {
+    "default": {
+        "BACKEND": _CACHE_BACKENDS[CACHE_BACKEND],
+        "LOCATION": os.getenv('CACHE_LOCATION') or _CACHE_DEFAULT_LOCATIONS[CACHE_BACKEND],
+        "KEY_PREFIX": os.getenv('CACHE_KEY_PREFIX', 'job_haunt'),
+        "TIMEOUT": int(os.getenv('CACHE_TIMEOUT', 300)),
+    }
+}
+
+# Cached responses of the read-mostly catalog endpoints (job skills, job
+# statuses). Writes invalidate them immediately; this bounds staleness for
+# writes that bypass model signals.
+RESPONSE_CACHE_TIMEOUT = int(os.getenv('RESPONSE_CACHE_TIMEOUT', 3600))
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -120,6 +154,42 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Password hashing
+# PASSWORD_HASHER picks the algorithm new passwords are hashed with. Hashes made
+# with another algorithm or older parameters are upgraded on the user's next
+# successful login. Leave a parameter unset to use Django's default, and run
+# `python manage.py benchmark_password_hashers` to size them for this machine.
+
+def _optional_int(name):
+    value = os.getenv(name)
+    return int(value) if value else None
+
+
+PASSWORD_HASHER = os.getenv('PASSWORD_HASHER', 'pbkdf2')
+_TUNABLE_PASSWORD_HASHERS = {
+    'pbkdf2': 'apis.hashers.TunablePBKDF2PasswordHasher',
+    'scrypt': 'apis.hashers.TunableScryptPasswordHasher',
+    'argon2': 'apis.hashers.TunableArgon2PasswordHasher',
+}
+PASSWORD_HASHERS = [_TUNABLE_PASSWORD_HASHERS[PASSWORD_HASHER]] + [
+    hasher for name, hasher in _TUNABLE_PASSWORD_HASHERS.items() if name != PASSWORD_HASHER
+] + ['django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher']
+
+PASSWORD_PBKDF2_ITERATIONS = _optional_int('PASSWORD_PBKDF2_ITERATIONS')
+PASSWORD_SCRYPT_WORK_FACTOR = _optional_int('PASSWORD_SCRYPT_WORK_FACTOR')
+PASSWORD_SCRYPT_BLOCK_SIZE = _optional_int('PASSWORD_SCRYPT_BLOCK_SIZE')
+PASSWORD_SCRYPT_PARALLELISM = _optional_int('PASSWORD_SCRYPT_PARALLELISM')
+PASSWORD_ARGON2_TIME_COST = _optional_int('PASSWORD_ARGON2_TIME_COST')
+PASSWORD_ARGON2_MEMORY_COST = _optional_int('PASSWORD_ARGON2_MEMORY_COST')
+PASSWORD_ARGON2_PARALLELISM = _optional_int('PASSWORD_ARGON2_PARALLELISM')
+
+# The async auth views hash in a dedicated process pool (apis/services/password_hashing.py).
+# Once PASSWORD_HASH_MAX_PENDING jobs are running or queued, further logins get a
+# 503 with Retry-After: PASSWORD_HASH_RETRY_AFTER instead of waiting in line.
+PASSWORD_HASH_WORKERS = int(os.getenv('PASSWORD_HASH_WORKERS', min(4, os.cpu_count() or 1)))
+PASSWORD_HASH_MAX_PENDING = int(os.getenv('PASSWORD_HASH_MAX_PENDING', PASSWORD_HASH_WORKERS * 8))
+PASSWORD_HASH_RETRY_AFTER = int(os.getenv('PASSWORD_HASH_RETRY_AFTER', 1))
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/5.2/topics/i18n/
@@ -181,7 +251,7 @@ LOGGING = {
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'apis.authentication.CachedJWTAuthentication',
     ),
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
     'EXCEPTION_HANDLER': 'apis.exceptions.custom_exception_handler',
@@ -230,4 +300,59 @@ SIMPLE_JWT = {
     'JTI_CLAIM': 'jti',
 }
 
-SECRET_OPERATION_TOKEN = os.getenv('SECRET_OPERATION_TOKEN')
\ No newline at end of file
+SECRET_OPERATION_TOKEN = os.getenv('SECRET_OPERATION_TOKEN')
+
+# CachedJWTAuthentication keeps token users in-process for this many seconds;
+# saves and deletes of a user invalidate it sooner (see apis/authentication.py)
+AUTH_USER_CACHE_TTL = int(os.getenv('AUTH_USER_CACHE_TTL', 30))
+AUTH_USER_CACHE_MAX_SIZE = int(os.getenv('AUTH_USER_CACHE_MAX_SIZE', 10000))
+
+# Usable reset tokens per user; requesting another retires the oldest
+PASSWORD_RESET_MAX_OUTSTANDING_TOKENS = int(os.getenv('PASSWORD_RESET_MAX_OUTSTANDING_TOKENS', 3))
+PASSWORD_RESET_PURGE_BATCH_SIZE = int(os.getenv('PASSWORD_RESET_PURGE_BATCH_SIZE', 1000))
+
+# Bloom filter in front of the refresh-token blacklist (apis/services/token_blacklist.py).
+# Unset enables it only when the default cache is shared between workers (not locmem).
+TOKEN_BLACKLIST_BLOOM_FILTER = {'True': True, 'False': False}.get(os.getenv('TOKEN_BLACKLIST_BLOOM_FILTER', ''))
+TOKEN_BLACKLIST_BLOOM_CAPACITY = int(os.getenv('TOKEN_BLACKLIST_BLOOM_CAPACITY', 1_000_000))
+TOKEN_BLACKLIST_BLOOM_ERROR_RATE = float(os.getenv('TOKEN_BLACKLIST_BLOOM_ERROR_RATE', 0.001))
+# How long a hole in the shared blacklist log may last before it counts as evicted
+TOKEN_BLACKLIST_BLOOM_GAP_SECONDS = int(os.getenv('TOKEN_BLACKLIST_BLOOM_GAP_SECONDS', 5))
+
+# Outbound email queue (drained by `python manage.py send_queued_emails`)
+# Set EMAIL_SMTP_BACKEND to django.core.mail.backends.locmem.EmailBackend or
+# django.core.mail.backends.console.EmailBackend to stand in for SMTP locally.
+EMAIL_SMTP_BACKEND = os.getenv('EMAIL_SMTP_BACKEND', 'django.core.mail.backends.smtp.EmailBackend')
+EMAIL_QUEUE_BATCH_SIZE = int(os.getenv('EMAIL_QUEUE_BATCH_SIZE', 50))
+EMAIL_QUEUE_MAX_ATTEMPTS = int(os.getenv('EMAIL_QUEUE_MAX_ATTEMPTS', 5))
+EMAIL_QUEUE_RETRY_BASE_SECONDS = int(os.getenv('EMAIL_QUEUE_RETRY_BASE_SECONDS', 30))
+EMAIL_QUEUE_LEASE_SECONDS = int(os.getenv('EMAIL_QUEUE_LEASE_SECONDS', 300))
+
+# Pooled SMTP connections are reused across sends and closed after this many idle seconds
+EMAIL_SMTP_POOL_IDLE_TIMEOUT = int(os.getenv('EMAIL_SMTP_POOL_IDLE_TIMEOUT', 60))
+EMAIL_SMTP_POOL_MAX_IDLE = int(os.getenv('EMAIL_SMTP_POOL_MAX_IDLE', 4))
+
+# Upper bound on how long a worker trusts its cached active EmailProviderSetting
+EMAIL_PROVIDER_CACHE_TTL = int(os.getenv('EMAIL_PROVIDER_CACHE_TTL', 300))
+
+# Rows fetched per query when streaming the admin database export
+DATA_EXPORT_CHUNK_SIZE = int(os.getenv('DATA_EXPORT_CHUNK_SIZE', 2000))
+# Rows per bulk upsert (and per committed transaction) in the admin JSON import
+DATA_IMPORT_BATCH_SIZE = int(os.getenv('DATA_IMPORT_BATCH_SIZE', 1000))
+# False commits every batch separately (each checking its own foreign keys) instead
+# of importing in one transaction
+DATA_IMPORT_ATOMIC = os.getenv('DATA_IMPORT_ATOMIC', 'True') == 'True'
+# Admin activity rollups (refreshed by `python manage.py refresh_activity_rollups`).
+# Each refresh recomputes buckets from this many hours before the previous run, to pick up late writes.
+ACTIVITY_ROLLUP_LAG_HOURS = int(os.getenv('ACTIVITY_ROLLUP_LAG_HOURS', 24))
+# Longest range the admin activity endpoint serves at hourly granularity
+ACTIVITY_ROLLUP_MAX_HOURLY_DAYS = int(os.getenv('ACTIVITY_ROLLUP_MAX_HOURLY_DAYS', 14))
+
+# Job application search (apis/services/job_search.py). Unset picks SQLite FTS5 when the
+# database supports it and unindexed icontains scans otherwise; or give a backend's dotted path.
+JOB_SEARCH_BACKEND = os.getenv('JOB_SEARCH_BACKEND', '')
+
+# Bulk job application endpoints (apis/services/job_bulk.py)
+JOB_APPLICATION_BULK_MAX_ROWS = int(os.getenv('JOB_APPLICATION_BULK_MAX_ROWS', 10000))
+# Rows per INSERT/UPDATE statement
+JOB_APPLICATION_BULK_BATCH_SIZE = int(os.getenv('JOB_APPLICATION_BULK_BATCH_SIZE', 1000))